@@ -1,3 +1,3 @@
 from src.query_plan_to_sql import *
 
-__all__ = ['QueryPlanToSQL']
+__all__ = ['QueryPlanToSQL', 'Translator', 'TranslationResult', 'translate_many']
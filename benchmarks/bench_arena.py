@@ -0,0 +1,55 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.extended.arena import ArenaBuilder, ArenaSemanticVisitor, ArenaSQLEmitter
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.utils.diagnostics import Diagnostics
+
+
+def or_chain_plan(terms: int) -> str:
+    return "filter: " + " or ".join("shot = %d and offset in range(%d, %d incl)" % (i, i, i + 100)
+                                    for i in range(terms)) + ";"
+
+
+def measure(parser, semantic_visitor, emitter, tokens) -> tuple[float, float, float, str]:
+    """Memory held by the parsed tree (MiB), parse time and analysis plus emission time."""
+    start = time.perf_counter()
+    parser.parse(iter(tokens))
+    parse_time = time.perf_counter() - start
+    parser.reset()
+
+    # parse again while tracing allocations, which is too slow to time
+    gc.collect()
+    tracemalloc.start()
+    ast = parser.parse(iter(tokens))
+    parser.reset()
+    memory = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    semantic_visitor.visit(ast)
+    sql = emitter.emit(ast)
+    return memory, parse_time, time.perf_counter() - start, sql
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the object AST with the array-backed arena")
+    parser.add_argument("--terms", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    object_parser = QPParserExtended()
+    arena_parser = QPParserExtended(builder=ArenaBuilder())
+    print("%-8s %-8s %12s %12s %14s" % ("terms", "ast", "tree [MiB]", "parse [s]", "analysis [s]"))
+    for terms in args.terms:
+        tokens = list(object_parser.lex.tokenize(or_chain_plan(terms)))
+        results = {
+            "objects": measure(object_parser, SemanticVisitorExtended(Diagnostics()), SQLEmitterExtended(), tokens),
+            "arena": measure(arena_parser, ArenaSemanticVisitor(Diagnostics()), ArenaSQLEmitter(), tokens),
+        }
+        assert results["objects"][3] == results["arena"][3]
+        for name, (memory, parse_time, analysis_time, _) in results.items():
+            print("%-8d %-8s %12.1f %12.4f %14.4f" % (terms, name, memory, parse_time, analysis_time))
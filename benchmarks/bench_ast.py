@@ -0,0 +1,49 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.utils.diagnostics import Diagnostics
+
+
+def or_chain_plan(terms: int) -> str:
+    return "filter: " + " or ".join("shot = %d and offset in range(%d, %d incl)" % (i, i, i + 100)
+                                    for i in range(terms)) + ";"
+
+
+def count_nodes(ast) -> int:
+    count, stack = 0, [ast]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(child for _, child in node.children())
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory held by the AST of large plans and time to analyse it")
+    parser.add_argument("--terms", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    qp_parser = QPParserExtended()
+    print("%-8s %10s %12s %12s %14s" % ("terms", "nodes", "AST [MiB]", "bytes/node", "analysis [s]"))
+    for terms in args.terms:
+        tokens = list(qp_parser.lex.tokenize(or_chain_plan(terms)))
+        gc.collect()
+        tracemalloc.start()
+        ast = qp_parser.parse(iter(tokens))
+        qp_parser.reset()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        SemanticVisitorExtended(Diagnostics()).visit(ast)
+        SQLEmitterExtended().emit(ast)
+        elapsed = time.perf_counter() - start
+
+        nodes = count_nodes(ast)
+        print("%-8d %10d %12.1f %12.1f %14.4f" % (terms, nodes, memory / 2 ** 20, memory / nodes, elapsed))
+        del ast
@@ -0,0 +1,30 @@
+import argparse
+import os
+import time
+
+from src.batch import translate_many
+
+QUERY_PLAN = """
+filter:
+   ( elev in range(10 incl, 100) and
+    coord_x = %d ) or
+   ( elev in range(100 , 1000 incl) and
+    coord_x > 110 ) ;
+
+order: a desc, b, c desc ;
+"""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=20000, help="Number of plans to translate")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    args = parser.parse_args()
+
+    plans = [QUERY_PLAN % i for i in range(args.number)]
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        results = translate_many(plans, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert all(result.sql for result in results)
+        print("%3d worker(s) %8.0f plans/s" % (workers, len(plans) / elapsed))
@@ -0,0 +1,50 @@
+import argparse
+import time
+
+from src.extended.lexer import QPLexerExtended
+from src.extended.parser import QPParserExtended
+
+
+class RfindLexer(QPLexerExtended):
+    """Column lookup as it was before the newline index: a backwards scan per token."""
+
+    def find_tok_column(self, token):
+        last_cr = self.text.rfind('\n', 0, token.index)
+        if last_cr < 0:
+            last_cr = 0
+        return token.index - last_cr
+
+
+def single_line_plan(size: int) -> str:
+    """Machine-generated filter of OR'd ranges on one line, about `size` bytes long."""
+    terms = []
+    length = 0
+    while length < size:
+        term = "shot in range(%d incl, %d)" % (len(terms) * 10, len(terms) * 10 + 5)
+        terms.append(term)
+        length += len(term) + 4
+    return "filter: " + " or ".join(terms) + ";"
+
+
+def parse_time(lexer_class, text: str) -> float:
+    lexer = lexer_class()
+    parser = QPParserExtended(lexer)
+    start = time.perf_counter()
+    parser.parse(lexer.tokenize(text))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64 << 10, 256 << 10, 1 << 20, 4 << 20],
+                        help="Plan sizes in bytes")
+    parser.add_argument("--rfind-limit", type=int, default=1 << 20,
+                        help="Largest size also measured with the quadratic rfind lookup")
+    args = parser.parse_args()
+
+    print("%10s %12s %12s" % ("bytes", "index [s]", "rfind [s]"))
+    for size in args.sizes:
+        text = single_line_plan(size)
+        indexed = parse_time(QPLexerExtended, text)
+        rfind = "%12.3f" % parse_time(RfindLexer, text) if size <= args.rfind_limit else "%12s" % "-"
+        print("%10d %12.3f %s" % (len(text), indexed, rfind))
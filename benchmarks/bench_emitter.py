@@ -0,0 +1,64 @@
+import argparse
+import time
+import tracemalloc
+
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.translate import TranslationVisitorExtended
+from src.utils.diagnostics import Diagnostics
+
+
+def or_chain_plan(terms: int) -> str:
+    return "filter: " + " or ".join("shot = %d and offset in range(%d, %d incl)" % (i, i, i + 100)
+                                    for i in range(terms)) + "; order: shot desc, offset;"
+
+
+def translate_visitor(ast) -> str:
+    TranslationVisitorExtended().visit(ast)
+    return ast.text
+
+
+def translate_emitter(ast) -> str:
+    return SQLEmitterExtended().emit(ast)
+
+
+def measure(func, plan: str) -> tuple[float, float, str]:
+    """Time and peak traced memory (MiB) of translating a freshly parsed and checked plan."""
+    results = []
+    for trace in (False, True):
+        ast = QPParserExtended().parse_text(plan)
+        SemanticVisitorExtended(Diagnostics()).visit(ast)
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        sql = func(ast)
+        elapsed = time.perf_counter() - start
+        if trace:
+            results.append(tracemalloc.get_traced_memory()[1] / 2 ** 20)
+            tracemalloc.stop()
+        else:
+            results.append(elapsed)
+        del ast
+    return results[0], results[1], sql
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the translation visitor with the streaming SQL emitter")
+    parser.add_argument("--terms", type=int, nargs="+", default=[1000, 3000, 10000, 30000])
+    parser.add_argument("--visitor-max", type=int, default=3000,
+                        help="Largest plan translated with the visitor, whose cost grows quadratically")
+    args = parser.parse_args()
+
+    print("%-8s %12s %14s %14s %14s %14s" % ("terms", "sql bytes", "visitor [s]", "visitor [MiB]",
+                                             "emitter [s]", "emitter [MiB]"))
+    for terms in args.terms:
+        plan = or_chain_plan(terms)
+        emitter_time, emitter_memory, sql = measure(translate_emitter, plan)
+        if terms <= args.visitor_max:
+            visitor_time, visitor_memory, expected = measure(translate_visitor, plan)
+            assert sql == expected
+            visitor = "%14.4f %14.1f" % (visitor_time, visitor_memory)
+        else:
+            visitor = "%14s %14s" % ("-", "-")
+        print("%-8d %12d %s %14.4f %14.1f" % (terms, len(sql), visitor, emitter_time, emitter_memory))
@@ -0,0 +1,56 @@
+import argparse
+import sqlite3
+import time
+
+import numpy as np
+
+from src.extended.evaluator import MaskCompilerExtended, OrderCompilerExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+
+PLAN = "filter: elev in range(10 incl, 100) and coord_x > 110; order: coord_x desc, elev;"
+
+
+def sqlite_selection(columns: dict, sql: str) -> tuple[float, float, list[int]]:
+    """Time to load the columns into an in-memory table, time to run the query and the selected traces in order."""
+    start = time.perf_counter()
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (trace INTEGER, %s)" % ", ".join("%s INTEGER" % name for name in columns))
+    rows = zip(range(len(columns["elev"])), *(column.tolist() for column in columns.values()))
+    connection.executemany("INSERT INTO table1 VALUES (%s)" % ", ".join("?" * (len(columns) + 1)), rows)
+    load_time = time.perf_counter() - start
+    start = time.perf_counter()
+    traces = [row[0] for row in connection.execute(sql)]
+    return load_time, time.perf_counter() - start, traces
+
+
+def numpy_selection(columns: dict, text: str) -> tuple[float, list[int]]:
+    """Time to analyse, compile and evaluate the plan and the selected traces in order."""
+    start = time.perf_counter()
+    ast = QPParserExtended().parse_text(text)
+    SemanticVisitorExtended(Diagnostics()).visit(ast)
+    mask = MaskCompilerExtended().compile(ast)(columns)
+    traces = OrderCompilerExtended().compile(ast)(columns, mask)
+    return time.perf_counter() - start, traces.tolist()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the NumPy filter and order evaluators with running the SQL "
+                                                 "on sqlite")
+    parser.add_argument("--traces", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    # the trace index makes the SQL order total, the NumPy sort is stable
+    sql = Translator(printer=None, key_columns=("trace",)).translate(PLAN[:-1] + ", trace;")
+    rng = np.random.default_rng(0)
+    print("%-10s %12s %12s %12s %9s" % ("traces", "load [s]", "sqlite [s]", "numpy [s]", "speedup"))
+    for traces in args.traces:
+        columns = {"elev": rng.integers(-50, 200, traces, dtype=np.int32),
+                   "coord_x": rng.integers(0, 500, traces, dtype=np.int32)}
+        load_time, query_time, expected = sqlite_selection(columns, sql)
+        numpy_time, selected = numpy_selection(columns, PLAN)
+        assert selected == expected
+        print("%-10d %12.4f %12.4f %12.4f %8.0fx" % (traces, load_time, query_time, numpy_time,
+                                                    (load_time + query_time) / numpy_time))
@@ -0,0 +1,58 @@
+import argparse
+import time
+
+from src.extended.lexer import QPLexerExtended
+from src.utils.diagnostics import Diagnostics
+
+
+class RegexLexer(QPLexerExtended):
+    """Comment and string rules as they were before the hand-written scanning."""
+
+    _tables_module = None
+    tokens = QPLexerExtended.tokens
+
+    @_(r'/\-((\-[^/])|([^(\-)]))*\-/', r'//.*')
+    def comment(self, t):
+        t.lineno += t.value.count("\n")
+
+    @_('/-(.|\n)*')
+    def block_comment(self, t):
+        msg = "Unterminated comment"
+        self._error(msg, t, self.UNTERMINATED_COMMENT)
+
+    @_(r'\"(\\.|[^"\\])*\"')
+    def STRING_LITERAL(self, t):
+        t.value = t.value.replace('"', "")
+        return t
+
+
+def pathological_inputs(size: int) -> dict[str, str]:
+    body = "shot = 10 and offset > 2 or " * (size // 28)
+    return {
+        "long comment": "/- %s -/ filter: a = 1;" % body,
+        "unterminated comment": "filter: a = 1; /- %s" % body,
+        "dashes comment": "/-%s x -/" % ("-" * size),
+        "long string": 'filter: a = "%s";' % body,
+        "escaped string": 'filter: a = "%s";' % ("\\\\" * (size // 2)),
+        "unterminated string": 'filter: a = "%s' % body,
+    }
+
+
+def tokenize_time(lexer_class, text: str) -> float:
+    lexer = lexer_class(Diagnostics())
+    start = time.perf_counter()
+    for _ in lexer.tokenize(text):
+        pass
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1 << 16, 1 << 18, 1 << 20], help="Input sizes in bytes")
+    args = parser.parse_args()
+
+    print("%-22s %10s %12s %12s" % ("input", "bytes", "scan [s]", "regex [s]"))
+    for size in args.sizes:
+        for name, text in pathological_inputs(size).items():
+            print("%-22s %10d %12.4f %12.4f" % (name, len(text), tokenize_time(QPLexerExtended, text),
+                                                 tokenize_time(RegexLexer, text)))
@@ -0,0 +1,38 @@
+import argparse
+import time
+
+from src.extended.lexer import QPLexerExtended
+from src.extended.scanner import QPScannerExtended
+
+QUERY_PLAN = """
+/- generated by the acquisition scheduler -/
+filter:
+   ( elev in range(10 incl, 100) and
+    coord_x = 107.5 ) or
+   ( elev in range(-100 , 1000 incl) and
+    coord_x > 110 and name != "line \\"A\\"" ) or
+    (coord_z != 11) ;  // keep everything else
+
+order: inline, crossline desc, offset ;
+"""
+
+
+def tokens_per_second(lexer_class, text: str, repeat: int) -> float:
+    lexer = lexer_class()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in lexer.tokenize(text))
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--copies", type=int, default=2000, help="Copies of the sample plan in the input")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of measurements")
+    args = parser.parse_args()
+
+    text = QUERY_PLAN * args.copies
+    for name, lexer_class in (("sly", QPLexerExtended), ("scanner", QPScannerExtended)):
+        print("%-8s %12.0f tokens/s" % (name, tokens_per_second(lexer_class, text, args.repeat)))
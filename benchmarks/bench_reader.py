@@ -0,0 +1,60 @@
+import argparse
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from src.segy.headers import HeaderRegistry
+from src.segy.reader import SegyReader, write_segy
+
+FIELDS = ("fldr", "tracf", "cdp", "offset", "cdp_x", "cdp_y", "iline", "xline")
+
+# NumPy type code -> struct format of a header field
+STRUCT_FORMATS = {"i1": "b", "u1": "B", "i2": "h", "u2": "H", "i4": "i", "u4": "I", "i8": "q", "u8": "Q"}
+
+
+def per_trace_columns(path, fields, data_offset: int, stride: int) -> dict[str, list]:
+    """Header columns built one trace at a time, as a loader iterating over traces does."""
+    registry = HeaderRegistry()
+    unpackers = [(name, struct.Struct(">" + STRUCT_FORMATS[registry[name].dtype[1:]]), registry[name].offset)
+                 for name in fields]
+    columns = {name: [] for name in fields}
+    with open(path, "rb") as f:
+        f.seek(data_offset)
+        while True:
+            header = f.read(stride)
+            if len(header) < stride:
+                break
+            for name, unpacker, offset in unpackers:
+                columns[name].append(unpacker.unpack_from(header, offset)[0])
+    return columns
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-trace header reads with the memory-mapped columnar reader")
+    parser.add_argument("--traces", type=int, nargs="+", default=[10000, 100000, 300000])
+    parser.add_argument("--samples", type=int, default=250, help="Samples per trace, 4 bytes each")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print("%-10s %10s %14s %14s %9s" % ("traces", "file [MiB]", "per trace [s]", "columnar [s]", "speedup"))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.sgy")
+        for traces in args.traces:
+            write_segy(path, {name: rng.integers(0, 10000, traces) for name in FIELDS}, args.samples)
+
+            start = time.perf_counter()
+            with SegyReader(path) as reader:
+                columns = reader.columns(FIELDS)
+                data_offset, stride = reader.data_offset, reader.trace_stride
+            columnar_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            expected = per_trace_columns(path, FIELDS, data_offset, stride)
+            per_trace_time = time.perf_counter() - start
+
+            assert all(columns[name].tolist() == expected[name] for name in FIELDS)
+            print("%-10d %10.1f %14.4f %14.4f %8.0fx" % (traces, os.path.getsize(path) / 2 ** 20, per_trace_time,
+                                                        columnar_time, per_trace_time / columnar_time))
@@ -0,0 +1,43 @@
+import argparse
+import time
+
+import numpy as np
+
+from src.extended.evaluator import CompiledOrder, OrderCompilerExtended
+from src.extended.parser import QPParserExtended
+from src.segy.headers import HeaderRegistry
+
+PLAN = "order: inline, crossline, offset desc;"
+
+
+def survey_columns(traces: int, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Header columns of a shuffled 3D survey: a few hundred lines of a few hundred traces with many offsets."""
+    return {"inline": rng.integers(1000, 1400, traces, dtype=np.int32),
+            "crossline": rng.integers(2000, 2600, traces, dtype=np.int32),
+            "offset": rng.integers(0, 6000, traces, dtype=np.int32)}
+
+
+def sort_time(order: CompiledOrder, columns: dict, **kwargs) -> tuple[float, np.ndarray]:
+    start = time.perf_counter()
+    permutation = order(columns, **kwargs)
+    return time.perf_counter() - start, permutation
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare packed composite sort keys with the lexicographic sort")
+    parser.add_argument("--traces", type=int, nargs="+", default=[100000, 1000000, 10000000])
+    args = parser.parse_args()
+
+    keys = OrderCompilerExtended().compile(QPParserExtended().parse_text(PLAN)).keys
+    registry = HeaderRegistry()
+    limits = {name: registry[name].limits for name, _, _ in keys}
+    rng = np.random.default_rng(0)
+    print("%-10s %16s %16s %16s" % ("traces", "lexsort [s]", "statistics [s]", "field widths [s]"))
+    for traces in args.traces:
+        columns = survey_columns(traces, rng)
+        lexicographic_time, expected = sort_time(CompiledOrder(keys, packed=False), columns)
+        # the ranges found by scanning the columns fit in one 64-bit word, the field widths need two
+        statistics_time, packed = sort_time(CompiledOrder(keys), columns)
+        widths_time, widths_packed = sort_time(CompiledOrder(keys), columns, limits=limits)
+        assert np.array_equal(packed, expected) and np.array_equal(widths_packed, expected)
+        print("%-10d %16.4f %16.4f %16.4f" % (traces, lexicographic_time, statistics_time, widths_time))
@@ -0,0 +1,38 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Import the translator with the shipped tables, or forcing SLY to build them from the grammar
+SNIPPETS = {
+    "precomputed": "import src.query_plan_to_sql",
+    "build": "import src.utils.tables as t\n"
+             "t._load_tables = lambda *args: None\n"
+             "t._write_tables = lambda *args: None\n"
+             "import src.query_plan_to_sql",
+}
+
+
+def measure(snippet: str, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", snippet], check=True, cwd=ROOT)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=20, help="Interpreter launches per mode")
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("pass", args.repeat))
+    print("%-12s %8.1f ms" % ("interpreter", baseline * 1e3))
+    for name, snippet in SNIPPETS.items():
+        median = statistics.median(measure(snippet, args.repeat))
+        print("%-12s %8.1f ms (+%.1f ms)" % (name, median * 1e3, (median - baseline) * 1e3))
@@ -0,0 +1,48 @@
+import argparse
+import timeit
+
+from src.extended.lexer import QPLexerExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.translate import TranslationVisitorExtended
+from src.cache import TranslationCache
+from src.translator import Translator
+
+QUERY_PLAN = """
+filter:
+   ( elev in range(10 incl, 100) and
+    coord_x = 107.5 ) or
+   ( elev in range(100 , 1000 incl) and
+    coord_x > 110 ) or
+    (coord_z != 11) ;
+
+order: a desc, b, c desc ;
+"""
+
+
+def translate_fresh(query_plan: str):
+    """Per-call construction, as QueryPlanToSQL.translate used to do."""
+    lexer = QPLexerExtended()
+    parser = QPParserExtended(lexer)
+    semantic_visitor = SemanticVisitorExtended()
+    translation_visitor = TranslationVisitorExtended()
+    ast = parser.parse(lexer.tokenize(query_plan))
+    semantic_visitor.visit(ast)
+    translation_visitor.visit(ast)
+    return ast.text
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=5000, help="Translations per measurement")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of measurements")
+    args = parser.parse_args()
+
+    translator = Translator()
+    cached_translator = Translator(cache=TranslationCache())
+    assert translator.translate(QUERY_PLAN) == translate_fresh(QUERY_PLAN) == cached_translator.translate(QUERY_PLAN)
+
+    for name, func in (("fresh", translate_fresh), ("translator", translator.translate),
+                       ("cached", cached_translator.translate)):
+        best = min(timeit.repeat(lambda: func(QUERY_PLAN), number=args.number, repeat=args.repeat))
+        print("%-12s %8.2f us/plan" % (name, best / args.number * 1e6))
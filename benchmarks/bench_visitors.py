@@ -0,0 +1,60 @@
+import argparse
+import sys
+import time
+
+from src.extended.qp_ast import ID, BinaryOp, Constant, Filter, Program
+from src.extended.semantic import SemanticVisitorExtended
+from src.utils.diagnostics import Diagnostics
+from src.utils.node_visitor import IterativeNodeVisitor, NodeVisitor
+
+
+def or_chain(terms: int) -> Program:
+    """AST of ``filter: shot = 0 or shot = 1 or ...;``, left-deep as the parser builds it."""
+    expression = BinaryOp("=", ID("shot"), Constant("number", "0"))
+    for i in range(1, terms):
+        expression = BinaryOp("or", expression, BinaryOp("=", ID("shot"), Constant("number", str(i))))
+    return Program([Filter(expression)])
+
+
+class RecursiveCounter(NodeVisitor):
+    """Counts nodes recursing once per level, as the visitors used to."""
+
+    def __init__(self):
+        self.count = 0
+
+    def generic_visit(self, node):
+        self.count += 1
+        super().generic_visit(node)
+
+
+class IterativeCounter(IterativeNodeVisitor):
+    def __init__(self):
+        self.count = 0
+
+    def generic_enter(self, node):
+        self.count += 1
+        return super().generic_enter(node)
+
+
+def measure(visitor, ast) -> str:
+    start = time.perf_counter()
+    try:
+        visitor.visit(ast)
+    except RecursionError:
+        return "%10s" % "recursion"
+    return "%10.4f" % (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Walk left-deep OR chains with the recursive and iterative visitors")
+    parser.add_argument("--terms", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print("recursion limit: %d" % sys.getrecursionlimit())
+    print("%-8s %10s %10s %10s" % ("terms", "recursive", "iterative", "semantic"))
+    for terms in args.terms:
+        ast = or_chain(terms)
+        semantic_visitor = SemanticVisitorExtended(Diagnostics())
+        print("%-8d %s %s %s" % (terms, measure(RecursiveCounter(), ast), measure(IterativeCounter(), ast),
+                                 measure(semantic_visitor, ast)))
+        assert not semantic_visitor.has_error()
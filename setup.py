@@ -5,6 +5,7 @@ setup(
     version="0.1",
     python_requires=">=3.9",
     install_requires=["pytest", "pathlib", "timeout_decorator", "pytest-timeout"],
+    extras_require={"segy": ["numpy"]},
     packages=(
         find_packages() +
         find_packages(where="./lib/sly")
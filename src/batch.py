@@ -0,0 +1,148 @@
+import json
+import os
+from collections import namedtuple
+from typing import Iterable, Sequence, TextIO
+
+from src.translator import (AST_BACKENDS, LEXER_BACKENDS, OPTIMIZED_AST_BACKENDS, PIPELINES, SARGABLE_AST_BACKENDS,
+                            Translator)
+from src.segy.headers import HeaderRegistry
+from src.utils.diagnostics import Diagnostic
+from src.utils.parameters import PARAMSTYLES
+
+TranslationResult = namedtuple("TranslationResult", ["sql", "errors"])
+TranslationResult.__doc__ = """Outcome of translating one plan: the SQL (None on failure) and the reported diagnostics."""
+
+# Code of the diagnostic reported when a stage raises instead of reporting an error
+INTERNAL_ERROR = 1
+# Code of the diagnostic reported for an NDJSON line that is not a valid record
+INVALID_RECORD = 1
+
+# Translator owned by the current worker process, built once by the pool initializer
+_worker_translator: Translator = None
+
+
+def _init_worker(version: int, lexer_backend: str, ast_backend: str, paramstyle: str | None, optimize: bool,
+                 value_table_threshold: int | None, sargable: bool, key_columns: Sequence[str] | None,
+                 registry: HeaderRegistry | None):
+    global _worker_translator
+    _worker_translator = Translator(version, lexer_backend=lexer_backend, printer=None, ast_backend=ast_backend,
+                                    paramstyle=paramstyle, optimize=optimize,
+                                    value_table_threshold=value_table_threshold, sargable=sargable,
+                                    key_columns=key_columns, registry=registry)
+
+
+def _translate_one(translator: Translator, query_plan: str) -> TranslationResult:
+    try:
+        sql = translator.translate(query_plan)
+    except Exception as e:
+        return TranslationResult(None, translator.diagnostics + [Diagnostic("internal", INTERNAL_ERROR, repr(e))])
+    return TranslationResult(sql, translator.diagnostics)
+
+
+def _translate_in_worker(query_plan: str) -> TranslationResult:
+    return _translate_one(_worker_translator, query_plan)
+
+
+def translate_many(plans: Iterable[str], version: int = 2, workers: int = None,
+                   chunksize: int = None, lexer_backend: str = "sly",
+                   ast_backend: str = "objects", paramstyle: str = None,
+                   optimize: bool = False, value_table_threshold: int = None,
+                   sargable: bool = False, key_columns: Sequence[str] = None,
+                   registry: HeaderRegistry = None) -> list[TranslationResult]:
+    """
+    Translate many query plans, in parallel over a pool of worker processes.
+
+    Each worker keeps its own warm Translator, plans are sent to the workers in
+    chunks and results are returned in input order. Nothing is printed: the errors
+    of each plan are returned as `Diagnostic` objects in its result.
+
+    :param plans: query plans to translate.
+    :param version: Query Plan version, 1 (simple) or 2 (extended).
+    :param workers: number of worker processes, defaults to the CPU count. With 1 the plans are
+        translated in the calling process.
+    :param chunksize: number of plans sent to a worker at once, defaults to a few chunks per worker.
+    :param lexer_backend: lexer implementation used by the workers, see `Translator`.
+    :param ast_backend: AST representation used by the workers, see `Translator`.
+    :param paramstyle: placeholder style of parameterized translations, see `Translator`.
+    :param optimize: simplify the filters before translating them, see `Translator`.
+    :param value_table_threshold: IN lists with more values are emitted as a table of values, see `Translator`.
+    :param sargable: write predicates an index can answer, see `Translator`.
+    :param key_columns: select these columns and the identifiers of each plan instead of every column,
+        see `Translator`.
+    :param registry: trace header fields the identifiers must name, see `Translator`.
+    """
+    if version not in PIPELINES:
+        raise ValueError("Version not supported: %s" % version)
+    if lexer_backend not in LEXER_BACKENDS[version]:
+        raise ValueError("Lexer backend %s not supported by version %s" % (lexer_backend, version))
+    if ast_backend not in AST_BACKENDS[version]:
+        raise ValueError("AST backend %s not supported by version %s" % (ast_backend, version))
+    if paramstyle is not None and paramstyle not in PARAMSTYLES:
+        raise ValueError("Parameter style not supported: %s" % paramstyle)
+    if optimize and ast_backend not in OPTIMIZED_AST_BACKENDS[version]:
+        raise ValueError("Optimizer not supported by version %s with AST backend %s" % (version, ast_backend))
+    if sargable and ast_backend not in SARGABLE_AST_BACKENDS[version]:
+        raise ValueError("Sargable SQL not supported by version %s with AST backend %s" % (version, ast_backend))
+    plans = list(plans)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(plans))
+
+    if workers <= 1:
+        translator = Translator(version, lexer_backend=lexer_backend, printer=None, ast_backend=ast_backend,
+                                paramstyle=paramstyle, optimize=optimize, value_table_threshold=value_table_threshold,
+                                sargable=sargable, key_columns=key_columns, registry=registry)
+        return [_translate_one(translator, plan) for plan in plans]
+
+    # multiprocessing is only worth importing when a pool is actually needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunksize is None:
+        chunksize = max(1, len(plans) // (workers * 4))
+    initargs = (version, lexer_backend, ast_backend, paramstyle, optimize, value_table_threshold, sargable,
+                key_columns, registry)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as executor:
+        return list(executor.map(_translate_in_worker, plans, chunksize=chunksize))
+
+
+def translate_ndjson(in_file: TextIO, out_file: TextIO, translator: Translator, flush_every: int = 1000) -> int:
+    """
+    Translate a stream of newline-delimited JSON records with a single warm translator.
+
+    Every input line is an object with an "id" and a "plan"; for each one a line with the
+    "id", the "sql" (null on failure) and the reported "errors" is written as soon as it is
+    translated, so memory use does not depend on the size of the stream. Each error is an
+    object with the "stage", "code", "message", "line" and "column" of the diagnostic.
+    Parameterized translators also write the "parameters" and the "shape" of the SQL.
+
+    :param in_file: text stream with one JSON record per line, blank lines are skipped.
+    :param out_file: text stream that receives one JSON result per record.
+    :param translator: translator used for every record.
+    :param flush_every: number of records between flushes of the output stream.
+    :return: number of records written.
+    """
+    count = 0
+    for lineno, line in enumerate(in_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            record_id, query_plan = record.get("id"), record["plan"]
+            if not isinstance(query_plan, str):
+                raise TypeError("plan must be a string")
+        except KeyError as e:
+            error = Diagnostic("input", INVALID_RECORD, "Invalid record at line %d: missing key %s" % (lineno, e))
+            result = {"id": None, "sql": None, "errors": [error.to_dict()]}
+        except (ValueError, TypeError, AttributeError) as e:
+            error = Diagnostic("input", INVALID_RECORD, "Invalid record at line %d: %s" % (lineno, e))
+            result = {"id": None, "sql": None, "errors": [error.to_dict()]}
+        else:
+            sql, errors = _translate_one(translator, query_plan)
+            result = {"id": record_id, "sql": sql, "errors": [error.to_dict() for error in errors]}
+            if translator.paramstyle is not None:
+                result["sql"], result["parameters"], result["shape"] = sql if sql is not None else (None, None, None)
+        out_file.write(json.dumps(result) + "\n")
+        count += 1
+        if count % flush_every == 0:
+            out_file.flush()
+    out_file.flush()
+    return count
@@ -0,0 +1,84 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "size", "max_entries", "max_size"])
+
+
+def fingerprint(tokens, keywords=(), salt: str = "") -> bytes:
+    """
+    Compute a canonical fingerprint of a token stream.
+
+    Whitespace and comments never reach the token stream, and keywords are
+    reduced to their type, so plans that only differ in layout, comments or
+    keyword case share the same fingerprint.
+
+    :param tokens: iterable of SLY tokens.
+    :param keywords: token types whose value should be ignored.
+    :param salt: extra text mixed into the digest (e.g. the language version).
+    """
+    digest = hashlib.blake2b(salt.encode(), digest_size=16)
+    for token in tokens:
+        if token.type in keywords:
+            digest.update(b"%s\x00" % token.type.encode())
+        else:
+            digest.update(b"%s\x01%s\x00" % (token.type.encode(), repr(token.value).encode()))
+    return digest.digest()
+
+
+class TranslationCache:
+    """
+    Thread-safe LRU cache of translated query plans.
+
+    The cache is bounded both by the number of entries and by the approximate
+    memory held by keys and values; the least recently used entries are
+    evicted when either limit is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_size: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._entries: OrderedDict[bytes, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: bytes) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, value: str):
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        if size > self.max_size or self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self._size,
+                         self.max_entries, self.max_size)
@@ -0,0 +1,344 @@
+import sys
+import argparse
+import pathlib
+from array import array
+from typing import Iterator, TextIO
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.parser import QPParserExtended
+from src.extended.qp_ast import *
+from src.extended.semantic import SemanticVisitorExtended
+from src.utils.coord import Coord
+from src.utils.parameters import ParameterizedEmitter
+from src.utils.projection import select_list
+from src.utils.qp_types import *
+
+# Node kinds
+PROGRAM, FILTER, ORDER, BINARY_OP, UNARY_OP, RANGE, ID_NODE, CONSTANT = range(8)
+
+# Operators, stored by their position in this tuple
+OPERATORS = ("<", "<=", ">", ">=", "=", "!=", "and", "or", "not", "+", "-")
+OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+
+# Constant types, stored by their position in this tuple
+CONSTANT_TYPES = ("number", "string", "char", "bool")
+CONSTANT_TYPE_CODES = {name: code for code, name in enumerate(CONSTANT_TYPES)}
+
+# Range flags, stored in the operator column of range nodes
+INCLUDE_LOWER = 1
+INCLUDE_UPPER = 2
+
+# Types assigned by the semantic analysis, 0 is "not analysed"
+TYPES = (None, NumberType, CharType, BooleanType, StringType)
+TYPE_CODES = {type: code for code, type in enumerate(TYPES) if type is not None}
+
+
+class Arena:
+    """
+    AST of an extended Query Plan stored in parallel arrays, one entry per node.
+
+    Each node is a position in the arrays:
+    - kind: PROGRAM, FILTER, ORDER, BINARY_OP, UNARY_OP, RANGE, ID_NODE or CONSTANT
+    - op: operator code, constant type code or range flags
+    - left, right: children (operands, the expression of filters and unary
+      operators, the bounds of ranges), -1 when absent
+    - value: index in ``values`` of the name of identifiers, the value of
+      constants, the steps of programs and the identifiers and directions of
+      orders; the identifier of ranges
+    - line, column: code position, line 0 when the node has none and column -1
+      when it has no column
+    - type: type code filled in by the semantic analysis
+
+    Nodes are appended by the parser actions, so every child comes before its
+    parent and the array order is a post-order traversal of the tree.
+    """
+
+    def __init__(self):
+        self.kind = array("b")
+        self.op = array("b")
+        self.left = array("i")
+        self.right = array("i")
+        self.value = array("i")
+        self.line = array("i")
+        self.column = array("i")
+        self.type = array("b")
+        self.values = []
+        self.root = -1
+        self._names = {}
+
+    def __len__(self):
+        return len(self.kind)
+
+    def add(self, kind: int, op: int, left: int, right: int, value: int, coord: Coord) -> int:
+        self.kind.append(kind)
+        self.op.append(op)
+        self.left.append(left)
+        self.right.append(right)
+        self.value.append(value)
+        if coord is None:
+            self.line.append(0)
+            self.column.append(-1)
+        else:
+            self.line.append(coord.line)
+            self.column.append(-1 if coord.column is None else coord.column)
+        return len(self.kind) - 1
+
+    def add_value(self, value) -> int:
+        self.values.append(value)
+        return len(self.values) - 1
+
+    def add_name(self, name: str) -> int:
+        """Index of the name in ``values``, identifiers with the same name share it."""
+        index = self._names.get(name)
+        if index is None:
+            index = self._names[name] = self.add_value(name)
+        return index
+
+    def coord(self, index: int) -> Coord | None:
+        if not self.line[index]:
+            return None
+        column = self.column[index]
+        return Coord(self.line[index], None if column < 0 else column)
+
+    def nbytes(self) -> int:
+        """Memory used by the node arrays, not counting the values."""
+        columns = (self.kind, self.op, self.left, self.right, self.value, self.line, self.column, self.type)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def to_node(self, index: int = None) -> Node:
+        """Rebuild the qp_ast tree rooted at index (by default, the program), for inspection."""
+        root = self.root if index is None else index
+        builder = NodeBuilder()
+        kind, op, left, right, value, values = self.kind, self.op, self.left, self.right, self.value, self.values
+        nodes = {}
+        # children always come before their parents, so a forward pass builds every subtree once
+        for i in range(root + 1):
+            coord = self.coord(i)
+            k = kind[i]
+            if k == PROGRAM:
+                node = builder.program([nodes[step] for step in values[value[i]]])
+            elif k == FILTER:
+                node = builder.filter(nodes[left[i]], coord)
+            elif k == ORDER:
+                orderings, descending = values[value[i]]
+                node = builder.order([nodes[o] for o in orderings], list(descending), coord)
+            elif k == BINARY_OP:
+                node = builder.binary_op(OPERATORS[op[i]], nodes[left[i]], nodes[right[i]], coord)
+            elif k == UNARY_OP:
+                node = builder.unary_op(OPERATORS[op[i]], nodes[left[i]], coord)
+            elif k == RANGE:
+                node = builder.range(nodes[value[i]], nodes[left[i]], nodes[right[i]],
+                                     bool(op[i] & INCLUDE_LOWER), bool(op[i] & INCLUDE_UPPER), coord)
+            elif k == ID_NODE:
+                node = builder.id(values[value[i]], coord)
+            else:
+                node = builder.constant(CONSTANT_TYPES[op[i]], values[value[i]], coord)
+            nodes[i] = node
+        return nodes[root]
+
+
+class ArenaBuilder:
+    """Builds an Arena for the actions of the extended parser, the parser returns the finished arena."""
+
+    def __init__(self):
+        self.arena = Arena()
+
+    def program(self, steps: list[int]):
+        arena = self.arena
+        coord = arena.coord(steps[0]) if steps else None
+        arena.root = arena.add(PROGRAM, 0, -1, -1, arena.add_value(tuple(steps)), coord)
+        self.arena = Arena()
+        return arena
+
+    def order(self, orderings: list[int], descending: list[bool], coord: Coord):
+        arena = self.arena
+        return arena.add(ORDER, 0, -1, -1, arena.add_value((tuple(orderings), tuple(descending))), coord)
+
+    def filter(self, expression: int, coord: Coord):
+        return self.arena.add(FILTER, 0, expression, -1, -1, coord)
+
+    def id(self, name: str, coord: Coord):
+        arena = self.arena
+        return arena.add(ID_NODE, 0, -1, -1, arena.add_name(name), coord)
+
+    def constant(self, type: str, value, coord: Coord):
+        arena = self.arena
+        return arena.add(CONSTANT, CONSTANT_TYPE_CODES[type], -1, -1, arena.add_value(value), coord)
+
+    def binary_op(self, op: str, left: int, right: int, coord: Coord):
+        return self.arena.add(BINARY_OP, OPERATOR_CODES[op], left, right, -1, coord)
+
+    def unary_op(self, op: str, expr: int, coord: Coord):
+        return self.arena.add(UNARY_OP, OPERATOR_CODES[op], expr, -1, -1, coord)
+
+    def range(self, data: int, lower: int, upper: int, include_lower: bool, include_upper: bool, coord: Coord):
+        flags = (INCLUDE_LOWER if include_lower else 0) | (INCLUDE_UPPER if include_upper else 0)
+        return self.arena.add(RANGE, flags, lower, upper, data, coord)
+
+    def reset(self):
+        """Drop the nodes of an unfinished parse."""
+        self.arena = Arena()
+
+
+class ArenaSemanticVisitor(SemanticVisitorExtended):
+    """
+    Semantic analysis of an Arena, with the same checks and error messages as
+    SemanticVisitorExtended.
+
+    As children come before their parents, a single forward pass over the arrays
+    visits the nodes in the same order as the recursive traversal of the tree.
+    Identifiers are checked against the registry, if any, but their fields are
+    not kept, as the arena has no node to attach them to.
+    """
+
+    def visit(self, arena: Arena):
+        kind, op, left, right, value, values = arena.kind, arena.op, arena.left, arena.right, arena.value, arena.values
+        types = arena.type = array("b", bytes(len(kind)))
+        typemap, registry = self.typemap, self.registry
+        for i in range(len(kind)):
+            k = kind[i]
+            if k == ID_NODE:
+                if registry is not None and values[value[i]] not in registry:
+                    self._assert_semantic(False, 7, coord=arena.coord(i), name=values[value[i]])
+                types[i] = TYPE_CODES[NumberType]
+            elif k == CONSTANT:
+                types[i] = TYPE_CODES[typemap[CONSTANT_TYPES[op[i]]]]
+            elif k == BINARY_OP:
+                lhs, rhs = left[i], right[i]
+                if kind[lhs] != ID_NODE and kind[rhs] != ID_NODE:
+                    name, left_type, right_type = OPERATORS[op[i]], TYPES[types[lhs]], TYPES[types[rhs]]
+                    if left_type != right_type:
+                        self._assert_semantic(False, 3, coord=arena.coord(i), name=name, ltype=left_type,
+                                              rtype=right_type)
+                    if name not in left_type.rel_ops and name not in left_type.binary_ops:
+                        self._assert_semantic(False, 4, coord=arena.coord(i), name=name, ltype=left_type)
+                types[i] = TYPE_CODES[BooleanType]
+            elif k == UNARY_OP:
+                name, expression_type = OPERATORS[op[i]], TYPES[types[left[i]]]
+                if name not in expression_type.unary_ops:
+                    self._assert_semantic(False, 5, coord=arena.coord(i), name=name, ltype=expression_type)
+                types[i] = types[left[i]]
+            elif k == RANGE:
+                lower, upper = left[i], right[i]
+                self._assert_semantic(
+                    kind[lower] == CONSTANT and kind[upper] == CONSTANT and
+                    TYPES[types[lower]] == NumberType and TYPES[types[upper]] == NumberType,
+                    6,
+                    coord=arena.coord(i),
+                )
+                types[i] = TYPE_CODES[BooleanType]
+            elif k == FILTER:
+                expression = left[i]
+                self._assert_semantic(TYPES[types[expression]] == BooleanType, 1, arena.coord(expression))
+            elif k == ORDER:
+                for expression in values[value[i]][0]:
+                    self._assert_semantic(kind[expression] == ID_NODE, 2, arena.coord(expression))
+
+
+class ArenaSQLEmitter(SQLEmitterExtended):
+    """Streaming SQL emitter over an Arena, producing the same SQL as SQLEmitterExtended."""
+
+    def chunks(self, arena: Arena) -> Iterator[str]:
+        kind, op, left, right, value, values = arena.kind, arena.op, arena.left, arena.right, arena.value, arena.values
+        unary_operator_map, binary_operator_map = self.unary_operator_map, self.binary_operator_map
+        constant_sql = self.constant_sql
+        stack = [arena.root]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            i = pop()
+            if i.__class__ is str:
+                yield i
+                continue
+            k = kind[i]
+            if k == ID_NODE:
+                yield values[value[i]]
+            elif k == CONSTANT:
+                yield constant_sql(CONSTANT_TYPES[op[i]], values[value[i]])
+            elif k == BINARY_OP:
+                extend((")", right[i], " " + binary_operator_map[OPERATORS[op[i]]] + " ", left[i]))
+                yield "("
+            elif k == UNARY_OP:
+                extend((")", left[i]))
+                yield "(" + unary_operator_map[OPERATORS[op[i]]] + " "
+            elif k == RANGE:
+                lower_op = " <= " if op[i] & INCLUDE_LOWER else " < "
+                upper_op = " <= " if op[i] & INCLUDE_UPPER else " < "
+                data = value[i]
+                extend((")", right[i], upper_op, data, " AND ", data, lower_op, left[i]))
+                yield "("
+            elif k == FILTER:
+                stack.append(left[i])
+                yield "WHERE "
+            elif k == ORDER:
+                orderings, descending = values[value[i]]
+                parts = ["ORDER BY "]
+                for j, expression in enumerate(orderings):
+                    if j:
+                        parts.append(" , ")
+                    parts.append(expression)
+                    if descending[j]:
+                        parts.append(" DESC")
+                extend(reversed(parts))
+            else:
+                filter_step = ""
+                order_step = ""
+                for step in values[value[i]]:
+                    if kind[step] == FILTER:
+                        filter_step = step
+                    elif kind[step] == ORDER:
+                        order_step = step
+                extend((" ;", order_step, " ", filter_step, " ", self.table_name, " FROM ", self.select_list(arena),
+                        "SELECT "))
+
+    def select_list(self, arena: Arena) -> str:
+        if self.key_columns is None:
+            return "*"
+        return select_list(self._identifiers(arena), self.key_columns)
+
+    def _identifiers(self, arena: Arena) -> Iterator[str]:
+        # in the order of the steps of the program, like src.utils.projection.node_identifiers
+        kind, left, right, value, values = arena.kind, arena.left, arena.right, arena.value, arena.values
+        stack = list(reversed(values[value[arena.root]]))
+        while stack:
+            i = stack.pop()
+            k = kind[i]
+            if k == ID_NODE:
+                yield values[value[i]]
+            elif k == ORDER:
+                stack.extend(reversed(values[value[i]][0]))
+            elif k == RANGE:
+                stack.extend((right[i], left[i], value[i]))
+            elif k == BINARY_OP:
+                stack.extend((right[i], left[i]))
+            elif k == UNARY_OP or k == FILTER:
+                stack.append(left[i])
+
+
+class ArenaParameterizedSQLEmitter(ParameterizedEmitter, ArenaSQLEmitter):
+    """ArenaSQLEmitter that writes placeholders for the constants and returns them as parameters."""
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_file", help="Path to file to be translated to SQL", type=str
+    )
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    p = QPParserExtended(builder=ArenaBuilder())
+    # open file and parse it
+    with open(input_path) as f:
+        arena = p.parse_text(f.read())
+        sema = ArenaSemanticVisitor()
+        sema.visit(arena)
+        ArenaSQLEmitter().emit(arena, sys.stdout)
+        print()
@@ -0,0 +1,294 @@
+import sys
+import argparse
+import pathlib
+from typing import Iterator, Sequence, TextIO
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.translate import TranslationVisitorExtended
+from src.extended.qp_ast import *
+from src.extended.ranges import NEGATED_OPERATORS, SWAPPED_OPERATORS
+from src.utils.parameters import ParameterizedEmitter
+from src.utils.projection import node_identifiers, select_list
+
+
+class SQLEmitterExtended:
+    """
+    Streaming SQL emitter for the extended Query Plan.
+
+    Produces the same SQL as TranslationVisitorExtended, but in a single traversal
+    that writes fragments to one output instead of attaching the text of every
+    subtree to its node, so the work and memory are linear in the size of the SQL.
+
+    Each ``emit_<ClassName>`` method returns the parts of a node in output order:
+    strings are written as they are and nodes are expanded in turn, using an
+    explicit stack so the depth of the tree is not limited by recursion.
+
+    An InList with more values than ``value_table_threshold`` is emitted as a
+    subquery on a table of its values, declared in a WITH clause before the
+    SELECT, so the engine can join the plan against it instead of scanning a
+    long list for every row.
+
+    With ``key_columns`` the SELECT lists those columns and the identifiers the
+    plan uses instead of every column of the table.
+    """
+
+    unary_operator_map = TranslationVisitorExtended.unary_operator_map
+    binary_operator_map = TranslationVisitorExtended.binary_operator_map
+
+    def __init__(self, value_table_threshold: int = None, key_columns: Sequence[str] = None):
+        self.table_name = "table1"
+        self.value_table_threshold = value_table_threshold
+        self.key_columns = key_columns
+        self._method_cache = {}
+        # id of an InList -> name of the table of its values, for the program being emitted
+        self._value_tables = {}
+
+    def chunks(self, node: Node) -> Iterator[str]:
+        """Yield the SQL fragments of the tree rooted at node, in order."""
+        method_cache = self._method_cache
+        self._value_tables = {}
+        stack = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            item = pop()
+            if item.__class__ is str:
+                yield item
+                continue
+            emitter = method_cache.get(item.__class__)
+            if emitter is None:
+                emitter = method_cache[item.__class__] = getattr(self, "emit_" + item.__class__.__name__)
+            extend(reversed(emitter(item)))
+
+    def emit(self, node: Node, buf: TextIO = None) -> str | None:
+        """Return the SQL of the tree rooted at node, or write it to buf if one is given."""
+        if buf is not None:
+            buf.writelines(self.chunks(node))
+            return
+        return "".join(self.chunks(node))
+
+    def emit_Program(self, node: Program):
+        filter_step = ""
+        order_step = ""
+        for step in node.steps:
+            if isinstance(step, Filter):
+                filter_step = step
+            elif isinstance(step, Order):
+                order_step = step
+        parts = ["SELECT ", self.select_list(node), " FROM ", self.table_name, " ", filter_step, " ", order_step, " ;"]
+        if self.value_table_threshold is not None and filter_step:
+            parts[:0] = self._value_table_parts(filter_step)
+        return parts
+
+    def select_list(self, node: Program) -> str:
+        """Columns selected by the program, all of them unless key columns are given."""
+        if self.key_columns is None:
+            return "*"
+        return select_list(node_identifiers(node), self.key_columns)
+
+    def _value_table_parts(self, node: Node) -> list:
+        """Parts of the WITH clause declaring the tables of the values of the large InLists under node."""
+        parts = []
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, InList):
+                if len(item.values) > self.value_table_threshold:
+                    name = self._value_tables[id(item)] = "in_values_%d" % (len(self._value_tables) + 1)
+                    parts.append("WITH " if len(parts) == 0 else ", ")
+                    parts.extend((name, " (value) AS (VALUES "))
+                    for i, value in enumerate(item.values):
+                        parts.extend(("(" if i == 0 else ", (", value, ")"))
+                    parts.append(")")
+                continue
+            stack.extend(reversed([child for _, child in item.children()]))
+        if parts:
+            parts.append(" ")
+        return parts
+
+    def emit_EmptyStatement(self, node: EmptyStatement):
+        return ()
+
+    def emit_UnaryOp(self, node: UnaryOp):
+        return "(", self.unary_operator_map[node.op], " ", node.expr, ")"
+
+    def emit_BinaryOp(self, node: BinaryOp):
+        return "(", node.lvalue, " ", self.binary_operator_map[node.op], " ", node.rvalue, ")"
+
+    def emit_Range(self, node: Range):
+        lower_op = " <= " if node.include_lower else " < "
+        upper_op = " <= " if node.include_upper else " < "
+        return "(", node.lower, lower_op, node.data, " AND ", node.data, upper_op, node.upper, ")"
+
+    def emit_InList(self, node: InList):
+        name = self._value_tables.get(id(node))
+        if name is not None:
+            return "(", node.data, " IN (SELECT value FROM ", name, "))"
+        parts = ["(", node.data, " IN ("]
+        for i, value in enumerate(node.values):
+            if i:
+                parts.append(", ")
+            parts.append(value)
+        parts.append("))")
+        return parts
+
+    def emit_ID(self, node: ID):
+        return (node.name,)
+
+    def constant_sql(self, typename: str, value) -> str:
+        """SQL of a constant, its value written inline."""
+        return str(value)
+
+    def emit_Constant(self, node: Constant):
+        # the type is still the type name if the tree was not analysed
+        return (self.constant_sql(getattr(node.type, "typename", node.type), node.value),)
+
+    def emit_Order(self, node: Order):
+        parts = ["ORDER BY "]
+        for i, expression in enumerate(node.orderings):
+            if i:
+                parts.append(" , ")
+            parts.append(expression)
+            if node.descending[i]:
+                parts.append(" DESC")
+        return parts
+
+    def emit_Filter(self, node: Filter):
+        return "WHERE ", node.expression
+
+
+class ParameterizedSQLEmitterExtended(ParameterizedEmitter, SQLEmitterExtended):
+    """SQLEmitterExtended that writes placeholders for the constants and returns them as parameters."""
+
+
+# precedence of SQL operators, an operand binding less tightly than its parent requires is parenthesized
+OR_PRECEDENCE = 1
+AND_PRECEDENCE = 2
+NOT_PRECEDENCE = 3
+COMPARISON_PRECEDENCE = 4
+SIGN_PRECEDENCE = 5
+ATOM_PRECEDENCE = 6
+
+
+class SargableSQLEmitterExtended(SQLEmitterExtended):
+    """
+    SQL emitter that writes predicates an engine can answer with an index on the
+    identifier (sargable ones).
+
+    Signs applied to numbers are folded into signed literals, comparisons keep the
+    identifier on the left, a negated comparison of an identifier is written as the
+    opposite comparison, ranges that include both bounds become BETWEEN and
+    parentheses are only written where the precedence of SQL requires them.
+    """
+
+    def _folded_number(self, node: Node):
+        """Return the value of a number with any signs applied, or None if node is not one."""
+        sign = 1
+        while node.__class__ is UnaryOp and node.op in ("-", "+"):
+            if node.op == "-":
+                sign = -sign
+            node = node.expr
+        if node.__class__ is Constant and getattr(node.type, "typename", node.type) == "number":
+            return sign * node.value if sign < 0 else node.value
+        return None
+
+    def _is_literal(self, node: Node) -> bool:
+        return node.__class__ is Constant or self._folded_number(node) is not None
+
+    def _precedence(self, node: Node) -> int:
+        cls = node.__class__
+        if cls is BinaryOp:
+            if node.op == "or":
+                return OR_PRECEDENCE
+            if node.op == "and":
+                return AND_PRECEDENCE
+            return COMPARISON_PRECEDENCE
+        if cls is UnaryOp:
+            if node.op == "not":
+                return NOT_PRECEDENCE
+            return ATOM_PRECEDENCE if self._folded_number(node) is not None else SIGN_PRECEDENCE
+        if cls is Range:
+            return COMPARISON_PRECEDENCE if node.include_lower and node.include_upper else AND_PRECEDENCE
+        if cls is InList:
+            return COMPARISON_PRECEDENCE
+        return ATOM_PRECEDENCE
+
+    def _operand(self, node: Node, precedence: int):
+        if self._precedence(node) < precedence:
+            return "(", node, ")"
+        return (node,)
+
+    def _comparison(self, op: str, left: Node, right: Node):
+        if self._is_literal(left) and right.__class__ is ID:
+            op, left, right = SWAPPED_OPERATORS[op], right, left
+        return (*self._operand(left, SIGN_PRECEDENCE), " ", self.binary_operator_map[op], " ",
+                *self._operand(right, SIGN_PRECEDENCE))
+
+    def emit_UnaryOp(self, node: UnaryOp):
+        value = self._folded_number(node)
+        if value is not None:
+            return (self.constant_sql("number", value),)
+        if node.op == "not":
+            expr = node.expr
+            if expr.__class__ is BinaryOp and expr.op in NEGATED_OPERATORS and (
+                    self._is_literal(expr.lvalue) or self._is_literal(expr.rvalue)):
+                return self._comparison(NEGATED_OPERATORS[expr.op], expr.lvalue, expr.rvalue)
+            return ("NOT ", *self._operand(expr, NOT_PRECEDENCE))
+        # a sign applied to a sign is parenthesized, "--" would start a comment
+        return (self.unary_operator_map[node.op], *self._operand(node.expr, ATOM_PRECEDENCE))
+
+    def emit_BinaryOp(self, node: BinaryOp):
+        if node.op in ("and", "or"):
+            precedence = self._precedence(node)
+            return (*self._operand(node.lvalue, precedence), " ", self.binary_operator_map[node.op], " ",
+                    *self._operand(node.rvalue, precedence))
+        return self._comparison(node.op, node.lvalue, node.rvalue)
+
+    def emit_Range(self, node: Range):
+        if node.include_lower and node.include_upper:
+            return node.data, " BETWEEN ", node.lower, " AND ", node.upper
+        lower_op = " >= " if node.include_lower else " > "
+        upper_op = " <= " if node.include_upper else " < "
+        return node.data, lower_op, node.lower, " AND ", node.data, upper_op, node.upper
+
+    def emit_InList(self, node: InList):
+        name = self._value_tables.get(id(node))
+        if name is not None:
+            return node.data, " IN (SELECT value FROM ", name, ")"
+        parts = [node.data, " IN ("]
+        for i, value in enumerate(node.values):
+            if i:
+                parts.append(", ")
+            parts.append(value)
+        parts.append(")")
+        return parts
+
+
+class ParameterizedSargableSQLEmitterExtended(ParameterizedEmitter, SargableSQLEmitterExtended):
+    """SargableSQLEmitterExtended that writes placeholders for the constants and returns them as parameters."""
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_file", help="Path to file to be translated to SQL", type=str
+    )
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    p = QPParserExtended()
+    # open file and parse it
+    with open(input_path) as f:
+        ast = p.parse_text(f.read())
+        visitor = SemanticVisitorExtended()
+        visitor.visit(ast)
+        SQLEmitterExtended().emit(ast, sys.stdout)
+        print()
@@ -0,0 +1,445 @@
+import sys
+import argparse
+import pathlib
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from src.extended.parser import QPParserExtended
+from src.extended.qp_ast import *
+from src.extended.semantic import SemanticVisitorExtended
+from src.utils.node_visitor import *
+
+# instruction codes of a compiled filter, each instruction is a tuple starting with its code
+LOAD_COLUMN, LOAD_CONSTANT, UNARY, BINARY, RANGE, IN_LIST = range(6)
+
+# binary operator -> NumPy ufunc computing it element-wise
+BINARY_UFUNCS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "=": np.equal,
+    "!=": np.not_equal,
+    "and": np.logical_and,
+    "or": np.logical_or,
+}
+
+
+def _is_mask(value) -> bool:
+    return value.__class__ is np.ndarray and value.dtype == np.bool_
+
+
+def _negate(value):
+    # a narrow or unsigned column is widened first, so -(-32768) and -(1) stay exact as in SQL
+    if isinstance(value, np.ndarray) and value.dtype.kind in "iu" and (value.dtype.kind == "u" or
+                                                                       value.dtype.itemsize < 8):
+        value = value.astype(np.int64)
+    return np.negative(value)
+
+
+def _column(columns: Mapping[str, np.ndarray], name: str, field_name: str | None, lowered: dict) -> np.ndarray:
+    """Column of an identifier: by name, by the name of its header field, then without regard to case."""
+    column = columns.get(name)
+    if column is None and field_name is not None:
+        column = columns.get(field_name)
+    if column is None:
+        if not lowered:
+            lowered.update((key.lower(), value) for key, value in columns.items())
+        column = lowered.get(name.lower())
+    if column is None:
+        raise KeyError("No column for identifier %s" % name)
+    return np.asarray(column)
+
+
+def _size(columns: Mapping[str, np.ndarray], size: int | None) -> int:
+    if size is not None:
+        return size
+    if not columns:
+        raise ValueError("The number of traces is needed when no column is given")
+    return len(next(iter(columns.values())))
+
+
+class CompiledFilter:
+    """
+    Filter of a Query Plan compiled to a program of NumPy operations.
+
+    Calling it with a mapping of header columns returns a boolean mask with one
+    element per trace. Every instruction works on whole columns, so the cost per
+    trace is a few vectorized passes instead of a round trip through an engine.
+    Identifiers are looked up by name, then by the name of their header field if
+    the plan was analysed with a registry, then without regard to case.
+    """
+
+    __slots__ = ("instructions", "identifiers")
+
+    def __init__(self, instructions: list[tuple], identifiers: list[str]):
+        """
+        I create an instance of this class.
+
+        :param instructions: postfix program, as built by MaskCompilerExtended.
+        :param identifiers: names of the columns the program reads, in order of first use.
+        """
+        self.instructions = instructions
+        self.identifiers = identifiers
+
+    def __call__(self, columns: Mapping[str, np.ndarray], size: int = None) -> np.ndarray:
+        """
+        Return the mask of the traces selected by the filter.
+
+        :param columns: header columns by name, all of the same length.
+        :param size: number of traces, by default the length of the columns.
+        """
+        size = _size(columns, size)
+        lowered = {}
+        # entries are (value, owned), an owned value is a temporary mask that can be overwritten in place
+        stack = []
+        pop, push = stack.pop, stack.append
+        for instruction in self.instructions:
+            code = instruction[0]
+            if code == LOAD_COLUMN:
+                push((_column(columns, instruction[1], instruction[2], lowered), False))
+            elif code == LOAD_CONSTANT:
+                push((instruction[1], False))
+            elif code == UNARY:
+                value, owned = pop()
+                if instruction[1] == "not":
+                    value = np.logical_not(value, out=value if owned else None)
+                    push((value, _is_mask(value)))
+                elif instruction[1] == "-":
+                    push((_negate(value), False))
+                else:
+                    push((value, owned))
+            elif code == BINARY:
+                right, right_owned = pop()
+                left, left_owned = pop()
+                ufunc = BINARY_UFUNCS[instruction[1]]
+                if ufunc is np.logical_and or ufunc is np.logical_or:
+                    # owned masks have one element per trace, so either can hold the result
+                    out = left if left_owned else right if right_owned else None
+                    value = ufunc(left, right, out=out)
+                else:
+                    value = ufunc(left, right)
+                push((value, _is_mask(value)))
+            elif code == RANGE:
+                data, _ = pop()
+                _, lower, upper, include_lower, include_upper = instruction
+                mask = np.logical_and((np.greater_equal if include_lower else np.greater)(data, lower),
+                                      (np.less_equal if include_upper else np.less)(data, upper))
+                push((mask, _is_mask(mask)))
+            elif code == IN_LIST:
+                data, _ = pop()
+                mask = np.isin(data, instruction[1])
+                push((mask, _is_mask(mask)))
+        if not stack:
+            return np.ones(size, dtype=bool)
+        mask, owned = pop()
+        mask = np.asarray(mask, dtype=bool)
+        if mask.ndim == 0:
+            return np.full(size, bool(mask))
+        return mask if owned else mask.copy()
+
+
+class MaskCompilerExtended(IterativeNodeVisitor):
+    """
+    Compiles the filter of an analysed extended Query Plan into a CompiledFilter.
+
+    The visitor leaves the nodes in post-order, so the instructions appended by
+    the ``leave_<ClassName>`` hooks form a postfix program: each one pops its
+    operands from a stack of columns, constants and masks and pushes its result.
+    Identifiers stand for numeric header columns and booleans for 1 and 0, as in
+    SQL; char and string constants can not be compared with them and raise a
+    ValueError. The order of the plan is not compiled.
+    """
+
+    def __init__(self):
+        self._instructions = []
+        self._identifiers = {}
+
+    def compile(self, node: Node) -> CompiledFilter:
+        """Return the compiled filter of a Program, or of a Filter or an expression."""
+        self._instructions = []
+        self._identifiers = {}
+        self.visit(node)
+        return CompiledFilter(self._instructions, list(self._identifiers))
+
+    def enter_Program(self, node: Program):
+        return [step for step in node.steps if isinstance(step, Filter)]
+
+    def enter_Filter(self, node: Filter):
+        return (node.expression,)
+
+    def enter_EmptyStatement(self, node: EmptyStatement):
+        return ()
+
+    def enter_Order(self, node: Order):
+        return ()
+
+    def enter_UnaryOp(self, node: UnaryOp):
+        return (node.expr,)
+
+    def leave_UnaryOp(self, node: UnaryOp):
+        self._instructions.append((UNARY, node.op))
+
+    def enter_BinaryOp(self, node: BinaryOp):
+        return node.lvalue, node.rvalue
+
+    def leave_BinaryOp(self, node: BinaryOp):
+        self._instructions.append((BINARY, node.op))
+
+    def enter_Range(self, node: Range):
+        return (node.data,)
+
+    def leave_Range(self, node: Range):
+        self._instructions.append((RANGE, self._value(node.lower), self._value(node.upper), node.include_lower,
+                                   node.include_upper))
+
+    def enter_InList(self, node: InList):
+        return (node.data,)
+
+    def leave_InList(self, node: InList):
+        self._instructions.append((IN_LIST, np.array([self._value(value) for value in node.values])))
+
+    def leave_ID(self, node: ID):
+        field = getattr(node, "field", None)
+        self._identifiers.setdefault(node.name)
+        self._instructions.append((LOAD_COLUMN, node.name, None if field is None else field.name))
+
+    def enter_Constant(self, node: Constant):
+        return ()
+
+    def leave_Constant(self, node: Constant):
+        self._instructions.append((LOAD_CONSTANT, self._value(node)))
+
+    @staticmethod
+    def _value(node: Node):
+        """Python value of a constant, with any signs applied to a number."""
+        sign = 1
+        while isinstance(node, UnaryOp) and node.op in ("-", "+"):
+            if node.op == "-":
+                sign = -sign
+            node = node.expr
+        typename = getattr(node.type, "typename", node.type)
+        if typename == "number":
+            return -node.value if sign < 0 else node.value
+        if typename == "bool":
+            return node.value.lower() == "true"
+        raise ValueError("Constant %s of type %s can not be compared with header columns" % (node.value, typename))
+
+
+def descending_key(column: np.ndarray) -> np.ndarray:
+    """Key whose ascending order is the descending order of column, without overflow for any integer width."""
+    if column.dtype.kind in "iub":
+        # ~x = -x - 1 for two's complement integers and max - x for unsigned ones, both order reversing
+        return np.invert(column)
+    return np.negative(column)
+
+
+# Bits of the unsigned words composite sort keys are packed into, and most words a composite key may take
+PACKED_WORD_BITS = 64
+MAX_PACKED_WORDS = 2
+
+
+def pack_sort_keys(keys: Sequence[tuple[np.ndarray, bool, tuple[int, int] | None]]) -> list[np.ndarray] | None:
+    """
+    Pack integer sort keys into composite unsigned 64-bit words, most significant first.
+
+    Each key is a (column, descending, limits) tuple, the limits being the smallest
+    and largest values of the column, or None to take them from the column. A key
+    takes the bits needed by ``upper - lower`` and stores ``x - lower``, bit-inverted
+    within those bits when descending, so sorting the words in order sorts by all
+    the keys. Keys are not split across words. Returns None when a key is not an
+    integer column or the keys need more than MAX_PACKED_WORDS words, in which case
+    the caller sorts the keys one by one.
+    """
+    fields = []
+    for column, descending, limits in keys:
+        if column.dtype.kind not in "iub":
+            return None
+        if limits is None:
+            limits = (int(column.min()), int(column.max())) if len(column) else (0, 0)
+        lower, upper = limits
+        fields.append((column, descending, lower, (upper - lower).bit_length()))
+
+    words, used = [[]], 0
+    for field in fields:
+        bits = field[3]
+        if used + bits > PACKED_WORD_BITS:
+            words.append([])
+            used = 0
+        if bits > PACKED_WORD_BITS or len(words) > MAX_PACKED_WORDS:
+            return None
+        words[-1].append(field)
+        used += bits
+
+    size = len(keys[0][0])
+    packed = []
+    value = np.empty(size, dtype=np.uint64)
+    for word_fields in words:
+        word = np.zeros(size, dtype=np.uint64)
+        for column, descending, lower, bits in word_fields:
+            # integers wrap to uint64 modulo 2 ** 64, which keeps x - lower exact as it is in [0, 2 ** bits)
+            np.copyto(value, column, casting="unsafe")
+            np.subtract(value, np.uint64(lower % (1 << 64)), out=value)
+            if descending:
+                np.bitwise_xor(value, np.uint64((1 << bits) - 1), out=value)
+            np.left_shift(word, np.uint64(bits), out=word)
+            np.bitwise_or(word, value, out=word)
+        packed.append(word)
+    return packed
+
+
+class CompiledOrder:
+    """
+    Order of a Query Plan compiled to a stable sort of header columns.
+
+    Calling it with a mapping of header columns returns the permutation of the
+    traces in the order of the plan, instead of asking a database for it. When
+    all the keys are integer columns whose ranges fit in 128 bits, they are
+    packed into one or two uint64 words by `pack_sort_keys` and those are sorted
+    once, by value when the keys and the row positions fit in a single word;
+    otherwise one `numpy.lexsort` sorts the keys in turn, descending ones
+    through an order reversing copy (`descending_key`), so integer and float
+    columns of any width can be mixed. The sort is stable: traces with equal keys
+    keep the order of the given positions, or the order they are given in. NaNs
+    sort last in both directions.
+    """
+
+    __slots__ = ("keys", "identifiers", "packed")
+
+    def __init__(self, keys: list[tuple[str, str | None, bool]], packed: bool = True):
+        """
+        I create an instance of this class.
+
+        :param keys: (identifier, header field name or None, descending) of each key, most significant first.
+        :param packed: sort packed composite keys when they fit, otherwise always sort the keys one by one.
+        """
+        self.keys = keys
+        self.identifiers = list(dict.fromkeys(name for name, _, _ in keys))
+        self.packed = packed
+
+    def _key_columns(self, columns: Mapping[str, np.ndarray], rows: np.ndarray | None,
+                     limits: Mapping[str, tuple[int, int]]) -> list[tuple[np.ndarray, bool, tuple[int, int] | None]]:
+        lowered = {}
+        keys = []
+        for name, field_name, descending in self.keys:
+            column = _column(columns, name, field_name, lowered)
+            if rows is not None:
+                column = column[rows]
+            key_limits = limits.get(name, limits.get(field_name)) if limits else None
+            keys.append((column, descending, key_limits))
+        return keys
+
+    def __call__(self, columns: Mapping[str, np.ndarray], rows: np.ndarray = None,
+                 positions: Sequence[np.ndarray] = (), size: int = None,
+                 limits: Mapping[str, tuple[int, int]] = None) -> np.ndarray:
+        """
+        Return the trace indices in the order of the plan.
+
+        :param columns: header columns by name, all of the same length.
+        :param rows: indices of the traces to sort, or a mask such as the result of a CompiledFilter, all by default.
+        :param positions: columns breaking ties, most significant first, such as the file id and the trace index of
+            traces gathered from many files. By default ties keep the order of the rows.
+        :param size: number of traces, by default the length of the columns.
+        :param limits: smallest and largest value of key columns by identifier or field name, from statistics or
+            field widths (`HeaderField.limits`). Other keys are scanned for them; values outside the limits given
+            are sorted in an unspecified order.
+        """
+        if rows is not None:
+            rows = np.asarray(rows)
+            if rows.dtype == np.bool_:
+                rows = np.flatnonzero(rows)
+        keys = self._key_columns(columns, rows, limits)
+        keys.extend((np.asarray(position) if rows is None else np.asarray(position)[rows], False, None)
+                    for position in positions)
+        if not keys or len(keys[0][0]) == 0:
+            return np.arange(_size(columns, size)) if rows is None else rows.copy()
+        permutation = self._packed_permutation(keys) if self.packed else None
+        if permutation is None:
+            # lexsort takes the most significant key last
+            permutation = np.lexsort([descending_key(column) if descending else column
+                                      for column, descending, _ in reversed(keys)])
+        return permutation if rows is None else rows[permutation]
+
+    @staticmethod
+    def _packed_permutation(keys: list[tuple[np.ndarray, bool, tuple[int, int] | None]]) -> np.ndarray | None:
+        size = len(keys[0][0])
+        # with the position of each row as the last key all the packed keys are distinct, so sorting their values,
+        # which needs no stable sort and no indirection, gives the permutation in their low bits
+        words = pack_sort_keys(keys + [(np.arange(size, dtype=np.uint64), False, (0, size - 1))])
+        if words is not None and len(words) == 1:
+            word = words[0]
+            word.sort()
+            np.bitwise_and(word, np.uint64((1 << (size - 1).bit_length()) - 1), out=word)
+            return word.view(np.int64)
+        words = pack_sort_keys(keys)
+        if words is None:
+            return None
+        if len(words) == 1:
+            return np.argsort(words[0], kind="stable")
+        return np.lexsort(words[::-1])
+
+
+class OrderCompilerExtended(IterativeNodeVisitor):
+    """
+    Compiles the order of an analysed extended Query Plan into a CompiledOrder.
+
+    The semantic analysis guarantees that every ordering is an identifier, so the
+    keys are read straight from the Order node. A plan without an order compiles
+    to the identity permutation.
+    """
+
+    def __init__(self):
+        self._keys = []
+
+    def compile(self, node: Node) -> CompiledOrder:
+        """Return the compiled order of a Program or an Order."""
+        self._keys = []
+        self.visit(node)
+        return CompiledOrder(self._keys)
+
+    def enter_Program(self, node: Program):
+        return [step for step in node.steps if isinstance(step, Order)]
+
+    def enter_Order(self, node: Order):
+        self._keys = []
+        for ordering, descending in zip(node.orderings, node.descending):
+            field = getattr(ordering, "field", None)
+            self._keys.append((ordering.name, None if field is None else field.name, bool(descending)))
+        return ()
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser(description="Print the indices of the traces of a SEG-Y file selected by a Query "
+                                                 "Plan, in its order")
+    parser.add_argument("input_file", help="Path to the Query Plan", type=str)
+    parser.add_argument("segy_file", help="Path to the SEG-Y file", type=str)
+    args = parser.parse_args()
+
+    # check if files exist
+    for path in (pathlib.Path(args.input_file), pathlib.Path(args.segy_file)):
+        if not path.exists():
+            print("Input", path, "not found", file=sys.stderr)
+            sys.exit(1)
+
+    from src.segy.headers import HeaderRegistry
+    from src.segy.reader import SegyReader
+
+    registry = HeaderRegistry()
+    p = QPParserExtended()
+    # open file and parse it
+    with open(args.input_file) as f:
+        ast = p.parse_text(f.read())
+    visitor = SemanticVisitorExtended(registry=registry)
+    visitor.visit(ast)
+    if p.has_error() or visitor.has_error():
+        sys.exit(1)
+    compiled_filter = MaskCompilerExtended().compile(ast)
+    compiled_order = OrderCompilerExtended().compile(ast)
+    with SegyReader(args.segy_file, registry) as reader:
+        columns = reader.columns(dict.fromkeys(compiled_filter.identifiers + compiled_order.identifiers))
+        mask = compiled_filter(columns, len(reader))
+    traces = compiled_order(columns, mask, size=len(mask))
+    print("%d of %d traces selected" % (len(traces), len(mask)), file=sys.stderr)
+    np.savetxt(sys.stdout, traces, fmt="%d")
@@ -0,0 +1,5 @@
+# Generated by src.utils.tables from the grammar in this package, do not edit.
+
+signature = 'a6f047d7aba39c83f9d50403ee3dfbf3d4c594e34a0219c2cea44c27aa219eb5'
+
+master_re = '(?P<newlines>(\\n+))|(?P<ID>([a-zA-Z][0-9a-zA-Z_]*))|(?P<comment>(//.*))|(?P<block_comment>(/-))|(?P<REAL_CONST>(-?[0-9]+[.][0-9]+))|(?P<INT_CONST>(-?[0-9]+))|(?P<CHAR_CONST>\\\'.\\\')|(?P<STRING_LITERAL>("))|(?P<unmatchedquote>(\\\'|"))|(?P<PLUS>\\+)|(?P<MINUS>-)|(?P<NE>!=)|(?P<LE><=)|(?P<LT><)|(?P<GE>>=)|(?P<GT>>)|(?P<EQ>=)|(?P<LPAREN>\\()|(?P<RPAREN>\\))|(?P<COMMA>\\,)|(?P<COLON>\\:)|(?P<SEMI>\\;)'
@@ -0,0 +1,459 @@
+import sys
+import argparse
+import pathlib
+from collections import Counter
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.qp_ast import *
+from src.extended.ranges import NEGATED_OPERATORS, SWAPPED_OPERATORS, IntervalSet
+from src.utils.qp_types import *
+
+# Names of the rewrites, as counted in FilterOptimizerExtended.rewrites
+FOLD_CONSTANT = "fold_constant"
+DOUBLE_NEGATION = "double_negation"
+DE_MORGAN = "de_morgan"
+PUSH_NOT = "push_not"
+FLATTEN = "flatten"
+DUPLICATE = "duplicate"
+SHORT_CIRCUIT = "short_circuit"
+MERGE_RANGES = "merge_ranges"
+IN_LIST = "in_list"
+CONTRADICTION = "contradiction"
+
+# junction operator -> operator of its negation, by De Morgan's laws
+DUAL_OPERATORS = {
+    "and": "or",
+    "or": "and",
+}
+
+# junction operator -> value of the constant that is dropped from it and of the one that decides it
+IDENTITIES = {
+    "and": ("true", "false"),
+    "or": ("false", "true"),
+}
+
+# work item states
+_EXPAND = 0
+_COMBINE = 1
+
+
+class _Junction:
+    """Flattened operands of a chain of a single and/or operator, with the keys of the ones already added."""
+
+    __slots__ = ("op", "operands", "keys", "decided", "coord")
+
+    def __init__(self, op: str, coord):
+        self.op = op
+        self.operands = []
+        self.keys = set()
+        self.decided = None
+        self.coord = coord
+
+
+class FilterOptimizerExtended:
+    """
+    Rewrites the filter of an analysed extended Query Plan into a simpler, equivalent one.
+
+    The rewrites are: folding unary operators applied to constants, removing double
+    negations, pushing negations down to the comparisons (De Morgan's laws and
+    negated relational operators), flattening nested chains of and/or, dropping
+    repeated operands of a chain and short-circuiting chains on true/false.
+
+    Negating a comparison keeps its meaning under SQL's three-valued logic, so
+    ``not (x > 1)`` becomes ``x <= 1`` even for null values of x.
+
+    Then the comparisons of an identifier with numbers and its ranges are read as
+    interval sets: the ones in a chain are merged (or) or intersected (and) into
+    fewer terms, with INCL bounds respected, equality tests on the same identifier
+    are collected into one InList, and a chain of the filter that can
+    never hold is replaced by false. A filter that is false as a whole selects no
+    row, which is flagged in `empty` so its execution can be skipped. An or that
+    covers every number is kept as it is, since it still rejects null values.
+
+    The tree is rewritten in place, with an explicit stack so its depth is not
+    limited by recursion, and the number of times each rewrite fired is kept in
+    `rewrites` until the next `reset`.
+    """
+
+    def __init__(self):
+        self.rewrites = Counter()
+        self.empty = False
+        # structural key -> small int, so equal subtrees share a key
+        self._keys = {}
+        # id of a node -> (identifier, IntervalSet) of the values it accepts, for chains on a single identifier
+        self._constraints = {}
+
+    def optimize(self, ast: Program) -> Program:
+        """Rewrite the filter steps of the program and return it."""
+        for step in ast.steps:
+            if isinstance(step, Filter):
+                step.expression = self.rewrite(step.expression)
+                self.empty = step.expression.__class__ is Constant and not _is_true(step.expression)
+        return ast
+
+    def rewrite(self, expression: Node) -> Node:
+        """Return the rewritten expression, which reuses the nodes of the given one."""
+        return self._fold_ranges(self._simplify(expression))
+
+    def _simplify(self, expression: Node) -> Node:
+        self._keys = {}
+        work = [(expression, False, _EXPAND)]
+        values = []
+        pop, push = work.pop, work.append
+        while work:
+            node, negated, state = pop()
+            cls = node.__class__
+            if state == _COMBINE:
+                if cls is BinaryOp:
+                    right, left = values.pop(), values.pop()
+                    if negated:
+                        values.append(self._junction(DUAL_OPERATORS[node.op], left, right, node.coord))
+                    elif node.op in DUAL_OPERATORS:
+                        values.append(self._junction(node.op, left, right, node.coord))
+                    else:
+                        values.append(self._comparison(node, left, right))
+                else:
+                    values.append(self._unary(node, values.pop()))
+            elif cls is UnaryOp and node.op == "not":
+                if negated:
+                    self.rewrites[DOUBLE_NEGATION] += 1
+                push((node.expr, not negated, _EXPAND))
+            elif cls is BinaryOp:
+                if negated:
+                    if node.op in DUAL_OPERATORS:
+                        self.rewrites[DE_MORGAN] += 1
+                    else:
+                        self.rewrites[PUSH_NOT] += 1
+                        node.op = NEGATED_OPERATORS[node.op]
+                        negated = False
+                push((node, negated, _COMBINE))
+                push((node.rvalue, negated, _EXPAND))
+                push((node.lvalue, negated, _EXPAND))
+            elif cls is UnaryOp:
+                push((node, False, _COMBINE))
+                push((node.expr, False, _EXPAND))
+            elif cls is Range and negated:
+                self.rewrites[PUSH_NOT] += 1
+                values.append(self._negated_range(node))
+            elif cls is Constant and negated:
+                self.rewrites[FOLD_CONSTANT] += 1
+                values.append(self._leaf(self._bool_constant(not _is_true(node), node.coord)))
+            elif negated:
+                # nothing to push the negation into
+                operand = self._leaf(node)
+                negation = UnaryOp("not", operand[0], node.coord)
+                negation.type = BooleanType
+                values.append((negation, self._key(("not", operand[1]))))
+            else:
+                values.append(self._leaf(node))
+        return self._materialize(values.pop())[0]
+
+    def _key(self, structure: tuple) -> int:
+        return self._keys.setdefault(structure, len(self._keys))
+
+    def _leaf(self, node: Node):
+        cls = node.__class__
+        if cls is ID:
+            return node, self._key(("id", node.name))
+        if cls is Constant:
+            return node, self._key(("constant", _typename(node), node.value))
+        if cls is Range:
+            structure = ("range", node.data.name, node.lower.value, node.upper.value, node.include_lower,
+                         node.include_upper)
+            return node, self._key(structure)
+        # a node the optimizer does not know, never equal to another one
+        return node, self._key(("node", id(node)))
+
+    def _bool_constant(self, value: bool, coord) -> Constant:
+        constant = Constant("bool", "true" if value else "false", coord)
+        constant.type = BooleanType
+        return constant
+
+    def _unary(self, node: UnaryOp, operand):
+        operand, key = self._materialize(operand)
+        if operand.__class__ is Constant and _typename(operand) == "number":
+            self.rewrites[FOLD_CONSTANT] += 1
+            if node.op == "-":
+                folded = Constant("number", -operand.value, node.coord)
+                folded.type = NumberType
+                return self._leaf(folded)
+            return operand, key
+        node.expr = operand
+        return node, self._key((node.op, key))
+
+    def _comparison(self, node: BinaryOp, left, right):
+        node.lvalue, left_key = self._materialize(left)
+        node.rvalue, right_key = self._materialize(right)
+        return node, self._key((node.op, left_key, right_key))
+
+    def _negated_range(self, node: Range):
+        # not (l < x and x < u) is (x <= l or x >= u)
+        lower = BinaryOp("<" if node.include_lower else "<=", node.data, node.lower, node.coord)
+        upper = BinaryOp(">" if node.include_upper else ">=", node.data, node.upper, node.coord)
+        junction = _Junction("or", node.coord)
+        for comparison in (lower, upper):
+            comparison.type = BooleanType
+            self._add(junction, self._comparison(comparison, self._leaf(comparison.lvalue),
+                                                 self._leaf(comparison.rvalue)))
+        return junction
+
+    def _junction(self, op: str, left, right, coord):
+        if left.__class__ is _Junction and left.op == op:
+            # the left operand is the chain built so far, extend it in place
+            junction = left
+        else:
+            junction = _Junction(op, coord)
+            self._add(junction, left)
+        if right.__class__ is _Junction and right.op == op:
+            self.rewrites[FLATTEN] += 1
+            for operand in right.operands:
+                self._add(junction, operand)
+            if right.decided is not None:
+                self._decide(junction)
+        else:
+            self._add(junction, right)
+        return junction
+
+    def _add(self, junction: _Junction, value):
+        if junction.decided is not None:
+            self.rewrites[SHORT_CIRCUIT] += 1
+            return
+        operand, key = self._materialize(value)
+        if operand.__class__ is Constant and _typename(operand) == "bool":
+            self.rewrites[SHORT_CIRCUIT] += 1
+            if _is_true(operand) == (IDENTITIES[junction.op][1] == "true"):
+                self._decide(junction)
+            return
+        if key in junction.keys:
+            self.rewrites[DUPLICATE] += 1
+            return
+        junction.keys.add(key)
+        junction.operands.append((operand, key))
+
+    def _decide(self, junction: _Junction):
+        junction.decided = IDENTITIES[junction.op][1] == "true"
+        junction.operands = []
+        junction.keys = set()
+
+    def _materialize(self, value):
+        """Return the (node, key) of a value, building the chain of binary operators of a junction."""
+        if value.__class__ is not _Junction:
+            return value
+        junction = value
+        if junction.decided is not None:
+            return self._leaf(self._bool_constant(junction.decided, junction.coord))
+        if not junction.operands:
+            return self._leaf(self._bool_constant(IDENTITIES[junction.op][0] == "true", junction.coord))
+        node, key = junction.operands[0]
+        for operand, operand_key in junction.operands[1:]:
+            node = BinaryOp(junction.op, node, operand, junction.coord)
+            node.type = BooleanType
+            key = self._key((junction.op, key, operand_key))
+        return node, key
+
+    def _fold_ranges(self, expression: Node) -> Node:
+        # only chains reached from the filter through and/or are folded: there a null
+        # comparison rejects the row like false does, so a contradiction can become false
+        self._constraints = {}
+        work = [(expression, _EXPAND, None)]
+        values = []
+        pop, push = work.pop, work.append
+        while work:
+            node, state, operands = pop()
+            if state == _COMBINE:
+                count = len(operands)
+                folded = values[-count:]
+                del values[-count:]
+                values.append(self._fold_chain(node, operands, folded))
+            elif node.__class__ is BinaryOp and node.op in DUAL_OPERATORS:
+                operands = _chain_operands(node)
+                push((node, _COMBINE, operands))
+                for operand in reversed(operands):
+                    push((operand, _EXPAND, None))
+            else:
+                values.append(node)
+        result = values.pop()
+        constraint = self._constraint(result)
+        self._constraints = {}
+        if constraint is not None and constraint[1].is_empty():
+            self.rewrites[CONTRADICTION] += 1
+            return self._bool_constant(False, result.coord)
+        return result
+
+    def _constraint(self, node: Node):
+        """Return the (identifier, IntervalSet) of the values a node accepts, or None if it is not a numeric test."""
+        constraint = self._constraints.get(id(node))
+        if constraint is not None:
+            return constraint
+        cls = node.__class__
+        if cls is BinaryOp and node.op in SWAPPED_OPERATORS:
+            left, right = node.lvalue, node.rvalue
+            if left.__class__ is ID and right.__class__ is Constant and _typename(right) == "number":
+                return left, IntervalSet.comparison(node.op, right.value)
+            if right.__class__ is ID and left.__class__ is Constant and _typename(left) == "number":
+                return right, IntervalSet.comparison(SWAPPED_OPERATORS[node.op], left.value)
+        elif cls is Range and node.lower.__class__ is Constant and node.upper.__class__ is Constant:
+            return node.data, IntervalSet.range(node.lower.value, node.upper.value, node.include_lower,
+                                                node.include_upper)
+        elif cls is InList:
+            return node.data, IntervalSet((value.value, value.value, True, True) for value in node.values)
+        return None
+
+    def _fold_chain(self, chain: BinaryOp, operands: list[Node], folded: list[Node]) -> Node:
+        op = chain.op
+        changed = any(operand is not original for operand, original in zip(folded, operands))
+        # operands folded to constants short-circuit the chain like in the first pass
+        kept = []
+        for operand in folded:
+            if operand.__class__ is Constant and _typename(operand) == "bool":
+                changed = True
+                if _is_true(operand) == (IDENTITIES[op][1] == "true"):
+                    return self._bool_constant(_is_true(operand), chain.coord)
+            else:
+                kept.append(operand)
+        groups = {}
+        constraints = []
+        for i, operand in enumerate(kept):
+            constraint = self._constraint(operand)
+            constraints.append(constraint)
+            if constraint is not None:
+                groups.setdefault(constraint[0].name, []).append(i)
+        replaced = {}
+        combined = None
+        for name, indexes in groups.items():
+            if op == "or":
+                combined = IntervalSet(interval for i in indexes for interval in constraints[i][1])
+            else:
+                combined = constraints[indexes[0]][1]
+                for i in indexes[1:]:
+                    combined = combined.intersection(constraints[i][1])
+            if combined.is_empty():
+                self.rewrites[CONTRADICTION] += 1
+                if op == "and":
+                    return self._bool_constant(False, chain.coord)
+                replaced.update((i, ()) for i in indexes)
+                continue
+            if len(indexes) == 1 or combined.is_full():
+                continue
+            terms = self._interval_nodes(constraints[indexes[0]][0], combined)
+            if len(terms) < len(indexes) and (op == "or" or len(terms) == 1):
+                if any(term.__class__ is InList for term in terms):
+                    self.rewrites[IN_LIST] += 1
+                if any(term.__class__ is not InList for term in terms):
+                    self.rewrites[MERGE_RANGES] += 1
+                replaced[indexes[0]] = terms
+                replaced.update((i, ()) for i in indexes[1:])
+        if replaced:
+            changed = True
+            operands = []
+            for i, operand in enumerate(kept):
+                operands.extend(replaced.get(i, (operand,)))
+        else:
+            operands = kept
+        if not operands:
+            return self._bool_constant(IDENTITIES[op][0] == "true", chain.coord)
+        node = chain
+        if changed:
+            node = operands[0]
+            for operand in operands[1:]:
+                node = BinaryOp(op, node, operand, chain.coord)
+                node.type = BooleanType
+        if len(groups) == 1 and None not in constraints and not combined.is_empty():
+            # the chain only tests one identifier, a parent chain can merge it too
+            self._constraints[id(node)] = (constraints[0][0], combined)
+        return node
+
+    def _interval_nodes(self, data: ID, intervals: IntervalSet) -> list[Node]:
+        """Comparisons, ranges and InList of an identifier that accept the values of the interval set."""
+        terms = []
+        points = [interval.lower for interval in intervals
+                  if interval.lower is not None and interval.lower == interval.upper]
+        in_list = None
+        if len(points) > 1:
+            in_list = InList(data, [self._number_constant(point, data.coord) for point in points], data.coord)
+            in_list.type = BooleanType
+        for lower, upper, include_lower, include_upper in intervals:
+            if lower is not None and lower == upper:
+                if in_list is None:
+                    term = BinaryOp("=", data, self._number_constant(lower, data.coord), data.coord)
+                elif in_list.values[0].value == lower:
+                    term = in_list
+                else:
+                    continue
+            elif lower is None:
+                term = BinaryOp("<=" if include_upper else "<", data, self._number_constant(upper, data.coord),
+                                data.coord)
+            elif upper is None:
+                term = BinaryOp(">=" if include_lower else ">", data, self._number_constant(lower, data.coord),
+                                data.coord)
+            else:
+                term = Range(data, self._number_constant(lower, data.coord), self._number_constant(upper, data.coord),
+                             include_lower, include_upper, data.coord)
+            term.type = BooleanType
+            terms.append(term)
+        return terms
+
+    def _number_constant(self, value, coord) -> Constant:
+        constant = Constant("number", value, coord)
+        constant.type = NumberType
+        return constant
+
+    def reset(self):
+        """Clear the rewrite counts so the instance can be reused."""
+        self.rewrites = Counter()
+        self.empty = False
+        self._keys = {}
+        self._constraints = {}
+
+
+def _typename(constant: Constant) -> str:
+    # the type is still the type name if the tree was not analysed
+    return getattr(constant.type, "typename", constant.type)
+
+
+def _is_true(constant: Constant) -> bool:
+    return constant.value.lower() == "true"
+
+
+def _chain_operands(node: BinaryOp) -> list[Node]:
+    """Operands of the left-deep chain of the operator of node, in order."""
+    op = node.op
+    operands = []
+    while node.__class__ is BinaryOp and node.op == op:
+        operands.append(node.rvalue)
+        node = node.lvalue
+    operands.append(node)
+    operands.reverse()
+    return operands
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_file", help="Path to file to be optimized and translated to SQL", type=str
+    )
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    p = QPParserExtended()
+    # open file and parse it
+    with open(input_path) as f:
+        ast = p.parse_text(f.read())
+        visitor = SemanticVisitorExtended()
+        visitor.visit(ast)
+        optimizer = FilterOptimizerExtended()
+        optimizer.optimize(ast)
+        SQLEmitterExtended().emit(ast, sys.stdout)
+        print()
+        for name, count in sorted(optimizer.rewrites.items()):
+            print("%s: %d" % (name, count))
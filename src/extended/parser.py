@@ -1,12 +1,15 @@
 import sys
 import argparse
 import pathlib
-from sly import Parser
+from src.utils.tables import PrecomputedTablesParser
 from src.extended.lexer import QPLexerExtended
 from src.utils.coord import Coord
+from src.utils.diagnostics import Diagnostics
 from src.extended.qp_ast import *
 
-class QPParserExtended(Parser):
+class QPParserExtended(PrecomputedTablesParser):
+    _tables_module = "src.extended.parsetab"
+
     tokens = QPLexerExtended.tokens
 
     precedence = (
@@ -21,18 +24,26 @@ class QPParserExtended(Parser):
 
     start = 'program'
 
-    def __init__(self, lexer=QPLexerExtended()):
+    # Diagnostic codes reported by the parser
+    UNEXPECTED_TOKEN = 1
+    UNEXPECTED_END = 2
+
+    def __init__(self, lexer: QPLexerExtended = None, diagnostics: Diagnostics = None, builder: NodeBuilder = None):
+        # each parser gets its own lexer, and so its own diagnostics, unless one is given
+        if lexer is None:
+            lexer = QPLexerExtended(diagnostics)
         self.lex = lexer
+        # the actions build the tree through the builder, which makes qp_ast nodes by default
+        self.builder = NodeBuilder() if builder is None else builder
+        # errors go to the same sink as the lexer's unless another one is given
+        self.diagnostics = lexer.diagnostics if diagnostics is None else diagnostics
         self._found_error = False
 
     def parse_text(self, text: str):
         return self.parse(self.lex.tokenize(text))
 
-    def _parser_error(self, msg: str, coord: Coord = None):
-        if coord is None:
-            print("Parser error: %s" % msg, file=sys.stdout)
-        else:
-            print("Parser error: %s %s" % (msg, coord), file=sys.stdout)
+    def _parser_error(self, msg: str, code: int, coord: Coord = None):
+        self.diagnostics.report("parser", code, msg, coord)
         self._found_error = True
 
     def _token_coord(self, p):
@@ -42,17 +53,17 @@ class QPParserExtended(Parser):
        'order filter')
     def program(self, p):
         steps = [p.filter, p.order]
-        return Program(steps, p[0].coord)
+        return self.builder.program(steps)
 
     @_('filter',
        'order')
     def program(self, p):
         steps = [p[0]]
-        return Program(steps, p[0].coord)
+        return self.builder.program(steps)
 
     @_('empty')
     def program(self, p):
-        return Program([])
+        return self.builder.program([])
 
     @_('')
     def empty(self, p):
@@ -61,11 +72,11 @@ class QPParserExtended(Parser):
     @_('ORDER COLON id_list SEMI')
     def order(self, p):
         orderings, descending = p.id_list
-        return Order(orderings, descending, self._token_coord(p))
+        return self.builder.order(orderings, descending, self._token_coord(p))
 
     @_('FILTER COLON expression SEMI')
     def filter(self, p):
-        return Filter(p.expression, self._token_coord(p))
+        return self.builder.filter(p.expression, self._token_coord(p))
 
     @_('id',
        'id DESC')
@@ -82,25 +93,25 @@ class QPParserExtended(Parser):
 
     @_('ID')
     def id(self, p):
-        return ID(p.ID, self._token_coord(p))
+        return self.builder.id(p.ID, self._token_coord(p))
 
     @_('INT_CONST',
        'REAL_CONST')
     def constant(self, p):
-        return Constant('number', p[0], self._token_coord(p))
+        return self.builder.constant('number', p[0], self._token_coord(p))
 
     @_('STRING_LITERAL')
     def constant(self, p):
-        return Constant('string', p[0], self._token_coord(p))
+        return self.builder.constant('string', p[0], self._token_coord(p))
 
     @_('CHAR_CONST')
     def constant(self, p):
-        return Constant('char', p[0], self._token_coord(p))
+        return self.builder.constant('char', p[0], self._token_coord(p))
 
     @_('TRUE',
        'FALSE')
     def constant(self, p):
-        return Constant('bool', p[0], self._token_coord(p))
+        return self.builder.constant('bool', p[0], self._token_coord(p))
 
     @_('unary_expression',
        'range_expression')
@@ -116,7 +127,7 @@ class QPParserExtended(Parser):
        'expression AND expression',
        'expression OR expression')
     def expression(self, p):
-        return BinaryOp(op=p[1].lower(), left=p.expression0, right=p.expression1, coord=self._token_coord(p))
+        return self.builder.binary_op(p[1].lower(), p.expression0, p.expression1, self._token_coord(p))
 
     @_('primary_expression')
     def unary_expression(self, p):
@@ -126,13 +137,13 @@ class QPParserExtended(Parser):
        'MINUS unary_expression',
        'NOT unary_expression', )
     def unary_expression(self, p):
-        return UnaryOp(p[0].lower(), p.unary_expression, self._token_coord(p))
+        return self.builder.unary_op(p[0].lower(), p.unary_expression, self._token_coord(p))
 
     @_('id IN RANGE LPAREN unary_expression_range COMMA unary_expression_range RPAREN')
     def range_expression(self, p):
         lower_value, lower_included = p[4]
         upper_value, upper_included = p[6]
-        return Range(p.id, lower_value, upper_value, lower_included, upper_included, coord=self._token_coord(p))
+        return self.builder.range(p.id, lower_value, upper_value, lower_included, upper_included, self._token_coord(p))
 
     @_('unary_expression',
        'unary_expression INCL')
@@ -151,14 +162,21 @@ class QPParserExtended(Parser):
     def error(self, p):
         if p:
             self._parser_error(
-                "Before %s" % p.value, Coord(p.lineno, self.lex.find_tok_column(p))
+                "Before %s" % p.value, self.UNEXPECTED_TOKEN, Coord(p.lineno, self.lex.find_tok_column(p))
             )
         else:
-            self._parser_error("At the end of input (%s)" % self.lex.filename)
+            self._parser_error("At the end of input", self.UNEXPECTED_END)
 
     def has_error(self):
         return self._found_error
 
+    def reset(self):
+        """Clear the per-call error state and the position tracking tables SLY fills while parsing."""
+        self._found_error = False
+        self.builder.reset()
+        self._line_positions = {}
+        self._index_positions = {}
+
 if __name__ == "__main__":
 
     # create argument parser
@@ -0,0 +1,570 @@
+# Generated by src.utils.tables from the grammar in this package, do not edit.
+
+signature = '466a2db064cc6fe7c93c48ba653f6661572e74c207023a9fc1a51a2bcd26b279'
+
+lr_action = {0: {'$end': -6, 'FILTER': 6, 'ORDER': 5},
+ 1: {'$end': 0},
+ 2: {'$end': -1},
+ 3: {'$end': -2, 'FILTER': 6},
+ 4: {'$end': -3, 'ORDER': 5},
+ 5: {'COLON': 9},
+ 6: {'COLON': 10},
+ 7: {'$end': -4},
+ 8: {'$end': -5},
+ 9: {'ID': 14},
+ 10: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 11: {'COMMA': 32, 'SEMI': 31},
+ 12: {'COMMA': -12, 'SEMI': -12},
+ 13: {'COMMA': -10, 'DESC': 33, 'SEMI': -10},
+ 14: {'AND': -13,
+      'COMMA': -13,
+      'DESC': -13,
+      'EQ': -13,
+      'GE': -13,
+      'GT': -13,
+      'IN': -13,
+      'INCL': -13,
+      'LE': -13,
+      'LT': -13,
+      'NE': -13,
+      'OR': -13,
+      'RPAREN': -13,
+      'SEMI': -13},
+ 15: {'AND': 36, 'EQ': 38, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': 37, 'OR': 35, 'SEMI': 34},
+ 16: {'AND': -28,
+      'EQ': -28,
+      'GE': -28,
+      'GT': -28,
+      'LE': -28,
+      'LT': -28,
+      'NE': -28,
+      'OR': -28,
+      'RPAREN': -28,
+      'SEMI': -28},
+ 17: {'AND': -29,
+      'EQ': -29,
+      'GE': -29,
+      'GT': -29,
+      'LE': -29,
+      'LT': -29,
+      'NE': -29,
+      'OR': -29,
+      'RPAREN': -29,
+      'SEMI': -29},
+ 18: {'AND': -39,
+      'EQ': -39,
+      'GE': -39,
+      'GT': -39,
+      'IN': 43,
+      'LE': -39,
+      'LT': -39,
+      'NE': -39,
+      'OR': -39,
+      'RPAREN': -39,
+      'SEMI': -39},
+ 19: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 20: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 21: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 22: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 23: {'AND': -33,
+      'COMMA': -33,
+      'EQ': -33,
+      'GE': -33,
+      'GT': -33,
+      'INCL': -33,
+      'LE': -33,
+      'LT': -33,
+      'NE': -33,
+      'OR': -33,
+      'RPAREN': -33,
+      'SEMI': -33},
+ 24: {'AND': -38,
+      'COMMA': -38,
+      'EQ': -38,
+      'GE': -38,
+      'GT': -38,
+      'INCL': -38,
+      'LE': -38,
+      'LT': -38,
+      'NE': -38,
+      'OR': -38,
+      'RPAREN': -38,
+      'SEMI': -38},
+ 25: {'AND': -14,
+      'COMMA': -14,
+      'EQ': -14,
+      'GE': -14,
+      'GT': -14,
+      'INCL': -14,
+      'LE': -14,
+      'LT': -14,
+      'NE': -14,
+      'OR': -14,
+      'RPAREN': -14,
+      'SEMI': -14},
+ 26: {'AND': -15,
+      'COMMA': -15,
+      'EQ': -15,
+      'GE': -15,
+      'GT': -15,
+      'INCL': -15,
+      'LE': -15,
+      'LT': -15,
+      'NE': -15,
+      'OR': -15,
+      'RPAREN': -15,
+      'SEMI': -15},
+ 27: {'AND': -16,
+      'COMMA': -16,
+      'EQ': -16,
+      'GE': -16,
+      'GT': -16,
+      'INCL': -16,
+      'LE': -16,
+      'LT': -16,
+      'NE': -16,
+      'OR': -16,
+      'RPAREN': -16,
+      'SEMI': -16},
+ 28: {'AND': -17,
+      'COMMA': -17,
+      'EQ': -17,
+      'GE': -17,
+      'GT': -17,
+      'INCL': -17,
+      'LE': -17,
+      'LT': -17,
+      'NE': -17,
+      'OR': -17,
+      'RPAREN': -17,
+      'SEMI': -17},
+ 29: {'AND': -18,
+      'COMMA': -18,
+      'EQ': -18,
+      'GE': -18,
+      'GT': -18,
+      'INCL': -18,
+      'LE': -18,
+      'LT': -18,
+      'NE': -18,
+      'OR': -18,
+      'RPAREN': -18,
+      'SEMI': -18},
+ 30: {'AND': -19,
+      'COMMA': -19,
+      'EQ': -19,
+      'GE': -19,
+      'GT': -19,
+      'INCL': -19,
+      'LE': -19,
+      'LT': -19,
+      'NE': -19,
+      'OR': -19,
+      'RPAREN': -19,
+      'SEMI': -19},
+ 31: {'$end': -7, 'FILTER': -7},
+ 32: {'ID': 14},
+ 33: {'COMMA': -9, 'SEMI': -9},
+ 34: {'$end': -8, 'ORDER': -8},
+ 35: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 36: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 37: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 38: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 39: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 40: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 41: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 42: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 43: {'RANGE': 58},
+ 44: {'AND': 36, 'EQ': 38, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': 37, 'OR': 35, 'RPAREN': 59},
+ 45: {'AND': -30,
+      'COMMA': -30,
+      'EQ': -30,
+      'GE': -30,
+      'GT': -30,
+      'INCL': -30,
+      'LE': -30,
+      'LT': -30,
+      'NE': -30,
+      'OR': -30,
+      'RPAREN': -30,
+      'SEMI': -30},
+ 46: {'AND': -39,
+      'COMMA': -39,
+      'EQ': -39,
+      'GE': -39,
+      'GT': -39,
+      'INCL': -39,
+      'LE': -39,
+      'LT': -39,
+      'NE': -39,
+      'OR': -39,
+      'RPAREN': -39,
+      'SEMI': -39},
+ 47: {'AND': -31,
+      'COMMA': -31,
+      'EQ': -31,
+      'GE': -31,
+      'GT': -31,
+      'INCL': -31,
+      'LE': -31,
+      'LT': -31,
+      'NE': -31,
+      'OR': -31,
+      'RPAREN': -31,
+      'SEMI': -31},
+ 48: {'AND': -32,
+      'COMMA': -32,
+      'EQ': -32,
+      'GE': -32,
+      'GT': -32,
+      'INCL': -32,
+      'LE': -32,
+      'LT': -32,
+      'NE': -32,
+      'OR': -32,
+      'RPAREN': -32,
+      'SEMI': -32},
+ 49: {'COMMA': -11, 'SEMI': -11},
+ 50: {'AND': 36, 'EQ': 38, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': 37, 'OR': -20, 'RPAREN': -20, 'SEMI': -20},
+ 51: {'AND': -21, 'EQ': 38, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': 37, 'OR': -21, 'RPAREN': -21, 'SEMI': -21},
+ 52: {'AND': -22, 'EQ': -22, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': -22, 'OR': -22, 'RPAREN': -22, 'SEMI': -22},
+ 53: {'AND': -23, 'EQ': -23, 'GE': 39, 'GT': 40, 'LE': 41, 'LT': 42, 'NE': -23, 'OR': -23, 'RPAREN': -23, 'SEMI': -23},
+ 54: {'AND': -24,
+      'EQ': -24,
+      'GE': -24,
+      'GT': -24,
+      'LE': -24,
+      'LT': -24,
+      'NE': -24,
+      'OR': -24,
+      'RPAREN': -24,
+      'SEMI': -24},
+ 55: {'AND': -25,
+      'EQ': -25,
+      'GE': -25,
+      'GT': -25,
+      'LE': -25,
+      'LT': -25,
+      'NE': -25,
+      'OR': -25,
+      'RPAREN': -25,
+      'SEMI': -25},
+ 56: {'AND': -26,
+      'EQ': -26,
+      'GE': -26,
+      'GT': -26,
+      'LE': -26,
+      'LT': -26,
+      'NE': -26,
+      'OR': -26,
+      'RPAREN': -26,
+      'SEMI': -26},
+ 57: {'AND': -27,
+      'EQ': -27,
+      'GE': -27,
+      'GT': -27,
+      'LE': -27,
+      'LT': -27,
+      'NE': -27,
+      'OR': -27,
+      'RPAREN': -27,
+      'SEMI': -27},
+ 58: {'LPAREN': 60},
+ 59: {'AND': -37,
+      'COMMA': -37,
+      'EQ': -37,
+      'GE': -37,
+      'GT': -37,
+      'INCL': -37,
+      'LE': -37,
+      'LT': -37,
+      'NE': -37,
+      'OR': -37,
+      'RPAREN': -37,
+      'SEMI': -37},
+ 60: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 61: {'COMMA': 63},
+ 62: {'COMMA': -36, 'INCL': 64, 'RPAREN': -36},
+ 63: {'CHAR_CONST': 27,
+      'FALSE': 25,
+      'ID': 14,
+      'INT_CONST': 30,
+      'LPAREN': 19,
+      'MINUS': 21,
+      'NOT': 20,
+      'PLUS': 22,
+      'REAL_CONST': 29,
+      'STRING_LITERAL': 28,
+      'TRUE': 26},
+ 64: {'COMMA': -35, 'RPAREN': -35},
+ 65: {'RPAREN': 66},
+ 66: {'AND': -34,
+      'EQ': -34,
+      'GE': -34,
+      'GT': -34,
+      'LE': -34,
+      'LT': -34,
+      'NE': -34,
+      'OR': -34,
+      'RPAREN': -34,
+      'SEMI': -34}}
+
+lr_goto = {0: {'empty': 2, 'filter': 4, 'order': 3, 'program': 1},
+ 1: {},
+ 2: {},
+ 3: {'filter': 7},
+ 4: {'order': 8},
+ 5: {},
+ 6: {},
+ 7: {},
+ 8: {},
+ 9: {'id': 13, 'id_list': 11, 'order_id': 12},
+ 10: {'constant': 24,
+      'expression': 15,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 11: {},
+ 12: {},
+ 13: {},
+ 14: {},
+ 15: {},
+ 16: {},
+ 17: {},
+ 18: {},
+ 19: {'constant': 24,
+      'expression': 44,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 20: {'constant': 24, 'id': 46, 'primary_expression': 23, 'unary_expression': 45},
+ 21: {'constant': 24, 'id': 46, 'primary_expression': 23, 'unary_expression': 47},
+ 22: {'constant': 24, 'id': 46, 'primary_expression': 23, 'unary_expression': 48},
+ 23: {},
+ 24: {},
+ 25: {},
+ 26: {},
+ 27: {},
+ 28: {},
+ 29: {},
+ 30: {},
+ 31: {},
+ 32: {'id': 13, 'order_id': 49},
+ 33: {},
+ 34: {},
+ 35: {'constant': 24,
+      'expression': 50,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 36: {'constant': 24,
+      'expression': 51,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 37: {'constant': 24,
+      'expression': 52,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 38: {'constant': 24,
+      'expression': 53,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 39: {'constant': 24,
+      'expression': 54,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 40: {'constant': 24,
+      'expression': 55,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 41: {'constant': 24,
+      'expression': 56,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 42: {'constant': 24,
+      'expression': 57,
+      'id': 18,
+      'primary_expression': 23,
+      'range_expression': 16,
+      'unary_expression': 17},
+ 43: {},
+ 44: {},
+ 45: {},
+ 46: {},
+ 47: {},
+ 48: {},
+ 49: {},
+ 50: {},
+ 51: {},
+ 52: {},
+ 53: {},
+ 54: {},
+ 55: {},
+ 56: {},
+ 57: {},
+ 58: {},
+ 59: {},
+ 60: {'constant': 24, 'id': 46, 'primary_expression': 23, 'unary_expression': 62, 'unary_expression_range': 61},
+ 61: {},
+ 62: {},
+ 63: {'constant': 24, 'id': 46, 'primary_expression': 23, 'unary_expression': 62, 'unary_expression_range': 65},
+ 64: {},
+ 65: {},
+ 66: {}}
+
+defaulted_states = {2: -1, 7: -4, 8: -5}
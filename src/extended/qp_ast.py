@@ -4,6 +4,7 @@ from src.utils.node import Node
 
 class Constant(Node):
 
+    __slots__ = ("type", "value", "coord", "text")
     attr_names = ('type', 'value')
 
     def __init__(self, type: str, value, coord=None):
@@ -24,6 +25,7 @@ class Constant(Node):
 
 class EmptyStatement(Node):
 
+    __slots__ = ("coord",)
     attr_names = ()
 
     def __init__(self, coord=None):
@@ -35,6 +37,7 @@ class EmptyStatement(Node):
 
 class ID(Node):
 
+    __slots__ = ("name", "coord", "type", "field", "text")
     attr_names = ("name",)
 
     def __init__(self, name: str, coord: Coord = None):
@@ -53,6 +56,7 @@ class ID(Node):
 
 class Program(Node):
 
+    __slots__ = ("steps", "coord", "text")
     attr_names = ()
 
     def __init__(self, steps=list[Node], coord: Coord=None):
@@ -67,6 +71,8 @@ class Program(Node):
 
 
 class Operation(Node):
+
+    __slots__ = ("op", "coord")
     attr_names = ("op",)
 
     def __init__(self, op: str, coord: Coord = None):
@@ -85,6 +91,7 @@ class Operation(Node):
 
 class UnaryOp(Operation):
 
+    __slots__ = ("expr", "type", "text")
     attr_names = ("op",)
 
     def __init__(self, op: str, expr: Node, coord: Coord=None):
@@ -107,6 +114,7 @@ class UnaryOp(Operation):
 
 class Range(Node):
 
+    __slots__ = ("data", "lower", "upper", "include_lower", "include_upper", "coord", "type", "text")
     attr_names = ("data", "lower", "upper", "include_lower", "include_upper")
 
     def __init__(self, data: ID, lower: Node, upper: Node, include_lower: bool, include_upper: bool, coord: Coord = None):
@@ -135,8 +143,33 @@ class Range(Node):
         return tuple(nodelist)
 
 
+class InList(Node):
+
+    __slots__ = ("data", "values", "coord", "type", "text")
+    attr_names = ()
+
+    def __init__(self, data: ID, values: list[Node], coord: Coord = None):
+        """
+        I create an instance of this class.
+
+        :param data: data that should be equal to one of the values
+        :param values: constants the data is compared to
+        :param coord: code position.
+        """
+        self.data = data
+        self.values = values
+        self.coord = coord
+
+    def children(self):
+        nodelist = [("data", self.data)]
+        for i, child in enumerate(self.values or []):
+            nodelist.append(("values[%d]" % i, child))
+        return tuple(nodelist)
+
+
 class BinaryOp(Operation):
 
+    __slots__ = ("lvalue", "rvalue", "type", "text")
     attr_names = ("op",)
 
     def __init__(self, op: str, left: Node, right: Node, coord: Coord = None):
@@ -164,6 +197,7 @@ class BinaryOp(Operation):
 
 class Order(Node):
 
+    __slots__ = ("orderings", "descending", "coord", "text")
     attr_names = ()
 
     def __init__(self, orderings: list[ID], descending: list[bool], coord: Coord = None):
@@ -182,6 +216,7 @@ class Order(Node):
 
 class Filter(Node):
 
+    __slots__ = ("expression", "coord", "text")
     attr_names = ()
 
     def __init__(self, expression: Operation, coord: Coord = None):
@@ -192,4 +227,39 @@ class Filter(Node):
         nodelist = []
         if self.expression is not None:
             nodelist.append(("expr", self.expression))
-        return tuple(nodelist)
\ No newline at end of file
+        return tuple(nodelist)
+
+class NodeBuilder:
+    """
+    Builds the nodes of this module for the actions of the extended parser.
+
+    The parser only calls these methods, so another builder (see src.extended.arena)
+    can produce a different representation of the same tree.
+    """
+
+    def program(self, steps: list[Node]):
+        return Program(steps, steps[0].coord if steps else None)
+
+    def order(self, orderings: list[ID], descending: list[bool], coord: Coord):
+        return Order(orderings, descending, coord)
+
+    def filter(self, expression: Node, coord: Coord):
+        return Filter(expression, coord)
+
+    def id(self, name: str, coord: Coord):
+        return ID(name, coord)
+
+    def constant(self, type: str, value, coord: Coord):
+        return Constant(type, value, coord)
+
+    def binary_op(self, op: str, left: Node, right: Node, coord: Coord):
+        return BinaryOp(op, left, right, coord)
+
+    def unary_op(self, op: str, expr: Node, coord: Coord):
+        return UnaryOp(op, expr, coord)
+
+    def range(self, data: ID, lower: Node, upper: Node, include_lower: bool, include_upper: bool, coord: Coord):
+        return Range(data, lower, upper, include_lower, include_upper, coord)
+
+    def reset(self):
+        pass
@@ -0,0 +1,149 @@
+from collections import namedtuple
+
+Interval = namedtuple("Interval", ["lower", "upper", "include_lower", "include_upper"])
+Interval.__doc__ = """Interval of numbers, a bound of None is unbounded and never included."""
+
+# relational operator -> (lower, upper, include_lower, include_upper) of `x op value` as a function of value
+_COMPARISONS = {
+    "<": lambda v: ((None, v, False, False),),
+    "<=": lambda v: ((None, v, False, True),),
+    ">": lambda v: ((v, None, False, False),),
+    ">=": lambda v: ((v, None, True, False),),
+    "=": lambda v: ((v, v, True, True),),
+    "!=": lambda v: ((None, v, False, False), (v, None, False, False)),
+}
+
+# relational operator -> operator of its negation
+NEGATED_OPERATORS = {
+    "<": ">=",
+    "<=": ">",
+    ">": "<=",
+    ">=": "<",
+    "=": "!=",
+    "!=": "=",
+}
+
+# relational operator -> operator with its operands swapped, `c op x` is `x SWAPPED[op] c`
+SWAPPED_OPERATORS = {
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+    "=": "=",
+    "!=": "!=",
+}
+
+
+def _is_empty(interval: Interval) -> bool:
+    lower, upper, include_lower, include_upper = interval
+    if lower is None or upper is None:
+        return False
+    return lower > upper or (lower == upper and not (include_lower and include_upper))
+
+
+def _lower_key(interval: Interval):
+    # unbounded first, then by value, an included bound before an excluded one
+    if interval.lower is None:
+        return (0, 0, 0)
+    return (1, interval.lower, 0 if interval.include_lower else 1)
+
+
+def _intersect(first: Interval, second: Interval) -> Interval:
+    if first.lower is None or (second.lower is not None and second.lower > first.lower):
+        lower, include_lower = second.lower, second.include_lower
+    elif second.lower is None or first.lower > second.lower:
+        lower, include_lower = first.lower, first.include_lower
+    else:
+        lower, include_lower = first.lower, first.include_lower and second.include_lower
+    if first.upper is None or (second.upper is not None and second.upper < first.upper):
+        upper, include_upper = second.upper, second.include_upper
+    elif second.upper is None or first.upper < second.upper:
+        upper, include_upper = first.upper, first.include_upper
+    else:
+        upper, include_upper = first.upper, first.include_upper and second.include_upper
+    return Interval(lower, upper, include_lower, include_upper)
+
+
+class IntervalSet:
+    """
+    Set of numbers as a sorted tuple of disjoint intervals, none of them empty or
+    touching the next one.
+
+    The values a comparison or a range of the Query Plan accepts for its identifier
+    form an interval set; the sets of the operands of an or are merged with `union`
+    and those of an and with `intersection`.
+    """
+
+    __slots__ = ("intervals",)
+
+    def __init__(self, intervals=()):
+        """
+        I create an instance of this class.
+
+        :param intervals: intervals in any order, empty ones are dropped and overlapping or adjacent ones merged.
+        """
+        self.intervals = self._normalize([Interval(*interval) for interval in intervals])
+
+    @staticmethod
+    def _normalize(intervals: list[Interval]) -> tuple[Interval, ...]:
+        intervals = sorted((interval for interval in intervals if not _is_empty(interval)), key=_lower_key)
+        merged = []
+        for interval in intervals:
+            if merged:
+                last = merged[-1]
+                touches = last.upper is None or interval.lower is None or interval.lower < last.upper or (
+                    interval.lower == last.upper and (last.include_upper or interval.include_lower))
+                if touches:
+                    if last.upper is None or (interval.upper is not None and interval.upper < last.upper):
+                        continue
+                    if interval.upper is not None and interval.upper == last.upper:
+                        include_upper = last.include_upper or interval.include_upper
+                    else:
+                        include_upper = interval.include_upper
+                    merged[-1] = Interval(last.lower, interval.upper, last.include_lower, include_upper)
+                    continue
+            merged.append(interval)
+        return tuple(merged)
+
+    @classmethod
+    def comparison(cls, op: str, value) -> "IntervalSet":
+        """Values of x for which `x op value` holds."""
+        return cls(_COMPARISONS[op](value))
+
+    @classmethod
+    def range(cls, lower, upper, include_lower: bool, include_upper: bool) -> "IntervalSet":
+        """Values of x for which `x in range(lower, upper)` holds, with INCL bounds included."""
+        return cls(((lower, upper, include_lower, include_upper),))
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet(self.intervals + other.intervals)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        intervals = []
+        for first in self.intervals:
+            for second in other.intervals:
+                interval = _intersect(first, second)
+                if not _is_empty(interval):
+                    intervals.append(interval)
+        return IntervalSet(intervals)
+
+    def is_empty(self) -> bool:
+        return not self.intervals
+
+    def is_full(self) -> bool:
+        return self.intervals == (Interval(None, None, False, False),)
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __hash__(self):
+        return hash(self.intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __repr__(self):
+        return "IntervalSet(%r)" % (list(self.intervals),)
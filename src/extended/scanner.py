@@ -0,0 +1,165 @@
+import argparse
+import pathlib
+import re
+import sys
+from sly.lex import Token
+from src.extended.lexer import QPLexerExtended
+
+ID_CHARS = re.compile(r'[0-9a-zA-Z_]*')
+NUMBER = re.compile(r'-?[0-9]+(?:[.][0-9]+)?')
+
+LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+DIGITS = frozenset("0123456789")
+
+# Tokens fully determined by their first character
+SINGLE_CHAR_TOKENS = {
+    "+": "PLUS",
+    "=": "EQ",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    ",": "COMMA",
+    ":": "COLON",
+    ";": "SEMI",
+}
+
+# Tokens that become a two character token when followed by "="
+COMPARISON_TOKENS = {
+    "<": ("LT", "LE"),
+    ">": ("GT", "GE"),
+}
+
+
+class QPScannerExtended(QPLexerExtended):
+    """
+    Hand-written scanner for the extended Query Plan.
+
+    It produces the same tokens, values, positions and error messages as
+    QPLexerExtended, but dispatches on the current character in a single pass
+    instead of trying the alternatives of SLY's master regular expression.
+    """
+
+    tokens = QPLexerExtended.tokens
+
+    def _illegal_character(self, tok, text, index):
+        tok.type = "ERROR"
+        tok.value = text[index]
+        self.index = index
+        self.error(tok)
+
+    def tokenize(self, text, lineno=1, index=0):
+        keyword_map = self.keyword_map
+        length = len(text)
+        self.text = text
+        try:
+            while index < length:
+                c = text[index]
+                if c == " " or c == "\t":
+                    index += 1
+                    continue
+                if c == "\n":
+                    end = index + 1
+                    while end < length and text[end] == "\n":
+                        end += 1
+                    lineno += end - index
+                    index = end
+                    continue
+
+                tok = Token()
+                tok.lineno = lineno
+                tok.index = index
+                self.lineno = lineno
+                self.index = index + 1
+
+                if c in LETTERS:
+                    end = ID_CHARS.match(text, index + 1).end()
+                    tok.value = text[index:end]
+                    tok.type = keyword_map.get(tok.value.lower(), "ID")
+                elif c in DIGITS or (c == "-" and index + 1 < length and text[index + 1] in DIGITS):
+                    end = NUMBER.match(text, index).end()
+                    tok.value = text[index:end]
+                    if "." in tok.value:
+                        tok.type = "REAL_CONST"
+                        tok.value = float(tok.value)
+                    else:
+                        tok.type = "INT_CONST"
+                        tok.value = int(tok.value)
+                elif c == "/" and text.startswith("//", index):
+                    end = text.find("\n", index)
+                    index = length if end < 0 else end
+                    continue
+                elif c == "/" and text.startswith("/-", index):
+                    self.index = index + 2
+                    self.block_comment(tok)
+                    index = self.index
+                    lineno = self.lineno
+                    continue
+                elif c == '"':
+                    tok.type = "STRING_LITERAL"
+                    tok = self.STRING_LITERAL(tok)
+                    index = self.index
+                    lineno = self.lineno
+                    if tok is not None:
+                        yield tok
+                    continue
+                elif c == "'":
+                    if index + 2 < length and text[index + 2] == "'" and text[index + 1] != "\n":
+                        tok.type = "CHAR_CONST"
+                        tok.value = text[index:index + 3]
+                        end = index + 3
+                    else:
+                        self.unmatchedquote(tok)
+                        index = self.index
+                        continue
+                elif c in SINGLE_CHAR_TOKENS:
+                    tok.type = SINGLE_CHAR_TOKENS[c]
+                    tok.value = c
+                    end = index + 1
+                elif c in COMPARISON_TOKENS:
+                    if text.startswith("=", index + 1):
+                        tok.type = COMPARISON_TOKENS[c][1]
+                        end = index + 2
+                    else:
+                        tok.type = COMPARISON_TOKENS[c][0]
+                        end = index + 1
+                    tok.value = text[index:end]
+                elif c == "-":
+                    tok.type = "MINUS"
+                    tok.value = c
+                    end = index + 1
+                elif c == "!" and text.startswith("!=", index):
+                    tok.type = "NE"
+                    tok.value = "!="
+                    end = index + 2
+                else:
+                    self._illegal_character(tok, text, index)
+                    index = self.index
+                    continue
+
+                tok.end = index = end
+                yield tok
+        finally:
+            self.text = text
+            self.index = index
+            self.lineno = lineno
+
+
+if __name__ == "__main__":
+
+    # create argument parser
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", help="Path to file to be scanned", type=str)
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    scanner = QPScannerExtended()
+    # open file and print tokens
+    with open(input_path) as f:
+        scanner.scan(f.read())
@@ -7,15 +7,34 @@ from src.extended.qp_ast import *
 from src.utils.node_visitor import *
 
 
-class TranslationVisitorExtended(NodeVisitor):
+class TranslationVisitorExtended(IterativeNodeVisitor):
+    unary_operator_map = {
+        "not": "NOT",
+        "+": "+",
+        "-": "-"
+    }
+
+    binary_operator_map = {
+        "<": "<",
+        "<=": "<=",
+        ">": ">",
+        ">=": ">=",
+        "=": "=",
+        "!=": "<>",
+        "and": "AND",
+        "or": "OR",
+    }
+
     def __init__(self):
         self.table_name = "table1"
 
-    def visit_Program(self, node: Program):
+    def enter_Program(self, node: Program):
+        return node.steps
+
+    def leave_Program(self, node: Program):
         filter_text = ""
         order_text = ""
         for step in node.steps:
-            self.visit(step)
             if isinstance(step, Filter):
                 filter_text = step.text
             elif isinstance(step, Order):
@@ -23,61 +42,53 @@ class TranslationVisitorExtended(NodeVisitor):
         node.text: str = f"SELECT * FROM {self.table_name} {filter_text} {order_text} ;"
 
 
-    def visit_EmptyStatement(self, node: EmptyStatement):
-        pass
+    def enter_EmptyStatement(self, node: EmptyStatement):
+        return ()
 
-    def visit_UnaryOp(self, node: UnaryOp):
-        self.visit(node.expr)
+    def enter_UnaryOp(self, node: UnaryOp):
+        return (node.expr,)
 
-        operator_map = {
-            "not": "NOT",
-            "+": "+",
-            "-": "-"
-        }
+    def leave_UnaryOp(self, node: UnaryOp):
+        node.text = f"({self.unary_operator_map[node.op]} {node.expr.text})"
 
-        node.text = f"({operator_map[node.op]} {node.expr.text})"
 
+    def enter_BinaryOp(self, node: BinaryOp):
+        return node.lvalue, node.rvalue
 
-    def visit_BinaryOp(self, node: BinaryOp):
-        self.visit(node.lvalue)
-        self.visit(node.rvalue)
+    def leave_BinaryOp(self, node: BinaryOp):
+        node.text = f"({node.lvalue.text} {self.binary_operator_map[node.op]} {node.rvalue.text})"
 
-        operator_map = {
-            "<": "<",
-            "<=": "<=",
-            ">": ">",
-            ">=": ">=",
-            "=": "=",
-            "!=": "<>",
-            "and": "AND",
-            "or": "OR",
-        }
+    def enter_Range(self, node: Range):
+        return node.data, node.lower, node.upper
 
-        node.text = f"({node.lvalue.text} {operator_map[node.op]} {node.rvalue.text})"
-
-    def visit_Range(self, node: Range):
+    def leave_Range(self, node: Range):
         data = node.data
         lower = node.lower
         upper = node.upper
-        self.visit(data)
-        self.visit(lower)
-        self.visit(upper)
-
         lower_op = "<=" if node.include_lower else "<"
         upper_op = "<=" if node.include_upper else "<"
 
         node.text = f"({lower.text} {lower_op} {data.text} AND {data.text} {upper_op} {upper.text})"
 
-    def visit_ID(self, node: ID):
+    def enter_InList(self, node: InList):
+        return (node.data, *node.values)
+
+    def leave_InList(self, node: InList):
+        values = ", ".join(str(value.text) for value in node.values)
+        node.text = f"({node.data.text} IN ({values}))"
+
+    def leave_ID(self, node: ID):
         node.text = node.name
 
-    def visit_Constant(self, node: Constant):
+    def leave_Constant(self, node: Constant):
         node.text = node.value
 
-    def visit_Order(self, node: Order):
+    def enter_Order(self, node: Order):
+        return node.orderings
+
+    def leave_Order(self, node: Order):
         order = ""
         for i, expression in enumerate(node.orderings):
-            self.visit(expression)
             order += f"{expression.text}"
             if node.descending[i]:
                 order += " DESC"
@@ -86,8 +97,10 @@ class TranslationVisitorExtended(NodeVisitor):
         node.text = f"ORDER BY {order}"
 
 
-    def visit_Filter(self, node: Filter):
-        self.visit(node.expression)
+    def enter_Filter(self, node: Filter):
+        return (node.expression,)
+
+    def leave_Filter(self, node: Filter):
         node.text = f"WHERE {node.expression.text}"
 
 
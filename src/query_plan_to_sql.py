@@ -1,50 +1,87 @@
 import sys
 import argparse
-from typing import Any
+import json
+from typing import Any, Iterable, Sequence, TextIO
 
-from src.simple.lexer import QPLexer
-from src.simple.parser import QPParser
-from src.simple.semantic import SemanticVisitor
-from src.simple.translate import TranslationVisitor
-
-from src.extended.lexer import QPLexerExtended
-from src.extended.parser import QPParserExtended
-from src.extended.semantic import SemanticVisitorExtended
-from src.extended.translate import TranslationVisitorExtended
+from src.batch import TranslationResult, translate_many, translate_ndjson
+from src.cache import TranslationCache
+from src.segy.headers import HeaderRegistry
+from src.translator import PIPELINES, Translator
+from src.utils.diagnostics import Diagnostic, print_diagnostic
+from src.utils.parameters import PARAMSTYLES, ParameterizedSQL
 
 
 class QueryPlanToSQL:
-    def translate(self, query_plan: str, version=2) -> str | None:
-        if version == 1:
-            lexer = QPLexer()
-            parser = QPParser(lexer)
-            semantic_visitor = SemanticVisitor()
-            translation_visitor = TranslationVisitor()
-        elif version == 2:
-            lexer = QPLexerExtended()
-            parser = QPParserExtended(lexer)
-            semantic_visitor = SemanticVisitorExtended()
-            translation_visitor = TranslationVisitorExtended()
-        else:
+    def __init__(self, cache_entries: int = 1024, cache_size: int = 64 * 1024 * 1024, lexer_backend: str = "sly",
+                 print_errors: bool = True, ast_backend: str = "objects", paramstyle: str = None,
+                 optimize: bool = False, value_table_threshold: int = None, sargable: bool = False,
+                 key_columns: Sequence[str] = None, registry: HeaderRegistry = None):
+        """
+        I create an instance of this class.
+
+        :param cache_entries: maximum number of cached translations, 0 disables the cache.
+        :param cache_size: maximum approximate memory, in bytes, held by the cache.
+        :param lexer_backend: lexer implementation, "sly" or "scanner" (version 2 only).
+        :param print_errors: print errors to stdout as they are reported. They are always
+            available as structured diagnostics in `diagnostics`.
+        :param ast_backend: AST representation, "objects" or "arena" (version 2 only).
+        :param paramstyle: when given ("qmark", "numeric" or "format"), constants are replaced by placeholders
+            and translations are `ParameterizedSQL` tuples of the SQL, its parameters and its shape.
+        :param optimize: simplify the filters of version 2 plans before translating them.
+        :param value_table_threshold: with optimize, IN lists with more values are emitted as a subquery on a
+            table of values declared in a WITH clause.
+        :param sargable: write version 2 predicates so an index on the identifier can answer them.
+        :param key_columns: select these columns (such as the file id and trace index) and the identifiers the
+            plan uses instead of every column.
+        :param registry: SEG-Y trace header fields the identifiers must name, unknown ones are semantic errors.
+        """
+        self.cache = TranslationCache(cache_entries, cache_size) if cache_entries > 0 else None
+        self.lexer_backend = lexer_backend
+        self.print_errors = print_errors
+        self.ast_backend = ast_backend
+        self.paramstyle = paramstyle
+        self.optimize = optimize
+        self.value_table_threshold = value_table_threshold
+        self.sargable = sargable
+        self.key_columns = key_columns
+        self.registry = registry
+        self._translators: dict[tuple[int, bool], Translator] = {}
+
+    def get_translator(self, version=2, quiet=False) -> Translator:
+        """Return the warm, reusable translator for the given version, a quiet one never prints errors."""
+        quiet = quiet or not self.print_errors
+        translator = self._translators.get((version, quiet))
+        if translator is None:
+            printer = None if quiet else print_diagnostic
+            translator = Translator(version, self.cache, self.lexer_backend, printer, self.ast_backend, self.paramstyle,
+                                    self.optimize, self.value_table_threshold, self.sargable, self.key_columns,
+                                    self.registry)
+            self._translators[(version, quiet)] = translator
+        return translator
+
+    def diagnostics(self, version=2) -> list[Diagnostic]:
+        """Return the errors reported by the last translation of the given version made by this thread."""
+        return self.get_translator(version).diagnostics
+
+    def translate(self, query_plan: str, version=2) -> str | ParameterizedSQL | None:
+        if version not in PIPELINES:
             print("Version not supported")
             return
+        return self.get_translator(version).translate(query_plan)
 
-        tokens = lexer.tokenize(query_plan)
-        if lexer.has_error():
-            return
-        ast = parser.parse(tokens)
-        if parser.has_error():
-            return
-        semantic_visitor.visit(ast)
-        if semantic_visitor.has_error():
-            return
-        translation_visitor.visit(ast)
-        return ast.text
+    def translate_many(self, query_plans: Iterable[str], version=2, workers: int = None,
+                       chunksize: int = None) -> list[TranslationResult]:
+        """Translate many query plans in parallel worker processes, see `src.batch.translate_many`."""
+        return translate_many(query_plans, version, workers, chunksize, self.lexer_backend, self.ast_backend,
+                              self.paramstyle, self.optimize, self.value_table_threshold, self.sargable,
+                              self.key_columns, self.registry)
 
+    def translate_ndjson(self, in_file: TextIO, out_file: TextIO, version=2) -> int:
+        """Translate a stream of NDJSON records, see `src.batch.translate_ndjson`."""
+        return translate_ndjson(in_file, out_file, self.get_translator(version, quiet=True))
 
-if __name__ == "__main__":
-    qptsql = QueryPlanToSQL()
 
+if __name__ == "__main__":
     parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
     parser.add_argument("-i", "--input-file", dest="input_file", help="Path to query plan file", default=None)
@@ -52,9 +89,42 @@ if __name__ == "__main__":
     parser.add_argument("-p", "--print", dest="print_result", action="store_true", help="Print resulting SQL query")
     parser.add_argument("-q", "--query-plan", dest="query_plan", default=None, help="Pass SQL as parameter")
     parser.add_argument("-v", "--version", dest="version", help="Query Plan version: 1 (simple) or 2 (extended)", default=2)
+    parser.add_argument("--ndjson", dest="ndjson", action="store_true",
+                        help="Stream newline-delimited JSON records ({\"id\": ..., \"plan\": ...}) from the input file "
+                             "(or stdin) and write one JSON result per record to the output file (or stdout)")
+    parser.add_argument("-l", "--lexer", dest="lexer_backend", choices=("sly", "scanner"), default="sly",
+                        help="Lexer implementation, the hand-written scanner is only available for version 2")
+    parser.add_argument("--ast", dest="ast_backend", choices=("objects", "arena"), default="objects",
+                        help="AST representation, the array-backed arena is only available for version 2")
+    parser.add_argument("--paramstyle", dest="paramstyle", choices=sorted(PARAMSTYLES), default=None,
+                        help="Replace constants by placeholders of this style, the parameters are written as a JSON "
+                             "list on the line after the SQL")
+    parser.add_argument("-O", "--optimize", dest="optimize", action="store_true",
+                        help="Simplify the filter before translating it and report the rewrites to stderr "
+                             "(version 2 only)")
+    parser.add_argument("--value-table-threshold", dest="value_table_threshold", type=int, default=None,
+                        help="With --optimize, emit IN lists with more values as a subquery on a table of values")
+    parser.add_argument("--sargable", dest="sargable", action="store_true",
+                        help="Write predicates an index on the identifier can answer: signed literals, identifier on "
+                             "the left, BETWEEN and minimal parentheses (version 2 only)")
+    parser.add_argument("--key-columns", dest="key_columns", nargs="*", default=None, metavar="COLUMN",
+                        help="Select these columns and the identifiers the plan uses instead of every column")
+    parser.add_argument("--segy-revision", dest="segy_revision", type=int, choices=(0, 1, 2), default=None,
+                        help="Reject identifiers that are not trace header fields of this SEG-Y revision")
 
 
     args = parser.parse_args()
+    qptsql = QueryPlanToSQL(lexer_backend=args.lexer_backend, ast_backend=args.ast_backend, paramstyle=args.paramstyle,
+                            optimize=args.optimize, value_table_threshold=args.value_table_threshold,
+                            sargable=args.sargable, key_columns=args.key_columns,
+                            registry=None if args.segy_revision is None else HeaderRegistry(revision=args.segy_revision))
+    if args.ndjson:
+        in_file = open(args.input_file) if args.input_file else sys.stdin
+        out_file = open(args.output_file, 'w') if args.output_file else sys.stdout
+        with in_file, out_file:
+            qptsql.translate_ndjson(in_file, out_file, int(args.version))
+        sys.exit(0)
+
     query_plan = args.query_plan
     if args.input_file:
         f = open(args.input_file)
@@ -64,9 +134,14 @@ if __name__ == "__main__":
         print("Missing query plan")
         sys.exit(1)
     translation = qptsql.translate(query_plan, int(args.version))
+    if args.optimize:
+        for name, count in sorted(qptsql.get_translator(int(args.version)).rewrites.items()):
+            print("%s: %d" % (name, count), file=sys.stderr)
     if not translation:
         print()
     else:
+        if args.paramstyle:
+            translation = translation.sql + "\n" + json.dumps(translation.parameters)
         if args.output_file:
             f = open(args.output_file, 'w')
             f.write(translation)
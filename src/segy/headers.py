@@ -0,0 +1,256 @@
+import re
+import sys
+import argparse
+import hashlib
+from collections import namedtuple
+from typing import Iterable, Iterator
+
+# Size in bytes of a SEG-Y trace header, and of each additional trace header of rev2
+TRACE_HEADER_SIZE = 240
+# Size in bytes of the trace header followed by the rev2 standard trace header extension 1
+EXTENDED_TRACE_HEADER_SIZE = 2 * TRACE_HEADER_SIZE
+
+# Widths in bytes of the integer fields a trace header can hold
+FIELD_WIDTHS = (1, 2, 4, 8)
+
+# Names a field can be referred to by in a Query Plan, as matched by the lexers
+IDENTIFIER = re.compile(r"[a-zA-Z][0-9a-zA-Z_]*\Z")
+
+HeaderField = namedtuple("HeaderField", ["name", "offset", "width", "signed", "aliases", "scalar", "revision"])
+HeaderField.__doc__ = """
+Integer field of the SEG-Y trace header, stored big-endian.
+
+The offset counts from 0 at the start of the header, so bytes 1-4 of the
+standard are at offset 0. The scalar is the name of the field holding the
+scalar to apply to the value, if any, and the revision is the first SEG-Y
+revision defining the field, None for custom fields.
+"""
+HeaderField.byte = property(lambda self: self.offset + 1,
+                            doc="Position of the first byte, counting from 1 as the standard does.")
+HeaderField.dtype = property(lambda self: "%s%s%d" % (">", "i" if self.signed else "u", self.width),
+                             doc="NumPy type string of the stored value, e.g. '>i4'.")
+HeaderField.limits = property(lambda self: (-(1 << (8 * self.width - 1)), (1 << (8 * self.width - 1)) - 1)
+                              if self.signed else (0, (1 << (8 * self.width)) - 1),
+                              doc="Smallest and largest values the field can store.")
+
+
+def _field(name: str, byte: int, width: int, aliases: tuple[str, ...] = (), scalar: str = None,
+           signed: bool = True, revision: int = 0) -> HeaderField:
+    return HeaderField(name, byte - 1, width, signed, aliases, scalar, revision)
+
+
+_ELEVATION_SCALAR = "elevation_scalar"
+_COORDINATE_SCALAR = "coordinate_scalar"
+_TIME_SCALAR = "time_scalar"
+
+# Trace header fields of SEG-Y rev0 (bytes 1-180) and rev1 (bytes 181-232), by position, followed by the integer
+# fields of the rev2 standard trace header extension 1 (bytes 241-480, the first additional trace header). The
+# aliases are the Seismic Unix names and the names used by segyio and other common readers. Sample count and
+# interval are unsigned, as rev2 defines them, which reads rev0/rev1 files the same for any valid value. The
+# extension fields stored as IEEE doubles (elevations, coordinates, sample interval) are not integers and are left out.
+STANDARD_FIELDS = (
+    _field("trace_sequence_line", 1, 4, ("tracl",)),
+    _field("trace_sequence_file", 5, 4, ("tracr",)),
+    _field("field_record", 9, 4, ("fldr", "ffid")),
+    _field("trace_number", 13, 4, ("tracf",)),
+    _field("energy_source_point", 17, 4, ("ep",)),
+    _field("cdp", 21, 4, ("ensemble",)),
+    _field("cdp_trace", 25, 4, ("cdpt",)),
+    _field("trace_identification_code", 29, 2, ("trid",)),
+    _field("vertically_summed_traces", 31, 2, ("nvs",)),
+    _field("horizontally_stacked_traces", 33, 2, ("nhs",)),
+    _field("data_use", 35, 2, ("duse",)),
+    _field("offset", 37, 4),
+    _field("receiver_group_elevation", 41, 4, ("gelev", "elev"), _ELEVATION_SCALAR),
+    _field("source_surface_elevation", 45, 4, ("selev",), _ELEVATION_SCALAR),
+    _field("source_depth", 49, 4, ("sdepth",), _ELEVATION_SCALAR),
+    _field("receiver_datum_elevation", 53, 4, ("gdel",), _ELEVATION_SCALAR),
+    _field("source_datum_elevation", 57, 4, ("sdel",), _ELEVATION_SCALAR),
+    _field("source_water_depth", 61, 4, ("swdep",), _ELEVATION_SCALAR),
+    _field("group_water_depth", 65, 4, ("gwdep",), _ELEVATION_SCALAR),
+    _field(_ELEVATION_SCALAR, 69, 2, ("scalel",)),
+    _field(_COORDINATE_SCALAR, 71, 2, ("scalco",)),
+    _field("source_x", 73, 4, ("sx",), _COORDINATE_SCALAR),
+    _field("source_y", 77, 4, ("sy",), _COORDINATE_SCALAR),
+    _field("group_x", 81, 4, ("gx",), _COORDINATE_SCALAR),
+    _field("group_y", 85, 4, ("gy",), _COORDINATE_SCALAR),
+    _field("coordinate_units", 89, 2, ("counit",)),
+    _field("weathering_velocity", 91, 2, ("wevel",)),
+    _field("subweathering_velocity", 93, 2, ("swevel",)),
+    _field("source_uphole_time", 95, 2, ("sut",), _TIME_SCALAR),
+    _field("group_uphole_time", 97, 2, ("gut",), _TIME_SCALAR),
+    _field("source_static_correction", 99, 2, ("sstat",), _TIME_SCALAR),
+    _field("group_static_correction", 101, 2, ("gstat",), _TIME_SCALAR),
+    _field("total_static_applied", 103, 2, ("tstat",), _TIME_SCALAR),
+    _field("lag_time_a", 105, 2, ("laga",), _TIME_SCALAR),
+    _field("lag_time_b", 107, 2, ("lagb",), _TIME_SCALAR),
+    _field("delay_recording_time", 109, 2, ("delrt",), _TIME_SCALAR),
+    _field("mute_time_start", 111, 2, ("muts",), _TIME_SCALAR),
+    _field("mute_time_end", 113, 2, ("mute",), _TIME_SCALAR),
+    _field("sample_count", 115, 2, ("ns",), signed=False),
+    _field("sample_interval", 117, 2, ("dt",), signed=False),
+    _field("gain_type", 119, 2, ("gain",)),
+    _field("instrument_gain_constant", 121, 2, ("igc",)),
+    _field("instrument_initial_gain", 123, 2, ("igi",)),
+    _field("correlated", 125, 2, ("corr",)),
+    _field("sweep_frequency_start", 127, 2, ("sfs",)),
+    _field("sweep_frequency_end", 129, 2, ("sfe",)),
+    _field("sweep_length", 131, 2, ("slen",)),
+    _field("sweep_type", 133, 2, ("styp",)),
+    _field("sweep_taper_length_start", 135, 2, ("stas",)),
+    _field("sweep_taper_length_end", 137, 2, ("stae",)),
+    _field("taper_type", 139, 2, ("tatyp",)),
+    _field("alias_filter_frequency", 141, 2, ("afilf",)),
+    _field("alias_filter_slope", 143, 2, ("afils",)),
+    _field("notch_filter_frequency", 145, 2, ("nofilf",)),
+    _field("notch_filter_slope", 147, 2, ("nofils",)),
+    _field("low_cut_frequency", 149, 2, ("lcf",)),
+    _field("high_cut_frequency", 151, 2, ("hcf",)),
+    _field("low_cut_slope", 153, 2, ("lcs",)),
+    _field("high_cut_slope", 155, 2, ("hcs",)),
+    _field("year", 157, 2),
+    _field("day_of_year", 159, 2, ("day",)),
+    _field("hour", 161, 2),
+    _field("minute", 163, 2),
+    _field("second", 165, 2, ("sec",)),
+    _field("time_basis_code", 167, 2, ("timbas",)),
+    _field("trace_weighting_factor", 169, 2, ("trwf",)),
+    _field("geophone_group_roll1", 171, 2, ("grnors",)),
+    _field("geophone_group_first_trace", 173, 2, ("grnofr",)),
+    _field("geophone_group_last_trace", 175, 2, ("grnlof",)),
+    _field("gap_size", 177, 2, ("gaps",)),
+    _field("over_travel", 179, 2, ("otrav",)),
+    _field("cdp_x", 181, 4, ("coord_x",), _COORDINATE_SCALAR, revision=1),
+    _field("cdp_y", 185, 4, ("coord_y",), _COORDINATE_SCALAR, revision=1),
+    _field("inline", 189, 4, ("iline", "inline_3d"), revision=1),
+    _field("crossline", 193, 4, ("xline", "crossline_3d"), revision=1),
+    _field("shot_point", 197, 4, ("sp",), "shot_point_scalar", revision=1),
+    _field("shot_point_scalar", 201, 2, revision=1),
+    _field("trace_value_measurement_unit", 203, 2, revision=1),
+    _field("transduction_constant_mantissa", 205, 4, revision=1),
+    _field("transduction_constant_exponent", 209, 2, revision=1),
+    _field("transduction_units", 211, 2, revision=1),
+    _field("device_trace_identifier", 213, 2, revision=1),
+    _field(_TIME_SCALAR, 215, 2, revision=1),
+    _field("source_type_orientation", 217, 2, revision=1),
+    _field("source_energy_direction_vertical", 219, 2, revision=1),
+    _field("source_energy_direction_crossline", 221, 2, revision=1),
+    _field("source_energy_direction_inline", 223, 2, revision=1),
+    _field("source_measurement_mantissa", 225, 4, revision=1),
+    _field("source_measurement_exponent", 229, 2, revision=1),
+    _field("source_measurement_unit", 231, 2, revision=1),
+    _field("extended_trace_sequence_line", 241, 8, revision=2),
+    _field("extended_trace_sequence_file", 249, 8, revision=2),
+    _field("extended_field_record", 257, 8, ("extended_ffid",), revision=2),
+    _field("extended_cdp", 265, 8, ("extended_ensemble",), revision=2),
+    _field("extended_sample_count", 377, 4, ("extended_ns",), signed=False, revision=2),
+    _field("second_nanoseconds", 381, 4, revision=2),
+    _field("cable_number", 393, 4, revision=2),
+    _field("additional_trace_header_number", 397, 2, revision=2),
+    _field("last_trace_flag", 399, 2, revision=2),
+)
+
+
+class HeaderRegistry:
+    """
+    Trace header fields a Query Plan can refer to, by name or alias.
+
+    Names are matched without regard to case, as SQL matches column names, so
+    ``CDP_X``, ``cdp_x`` and ``coord_x`` all name the same field. Standard fields
+    up to ``revision`` are registered on creation, rev2 adding the fields of the
+    standard trace header extension 1; custom fields, such as those an
+    acquisition contractor stores in the unassigned bytes 233-240, are added
+    with `register`. Fields can lie in the first ``EXTENDED_TRACE_HEADER_SIZE``
+    bytes of the trace headers.
+    """
+
+    def __init__(self, fields: Iterable[HeaderField] = None, revision: int = 1):
+        """
+        I create an instance of this class.
+
+        :param fields: initial fields, the standard ones by default.
+        :param revision: newest SEG-Y revision whose standard fields are registered when no fields are given.
+        """
+        self._fields: dict[str, HeaderField] = {}
+        self._names: dict[str, HeaderField] = {}
+        self._signature = None
+        if fields is None:
+            fields = [field for field in STANDARD_FIELDS if field.revision <= revision]
+        for field in fields:
+            self._add(field)
+
+    def _add(self, field: HeaderField):
+        names = [field.name, *field.aliases]
+        for name in names:
+            if not IDENTIFIER.match(name):
+                raise ValueError("Invalid header field name: %r" % name)
+            if name.lower() in self._names:
+                raise ValueError("Header field %s is already registered" % name)
+        if field.width not in FIELD_WIDTHS:
+            raise ValueError("Header field %s has an invalid width: %s" % (field.name, field.width))
+        if field.offset < 0 or field.offset + field.width > EXTENDED_TRACE_HEADER_SIZE:
+            raise ValueError("Header field %s does not fit in the %d byte trace headers" %
+                             (field.name, EXTENDED_TRACE_HEADER_SIZE))
+        if field.offset // TRACE_HEADER_SIZE != (field.offset + field.width - 1) // TRACE_HEADER_SIZE:
+            raise ValueError("Header field %s crosses the end of a %d byte trace header" % (field.name,
+                                                                                         TRACE_HEADER_SIZE))
+        self._fields[field.name.lower()] = field
+        for name in names:
+            self._names[name.lower()] = field
+        self._signature = None
+
+    def register(self, name: str, byte: int, width: int, signed: bool = True, aliases: Iterable[str] = (),
+                 scalar: str = None) -> HeaderField:
+        """
+        Add a custom field and return it.
+
+        :param name: name of the field in Query Plans.
+        :param byte: position of its first byte, counting from 1 as the standard does.
+        :param width: size in bytes, 1, 2, 4 or 8.
+        :param signed: whether the value is a two's complement integer.
+        :param aliases: other names of the field.
+        :param scalar: name of the field holding the scalar to apply to the value, if any.
+        """
+        if scalar is not None and scalar not in self:
+            raise ValueError("Unknown scalar field %s of header field %s" % (scalar, name))
+        field = HeaderField(name, byte - 1, width, signed, tuple(aliases), scalar, None)
+        self._add(field)
+        return field
+
+    def get(self, name: str) -> HeaderField | None:
+        """Field named or aliased name, or None if there is none."""
+        return self._names.get(name.lower())
+
+    def __getitem__(self, name: str) -> HeaderField:
+        field = self.get(name)
+        if field is None:
+            raise KeyError(name)
+        return field
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._names
+
+    def __iter__(self) -> Iterator[HeaderField]:
+        return iter(self._fields.values())
+
+    def __len__(self):
+        return len(self._fields)
+
+    @property
+    def signature(self) -> str:
+        """Stable key of the registered fields, equal for registries accepting the same names."""
+        if self._signature is None:
+            names = sorted(self._names)
+            self._signature = hashlib.blake2b(" ".join(names).encode(), digest_size=8).hexdigest()
+        return self._signature
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser(description="List the SEG-Y trace header fields known to the registry")
+    parser.add_argument("--revision", type=int, default=1, choices=(0, 1, 2), help="newest SEG-Y revision listed")
+    args = parser.parse_args()
+
+    for field in HeaderRegistry(revision=args.revision):
+        sys.stdout.write("%3d-%-3d %-4s %-36s %s\n" % (field.byte, field.byte + field.width - 1, field.dtype,
+                                                      field.name, ", ".join(field.aliases)))
@@ -0,0 +1,218 @@
+import sys
+import argparse
+import pathlib
+import struct
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from src.segy.headers import TRACE_HEADER_SIZE, HeaderField, HeaderRegistry
+
+# Size in bytes of the textual file header and of each extended textual header
+TEXTUAL_HEADER_SIZE = 3200
+# Size in bytes of the binary file header, which follows the textual one
+BINARY_HEADER_SIZE = 400
+
+# Binary file header fields: name -> (position of the first byte in the file, counting from 1, struct format)
+BINARY_HEADER_FIELDS = {
+    "sample_interval": (3217, "H"),
+    "sample_count": (3221, "H"),
+    "sample_format": (3225, "h"),
+    "extended_sample_count": (3269, "I"),
+    "byte_order": (3297, "I"),
+    "revision": (3501, "B"),
+    "fixed_length_traces": (3503, "h"),
+    "extended_textual_headers": (3505, "h"),
+    "additional_trace_headers": (3507, "h"),
+}
+
+# Data sample format code -> size in bytes of a sample
+SAMPLE_SIZES = {
+    1: 4,  # IBM float
+    2: 4,  # int32
+    3: 2,  # int16
+    4: 4,  # fixed point with gain (obsolete)
+    5: 4,  # IEEE float
+    6: 8,  # IEEE double (rev2)
+    7: 3,  # int24 (rev2)
+    8: 1,  # int8
+    9: 8,  # int64 (rev2)
+    10: 4,  # uint32 (rev2)
+    11: 2,  # uint16 (rev2)
+    12: 8,  # uint64 (rev2)
+    15: 3,  # uint24 (rev2)
+    16: 1,  # uint8 (rev2)
+}
+
+# Value of the rev2 byte order constant when it is read in the byte order of the file
+BYTE_ORDER_CONSTANT = 0x01020304
+
+
+class SegyReader:
+    """
+    Columnar reader of the trace headers of a SEG-Y file with fixed length traces.
+
+    The file is memory-mapped and the trace count and stride are derived from the
+    binary file header, so a header field of every trace is a strided view of
+    the mapping: one element per trace, ``trace_stride`` bytes apart. `column`
+    copies such a view into a native NumPy array in a single vectorized pass, and
+    only the pages holding the requested bytes are read from disk.
+
+    Files are big-endian unless the rev2 byte order constant says otherwise.
+    Fields of the rev2 trace header extension can only be read from files
+    declaring additional trace headers.
+    """
+
+    def __init__(self, path, registry: HeaderRegistry = None):
+        """
+        I create an instance of this class.
+
+        :param path: path to the SEG-Y file.
+        :param registry: trace header fields that can be read by name, the standard ones up to rev2 by default.
+        """
+        self.path = pathlib.Path(path)
+        self.registry = HeaderRegistry(revision=2) if registry is None else registry
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        if len(self._data) < TEXTUAL_HEADER_SIZE + BINARY_HEADER_SIZE:
+            raise ValueError("%s is too short to be a SEG-Y file" % self.path)
+
+        self.byteorder = ">"
+        if self._binary_field("byte_order") != BYTE_ORDER_CONSTANT and \
+                self._binary_field("byte_order", "<") == BYTE_ORDER_CONSTANT:
+            self.byteorder = "<"
+        # major revision number, a single byte in any byte order
+        self.revision = self._binary_field("revision")
+        self.sample_interval = self._binary_field("sample_interval")
+        self.sample_format = self._binary_field("sample_format")
+        self.sample_count = self._binary_field("sample_count")
+        if self.revision >= 2 and self.sample_count == 0:
+            self.sample_count = self._binary_field("extended_sample_count")
+        if self.sample_format not in SAMPLE_SIZES:
+            raise ValueError("Unknown data sample format code %d in %s" % (self.sample_format, self.path))
+
+        extended_textual_headers = additional_trace_headers = 0
+        if self.revision >= 1:
+            extended_textual_headers = self._binary_field("extended_textual_headers")
+            if extended_textual_headers < 0:
+                raise ValueError("Variable number of extended textual headers in %s is not supported" % self.path)
+            if self._binary_field("fixed_length_traces") == 0:
+                raise ValueError("Variable length traces in %s are not supported" % self.path)
+        if self.revision >= 2:
+            additional_trace_headers = self._binary_field("additional_trace_headers")
+        self.data_offset = TEXTUAL_HEADER_SIZE + BINARY_HEADER_SIZE + TEXTUAL_HEADER_SIZE * extended_textual_headers
+        self.trace_header_size = TRACE_HEADER_SIZE * (1 + additional_trace_headers)
+        self.trace_stride = self.trace_header_size + self.sample_count * SAMPLE_SIZES[self.sample_format]
+        self.trace_count, rest = divmod(len(self._data) - self.data_offset, self.trace_stride)
+        if rest:
+            raise ValueError("Size of %s is not a whole number of %d byte traces, only fixed length traces are "
+                             "supported" % (self.path, self.trace_stride))
+
+    def _binary_field(self, name: str, byteorder: str = None) -> int:
+        byte, fmt = BINARY_HEADER_FIELDS[name]
+        fmt = (self.byteorder if byteorder is None else byteorder) + fmt
+        return struct.unpack_from(fmt, self._data, byte - 1)[0]
+
+    def _field(self, field: str | HeaderField) -> HeaderField:
+        return self.registry[field] if isinstance(field, str) else field
+
+    def view(self, field: str | HeaderField) -> np.ndarray:
+        """Read-only strided view of a header field of every trace, in the byte order of the file, without copying."""
+        field = self._field(field)
+        if field.offset + field.width > self.trace_header_size:
+            raise ValueError("Header field %s is not in the %d byte trace headers of %s" %
+                             (field.name, self.trace_header_size, self.path))
+        dtype = np.dtype(self.byteorder + field.dtype[1:])
+        if self.trace_count == 0:
+            return np.empty(0, dtype)
+        return np.ndarray((self.trace_count,), dtype, buffer=self._data, offset=self.data_offset + field.offset,
+                          strides=(self.trace_stride,))
+
+    def column(self, field: str | HeaderField) -> np.ndarray:
+        """Contiguous array of a header field of every trace, in native byte order."""
+        view = self.view(field)
+        return view.astype(view.dtype.newbyteorder("="))
+
+    def columns(self, fields: Iterable[str | HeaderField]) -> dict[str, np.ndarray]:
+        """Columns of the given fields by the names they were requested with."""
+        return {field if isinstance(field, str) else field.name: self.column(field) for field in fields}
+
+    def close(self):
+        """Release the mapping of the file, views and columns read before stay valid."""
+        self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.trace_count
+
+
+def read_columns(path, fields: Iterable[str], registry: HeaderRegistry = None) -> dict[str, np.ndarray]:
+    """Return the columns of the given trace header fields of every trace of a SEG-Y file, see `SegyReader`."""
+    with SegyReader(path, registry) as reader:
+        return reader.columns(fields)
+
+
+def write_segy(path, columns: Mapping[str, np.ndarray], sample_count: int = 0, sample_format: int = 5,
+               registry: HeaderRegistry = None, revision: int = 1, byteorder: str = ">"):
+    """
+    Write a SEG-Y file whose traces have the given header values and zero samples.
+
+    Meant for tests and benchmarks: every column holds one value per trace, the
+    other header fields and the textual header are left blank. Fields of the
+    rev2 trace header extension add one additional trace header to every trace.
+    """
+    registry = HeaderRegistry(revision=2) if registry is None else registry
+    trace_count = len(next(iter(columns.values()))) if columns else 0
+    fields = [registry[name] for name in columns]
+    additional_trace_headers = max([(field.offset + field.width - 1) // TRACE_HEADER_SIZE for field in fields],
+                                   default=0)
+    if additional_trace_headers and revision < 2:
+        raise ValueError("Additional trace headers need SEG-Y revision 2")
+    stride = TRACE_HEADER_SIZE * (1 + additional_trace_headers) + sample_count * SAMPLE_SIZES[sample_format]
+    traces = np.zeros((trace_count, stride), dtype=np.uint8)
+    for field, values in zip(fields, columns.values()):
+        dtype = np.dtype(byteorder + field.dtype[1:])
+        traces[:, field.offset:field.offset + field.width] = \
+            np.asarray(values).astype(dtype).view(np.uint8).reshape(trace_count, field.width)
+
+    binary_header = bytearray(BINARY_HEADER_SIZE)
+    for name, value in (("sample_interval", 4000), ("sample_count", sample_count), ("sample_format", sample_format),
+                        ("revision", revision), ("fixed_length_traces", 1)):
+        byte, fmt = BINARY_HEADER_FIELDS[name]
+        struct.pack_into(byteorder + fmt, binary_header, byte - 1 - TEXTUAL_HEADER_SIZE, value)
+    if revision >= 2:
+        for name, value in (("byte_order", BYTE_ORDER_CONSTANT), ("additional_trace_headers", additional_trace_headers)):
+            byte, fmt = BINARY_HEADER_FIELDS[name]
+            struct.pack_into(byteorder + fmt, binary_header, byte - 1 - TEXTUAL_HEADER_SIZE, value)
+    with open(path, "wb") as f:
+        f.write(b" " * TEXTUAL_HEADER_SIZE)
+        f.write(binary_header)
+        f.write(traces.tobytes())
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser(description="Print trace header fields of a SEG-Y file as CSV")
+    parser.add_argument("input_file", help="Path to the SEG-Y file", type=str)
+    parser.add_argument("-f", "--fields", nargs="+", default=["fldr", "tracf", "cdp", "offset"],
+                        help="Trace header fields to print, by name or alias")
+    parser.add_argument("-n", "--limit", type=int, default=None, help="Only print the first traces")
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    with SegyReader(input_path) as reader:
+        columns = reader.columns(args.fields)
+    sys.stdout.write(",".join(columns) + "\n")
+    np.savetxt(sys.stdout, np.column_stack(list(columns.values()))[:args.limit], fmt="%d", delimiter=",")
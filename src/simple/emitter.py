@@ -0,0 +1,135 @@
+import sys
+import argparse
+import pathlib
+from typing import Iterator, Sequence, TextIO
+from src.simple.parser import QPParser
+from src.simple.semantic import SemanticVisitor
+from src.simple.translate import TranslationVisitor
+from src.simple.qp_ast import *
+from src.utils.parameters import ParameterizedEmitter
+from src.utils.projection import node_identifiers, select_list
+
+
+class SQLEmitter:
+    """
+    Streaming SQL emitter for the Query Plan.
+
+    Produces the same SQL as TranslationVisitor, but in a single traversal
+    that writes fragments to one output instead of attaching the text of every
+    subtree to its node, so the work and memory are linear in the size of the SQL.
+
+    Each ``emit_<ClassName>`` method returns the parts of a node in output order:
+    strings are written as they are and nodes are expanded in turn, using an
+    explicit stack so the depth of the tree is not limited by recursion.
+
+    With ``key_columns`` the SELECT lists those columns and the identifiers the
+    plan uses instead of every column of the table.
+    """
+
+    unary_operator_map = TranslationVisitor.unary_operator_map
+    binary_operator_map = TranslationVisitor.binary_operator_map
+
+    def __init__(self, key_columns: Sequence[str] = None):
+        self.table_name = "Table"
+        self.key_columns = key_columns
+        self._method_cache = {}
+
+    def chunks(self, node: Node) -> Iterator[str]:
+        """Yield the SQL fragments of the tree rooted at node, in order."""
+        method_cache = self._method_cache
+        stack = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            item = pop()
+            if item.__class__ is str:
+                yield item
+                continue
+            emitter = method_cache.get(item.__class__)
+            if emitter is None:
+                emitter = method_cache[item.__class__] = getattr(self, "emit_" + item.__class__.__name__)
+            extend(reversed(emitter(item)))
+
+    def emit(self, node: Node, buf: TextIO = None) -> str | None:
+        """Return the SQL of the tree rooted at node, or write it to buf if one is given."""
+        if buf is not None:
+            buf.writelines(self.chunks(node))
+            return
+        return "".join(self.chunks(node))
+
+    def emit_Program(self, node: Program):
+        filter_step = ""
+        order_step = ""
+        for step in node.steps:
+            if isinstance(step, Filter):
+                filter_step = step
+            elif isinstance(step, Order):
+                order_step = step
+        return "SELECT ", self.select_list(node), " FROM ", self.table_name, " ", filter_step, " ", order_step, " ;"
+
+    def select_list(self, node: Program) -> str:
+        """Columns selected by the program, all of them unless key columns are given."""
+        if self.key_columns is None:
+            return "*"
+        return select_list(node_identifiers(node), self.key_columns)
+
+    def emit_EmptyStatement(self, node: EmptyStatement):
+        return ()
+
+    def emit_UnaryOp(self, node: UnaryOp):
+        return "(", self.unary_operator_map[node.op], " ", node.expr, ")"
+
+    def emit_BinaryOp(self, node: BinaryOp):
+        return "(", node.lvalue, " ", self.binary_operator_map[node.op], " ", node.rvalue, ")"
+
+    def emit_ID(self, node: ID):
+        return (node.name,)
+
+    def constant_sql(self, typename: str, value) -> str:
+        """SQL of a constant, its value written inline."""
+        return str(value)
+
+    def emit_Constant(self, node: Constant):
+        # the type is still the type name if the tree was not analysed
+        return (self.constant_sql(getattr(node.type, "typename", node.type), node.value),)
+
+    def emit_Order(self, node: Order):
+        parts = ["ORDER BY "]
+        for i, expression in enumerate(node.orderings):
+            if i:
+                parts.append(" , ")
+            parts.append(expression)
+        return parts
+
+    def emit_Filter(self, node: Filter):
+        return "WHERE ", node.expression
+
+
+class ParameterizedSQLEmitter(ParameterizedEmitter, SQLEmitter):
+    """SQLEmitter that writes placeholders for the constants and returns them as parameters."""
+
+
+if __name__ == "__main__":
+    # create argument parser
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_file", help="Path to file to be translated to SQL", type=str
+    )
+    args = parser.parse_args()
+
+    # get input path
+    input_file = args.input_file
+    input_path = pathlib.Path(input_file)
+
+    # check if file exists
+    if not input_path.exists():
+        print("Input", input_path, "not found", file=sys.stderr)
+        sys.exit(1)
+
+    p = QPParser()
+    # open file and parse it
+    with open(input_path) as f:
+        ast = p.parse_text(f.read())
+        visitor = SemanticVisitor()
+        visitor.visit(ast)
+        SQLEmitter().emit(ast, sys.stdout)
+        print()
@@ -1,27 +1,40 @@
 import argparse
+import bisect
 import pathlib
+import re
 import sys
-from sly import Lexer
+from src.utils.coord import Coord
+from src.utils.diagnostics import Diagnostics, print_diagnostic
+from src.utils.tables import PrecomputedTablesLexer
 
 
-class QPLexer(Lexer):
-    def __init__(self):
-        self._found_error = False
+class QPLexer(PrecomputedTablesLexer):
+    _tables_module = "src.simple.lextab"
+
+    # Diagnostic codes reported by the lexer
+    ILLEGAL_CHARACTER = 1
+    UNTERMINATED_COMMENT = 2
+    UNTERMINATED_STRING = 3
 
-    def _print_error(self, msg: str, x: int, y: int):
-        print("Lexical error: %s @ %d:%d" % (msg, x, y), file=sys.stdout)
+    def __init__(self, diagnostics: Diagnostics = None):
+        self.diagnostics = Diagnostics(print_diagnostic) if diagnostics is None else diagnostics
+        self._found_error = False
+        self._newlines = []
+        self._newlines_text = None
 
     def find_tok_column(self, token):
         """Find the column of the token in its line."""
-        last_cr = self.text.rfind('\n', 0, token.index)
-        if last_cr < 0:
-            last_cr = 0
+        if self._newlines_text is not self.text:
+            # index the newlines once per text, so each lookup is a binary search instead of a scan
+            self._newlines = [m.start() for m in re.finditer('\n', self.text)]
+            self._newlines_text = self.text
+        line = bisect.bisect_left(self._newlines, token.index)
+        last_cr = self._newlines[line - 1] if line else 0
         return token.index - last_cr
 
-    def _error(self, msg, token):
+    def _error(self, msg, token, code):
         self._found_error = True
-        location = self._make_tok_location(token)
-        self._print_error(msg, location[0], location[1])
+        self.diagnostics.report("lexer", code, msg, Coord(*self._make_tok_location(token)))
         self.index += 1
 
     def _make_tok_location(self, token):
@@ -102,7 +115,7 @@ class QPLexer(Lexer):
     @_('/-(.|\n)*')
     def unterminated_comment(self, t):
         msg = "Unterminated comment"
-        self._error(msg, t)
+        self._error(msg, t, self.UNTERMINATED_COMMENT)
 
     @_(r'[0-9]+[.][0-9]+')
     def REAL_CONST(self, t):
@@ -124,7 +137,7 @@ class QPLexer(Lexer):
     @_(r'\'|"')
     def unmatchedquote(self, t):
         msg = "Unterminated string"
-        self._error(msg, t)
+        self._error(msg, t, self.UNTERMINATED_STRING)
 
     PLUS = r'\+'
 
@@ -154,12 +167,12 @@ class QPLexer(Lexer):
 
     def error(self, t):
         msg = "Illegal character %s" % repr(t.value[0])
-        self._error(msg, t)
+        self._error(msg, t, self.ILLEGAL_CHARACTER)
 
     @_(r'\'|"')
     def unmatchedquote(self, t):
         msg = "Unterminated string"
-        self._error(msg, t)
+        self._error(msg, t, self.UNTERMINATED_STRING)
 
     # Scanner (used only for test)
     def scan(self, data):
@@ -175,6 +188,10 @@ class QPLexer(Lexer):
     def has_error(self) -> bool:
         return self._found_error
 
+    def reset(self):
+        """Clear the per-call error state so the instance can be reused."""
+        self._found_error = False
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,6 @@
+# Generated by src.utils.tables from the grammar in this package, do not edit.
+
+signature = 'a3b6de0cd87a9c796ff47d1fc1077d1920d35c543b8609cb91a49d31a5014a94'
+
+master_re = ('(?P<newlines>(\\n+))|(?P<ID>([a-zA-Z][0-9a-zA-Z_]*))|(?P<comment>(/\\-((\\-[^/])|([^(\\-)]))*\\-/)|(//.*))|(?P<unterminated_comment>(/-(.|\n'
+ ')*))|(?P<REAL_CONST>([0-9]+[.][0-9]+))|(?P<INT_CONST>([0-9]+))|(?P<CHAR_CONST>\\\'.\\\')|(?P<STRING_LITERAL>(\\"(\\\\.|[^"\\\\])*\\"))|(?P<unmatchedquote>(\\\'|"))|(?P<PLUS>\\+)|(?P<MINUS>-)|(?P<NE>!=)|(?P<LE><=)|(?P<LT><)|(?P<GE>>=)|(?P<GT>>)|(?P<EQ>=)|(?P<LPAREN>\\()|(?P<RPAREN>\\))|(?P<COMMA>\\,)|(?P<COLON>\\:)|(?P<SEMI>\\;)')
@@ -1,13 +1,16 @@
 import sys
 import argparse
 import pathlib
-from sly import Parser
+from src.utils.tables import PrecomputedTablesParser
 from src.simple.lexer import QPLexer
 from src.utils.coord import Coord
+from src.utils.diagnostics import Diagnostics
 from src.simple.qp_ast import *
 
 
-class QPParser(Parser):
+class QPParser(PrecomputedTablesParser):
+    _tables_module = "src.simple.parsetab"
+
     tokens = QPLexer.tokens
 
     precedence = (
@@ -22,18 +25,24 @@ class QPParser(Parser):
 
     start = 'program'
 
-    def __init__(self, lexer=QPLexer()):
+    # Diagnostic codes reported by the parser
+    UNEXPECTED_TOKEN = 1
+    UNEXPECTED_END = 2
+
+    def __init__(self, lexer: QPLexer = None, diagnostics: Diagnostics = None):
+        # each parser gets its own lexer, and so its own diagnostics, unless one is given
+        if lexer is None:
+            lexer = QPLexer(diagnostics)
         self.lex = lexer
+        # errors go to the same sink as the lexer's unless another one is given
+        self.diagnostics = lexer.diagnostics if diagnostics is None else diagnostics
         self._found_error = False
 
     def parse_text(self, text: str):
         return self.parse(self.lex.tokenize(text))
 
-    def _parser_error(self, msg: str, coord: Coord = None):
-        if coord is None:
-            print("Parser error: %s" % msg, file=sys.stdout)
-        else:
-            print("Parser error: %s %s" % (msg, coord), file=sys.stdout)
+    def _parser_error(self, msg: str, code: int, coord: Coord = None):
+        self.diagnostics.report("parser", code, msg, coord)
         self._found_error = True
 
     def _token_coord(self, p):
@@ -135,14 +144,20 @@ class QPParser(Parser):
     def error(self, p):
         if p:
             self._parser_error(
-                "Before %s" % p.value, Coord(p.lineno, self.lex.find_tok_column(p))
+                "Before %s" % p.value, self.UNEXPECTED_TOKEN, Coord(p.lineno, self.lex.find_tok_column(p))
             )
         else:
-            self._parser_error("At the end of input (%s)" % self.lex.filename)
+            self._parser_error("At the end of input", self.UNEXPECTED_END)
 
     def has_error(self):
         return self._found_error
 
+    def reset(self):
+        """Clear the per-call error state and the position tracking tables SLY fills while parsing."""
+        self._found_error = False
+        self._line_positions = {}
+        self._index_positions = {}
+
 if __name__ == "__main__":
 
     # create argument parser
@@ -0,0 +1,417 @@
+# Generated by src.utils.tables from the grammar in this package, do not edit.
+
+signature = '60fd52b6c55c11e3c54952345844d3a537d8b89314aaf3fe156661471d562528'
+
+lr_action = {0: {'$end': -6, 'FILTER': 6, 'ORDER': 5},
+ 1: {'$end': 0},
+ 2: {'$end': -1},
+ 3: {'$end': -2, 'FILTER': 6},
+ 4: {'$end': -3, 'ORDER': 5},
+ 5: {'COLON': 9},
+ 6: {'COLON': 10},
+ 7: {'$end': -4},
+ 8: {'$end': -5},
+ 9: {'ID': 13},
+ 10: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 11: {'COMMA': 30, 'SEMI': 29},
+ 12: {'COMMA': -10, 'SEMI': -10},
+ 13: {'AND': -11,
+      'COMMA': -11,
+      'EQ': -11,
+      'GE': -11,
+      'GT': -11,
+      'LE': -11,
+      'LT': -11,
+      'NE': -11,
+      'OR': -11,
+      'RPAREN': -11,
+      'SEMI': -11},
+ 14: {'AND': 33, 'EQ': 35, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': 34, 'OR': 32, 'SEMI': 31},
+ 15: {'AND': -26,
+      'EQ': -26,
+      'GE': -26,
+      'GT': -26,
+      'LE': -26,
+      'LT': -26,
+      'NE': -26,
+      'OR': -26,
+      'RPAREN': -26,
+      'SEMI': -26},
+ 16: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 17: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 18: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 19: {'AND': -30,
+      'EQ': -30,
+      'GE': -30,
+      'GT': -30,
+      'LE': -30,
+      'LT': -30,
+      'NE': -30,
+      'OR': -30,
+      'RPAREN': -30,
+      'SEMI': -30},
+ 20: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 21: {'AND': -32,
+      'EQ': -32,
+      'GE': -32,
+      'GT': -32,
+      'LE': -32,
+      'LT': -32,
+      'NE': -32,
+      'OR': -32,
+      'RPAREN': -32,
+      'SEMI': -32},
+ 22: {'AND': -33,
+      'EQ': -33,
+      'GE': -33,
+      'GT': -33,
+      'LE': -33,
+      'LT': -33,
+      'NE': -33,
+      'OR': -33,
+      'RPAREN': -33,
+      'SEMI': -33},
+ 23: {'AND': -12,
+      'EQ': -12,
+      'GE': -12,
+      'GT': -12,
+      'LE': -12,
+      'LT': -12,
+      'NE': -12,
+      'OR': -12,
+      'RPAREN': -12,
+      'SEMI': -12},
+ 24: {'AND': -13,
+      'EQ': -13,
+      'GE': -13,
+      'GT': -13,
+      'LE': -13,
+      'LT': -13,
+      'NE': -13,
+      'OR': -13,
+      'RPAREN': -13,
+      'SEMI': -13},
+ 25: {'AND': -14,
+      'EQ': -14,
+      'GE': -14,
+      'GT': -14,
+      'LE': -14,
+      'LT': -14,
+      'NE': -14,
+      'OR': -14,
+      'RPAREN': -14,
+      'SEMI': -14},
+ 26: {'AND': -15,
+      'EQ': -15,
+      'GE': -15,
+      'GT': -15,
+      'LE': -15,
+      'LT': -15,
+      'NE': -15,
+      'OR': -15,
+      'RPAREN': -15,
+      'SEMI': -15},
+ 27: {'AND': -16,
+      'EQ': -16,
+      'GE': -16,
+      'GT': -16,
+      'LE': -16,
+      'LT': -16,
+      'NE': -16,
+      'OR': -16,
+      'RPAREN': -16,
+      'SEMI': -16},
+ 28: {'AND': -17,
+      'EQ': -17,
+      'GE': -17,
+      'GT': -17,
+      'LE': -17,
+      'LT': -17,
+      'NE': -17,
+      'OR': -17,
+      'RPAREN': -17,
+      'SEMI': -17},
+ 29: {'$end': -7, 'FILTER': -7},
+ 30: {'ID': 13},
+ 31: {'$end': -8, 'ORDER': -8},
+ 32: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 33: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 34: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 35: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 36: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 37: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 38: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 39: {'CHAR_CONST': 25,
+      'FALSE': 23,
+      'ID': 13,
+      'INT_CONST': 28,
+      'LPAREN': 20,
+      'MINUS': 17,
+      'NOT': 16,
+      'PLUS': 18,
+      'REAL_CONST': 27,
+      'STRING_LITERAL': 26,
+      'TRUE': 24},
+ 40: {'AND': -27,
+      'EQ': -27,
+      'GE': -27,
+      'GT': -27,
+      'LE': -27,
+      'LT': -27,
+      'NE': -27,
+      'OR': -27,
+      'RPAREN': -27,
+      'SEMI': -27},
+ 41: {'AND': -28,
+      'EQ': -28,
+      'GE': -28,
+      'GT': -28,
+      'LE': -28,
+      'LT': -28,
+      'NE': -28,
+      'OR': -28,
+      'RPAREN': -28,
+      'SEMI': -28},
+ 42: {'AND': -29,
+      'EQ': -29,
+      'GE': -29,
+      'GT': -29,
+      'LE': -29,
+      'LT': -29,
+      'NE': -29,
+      'OR': -29,
+      'RPAREN': -29,
+      'SEMI': -29},
+ 43: {'AND': 33, 'EQ': 35, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': 34, 'OR': 32, 'RPAREN': 53},
+ 44: {'COMMA': -9, 'SEMI': -9},
+ 45: {'AND': 33, 'EQ': 35, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': 34, 'OR': -18, 'RPAREN': -18, 'SEMI': -18},
+ 46: {'AND': -19, 'EQ': 35, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': 34, 'OR': -19, 'RPAREN': -19, 'SEMI': -19},
+ 47: {'AND': -20, 'EQ': -20, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': -20, 'OR': -20, 'RPAREN': -20, 'SEMI': -20},
+ 48: {'AND': -21, 'EQ': -21, 'GE': 36, 'GT': 37, 'LE': 38, 'LT': 39, 'NE': -21, 'OR': -21, 'RPAREN': -21, 'SEMI': -21},
+ 49: {'AND': -22,
+      'EQ': -22,
+      'GE': -22,
+      'GT': -22,
+      'LE': -22,
+      'LT': -22,
+      'NE': -22,
+      'OR': -22,
+      'RPAREN': -22,
+      'SEMI': -22},
+ 50: {'AND': -23,
+      'EQ': -23,
+      'GE': -23,
+      'GT': -23,
+      'LE': -23,
+      'LT': -23,
+      'NE': -23,
+      'OR': -23,
+      'RPAREN': -23,
+      'SEMI': -23},
+ 51: {'AND': -24,
+      'EQ': -24,
+      'GE': -24,
+      'GT': -24,
+      'LE': -24,
+      'LT': -24,
+      'NE': -24,
+      'OR': -24,
+      'RPAREN': -24,
+      'SEMI': -24},
+ 52: {'AND': -25,
+      'EQ': -25,
+      'GE': -25,
+      'GT': -25,
+      'LE': -25,
+      'LT': -25,
+      'NE': -25,
+      'OR': -25,
+      'RPAREN': -25,
+      'SEMI': -25},
+ 53: {'AND': -31,
+      'EQ': -31,
+      'GE': -31,
+      'GT': -31,
+      'LE': -31,
+      'LT': -31,
+      'NE': -31,
+      'OR': -31,
+      'RPAREN': -31,
+      'SEMI': -31}}
+
+lr_goto = {0: {'empty': 2, 'filter': 4, 'order': 3, 'program': 1},
+ 1: {},
+ 2: {},
+ 3: {'filter': 7},
+ 4: {'order': 8},
+ 5: {},
+ 6: {},
+ 7: {},
+ 8: {},
+ 9: {'id': 12, 'id_list': 11},
+ 10: {'constant': 21, 'expression': 14, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 11: {},
+ 12: {},
+ 13: {},
+ 14: {},
+ 15: {},
+ 16: {'constant': 21, 'id': 22, 'primary_expression': 19, 'unary_expression': 40},
+ 17: {'constant': 21, 'id': 22, 'primary_expression': 19, 'unary_expression': 41},
+ 18: {'constant': 21, 'id': 22, 'primary_expression': 19, 'unary_expression': 42},
+ 19: {},
+ 20: {'constant': 21, 'expression': 43, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 21: {},
+ 22: {},
+ 23: {},
+ 24: {},
+ 25: {},
+ 26: {},
+ 27: {},
+ 28: {},
+ 29: {},
+ 30: {'id': 44},
+ 31: {},
+ 32: {'constant': 21, 'expression': 45, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 33: {'constant': 21, 'expression': 46, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 34: {'constant': 21, 'expression': 47, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 35: {'constant': 21, 'expression': 48, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 36: {'constant': 21, 'expression': 49, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 37: {'constant': 21, 'expression': 50, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 38: {'constant': 21, 'expression': 51, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 39: {'constant': 21, 'expression': 52, 'id': 22, 'primary_expression': 19, 'unary_expression': 15},
+ 40: {},
+ 41: {},
+ 42: {},
+ 43: {},
+ 44: {},
+ 45: {},
+ 46: {},
+ 47: {},
+ 48: {},
+ 49: {},
+ 50: {},
+ 51: {},
+ 52: {},
+ 53: {}}
+
+defaulted_states = {2: -1, 7: -4, 8: -5}
@@ -1,6 +1,7 @@
 from src.utils.node import Node
 class Constant(Node):
 
+    __slots__ = ("type", "value", "coord", "text")
     attr_names = ('type', 'value')
 
     def __init__(self, type, value, coord=None):
@@ -21,6 +22,7 @@ class Constant(Node):
 
 class EmptyStatement(Node):
 
+    __slots__ = ("coord",)
     attr_names = ()
 
     def __init__(self, coord=None):
@@ -32,6 +34,7 @@ class EmptyStatement(Node):
 
 class ID(Node):
 
+    __slots__ = ("name", "coord", "type", "field", "text")
     attr_names = ("name",)
 
     def __init__(self, name, coord=None):
@@ -50,6 +53,7 @@ class ID(Node):
 
 class Program(Node):
 
+    __slots__ = ("steps", "coord", "text")
     attr_names = ()
 
     def __init__(self, steps=list[Node], coord=None):
@@ -64,6 +68,8 @@ class Program(Node):
 
 
 class Operation(Node):
+
+    __slots__ = ("op", "coord")
     attr_names = ("op",)
 
     def __init__(self, op, coord=None):
@@ -82,6 +88,7 @@ class Operation(Node):
 
 class UnaryOp(Operation):
 
+    __slots__ = ("expr", "type", "text")
     attr_names = ("op",)
 
     def __init__(self, op, expr, coord=None):
@@ -104,6 +111,7 @@ class UnaryOp(Operation):
 
 class BinaryOp(Operation):
 
+    __slots__ = ("lvalue", "rvalue", "type", "text")
     attr_names = ("op",)
 
     def __init__(self, op, left, right, coord=None):
@@ -131,6 +139,7 @@ class BinaryOp(Operation):
 
 class Order(Node):
 
+    __slots__ = ("orderings", "coord", "text")
     attr_names = ()
 
     def __init__(self, orderings: list[ID], coord=None):
@@ -146,6 +155,7 @@ class Order(Node):
 
 class Filter(Node):
 
+    __slots__ = ("expression", "coord", "text")
     attr_names = ()
 
     def __init__(self, expression: Operation, coord=None):
@@ -4,11 +4,15 @@ from typing import Dict
 from src.simple.parser import QPParser
 from src.utils.qp_types import *
 from src.utils.coord import Coord
+from src.segy.headers import HeaderRegistry
+from src.utils.diagnostics import Diagnostics, print_diagnostic
 from src.simple.qp_ast import *
 from src.utils.node_visitor import *
 
-class SemanticVisitor(NodeVisitor):
-    def __init__(self):
+class SemanticVisitor(IterativeNodeVisitor):
+    def __init__(self, diagnostics: Diagnostics = None, registry: HeaderRegistry = None):
+        self.diagnostics = Diagnostics(print_diagnostic) if diagnostics is None else diagnostics
+        self.registry = registry
         self.typemap: Dict[str, Type] = {
             "number": NumberType,
             "char": CharType,
@@ -18,28 +22,30 @@ class SemanticVisitor(NodeVisitor):
         self._found_error = False
 
     def _assert_semantic(self, condition: bool, msg_code: int, coord: Coord, name: str = "", ltype: str = "", rtype: str = ""):
+        if condition:
+            return
         error_msgs = {
             1: f"Filter statement must contain a boolean expression, not {name}",
             2: "Order expression must contain identifiers",
             3: f"Binary operator {name} does not have matching LHS/RHS types - {ltype} and {rtype}",
             4: f"Binary operator {name} is not supported by {ltype}",
             5: f"Unary operator {name} is not supported by {ltype}",
+            7: f"Unknown header field {name}",
         }
-        if not condition:
-            msg = error_msgs[msg_code]  # invalid msg_code raises Exception
-            print("Semantic error: %s %s" % (msg, coord), file=sys.stdout)
-            self._found_error = True
+        msg = error_msgs[msg_code]  # invalid msg_code raises Exception
+        self.diagnostics.report("semantic", msg_code, msg, coord)
+        self._found_error = True
 
-    def visit_Program(self, node: Program):
-        for step in node.steps:
-            self.visit(step)
+    def enter_Program(self, node: Program):
+        return node.steps
 
-    def visit_EmptyStatement(self, node: EmptyStatement):
-        pass
+    def enter_EmptyStatement(self, node: EmptyStatement):
+        return ()
 
-    def visit_UnaryOp(self, node: UnaryOp):
-        self.visit(node.expr)
+    def enter_UnaryOp(self, node: UnaryOp):
+        return (node.expr,)
 
+    def leave_UnaryOp(self, node: UnaryOp):
         expression_type = node.expr.type
         self._assert_semantic(
             node.op in expression_type.unary_ops,
@@ -51,10 +57,10 @@ class SemanticVisitor(NodeVisitor):
 
         node.type = expression_type
 
-    def visit_BinaryOp(self, node: BinaryOp):
-        self.visit(node.lvalue)
-        self.visit(node.rvalue)
+    def enter_BinaryOp(self, node: BinaryOp):
+        return node.lvalue, node.rvalue
 
+    def leave_BinaryOp(self, node: BinaryOp):
         left_type, right_type = node.lvalue.type, node.rvalue.type
 
         if not (isinstance(node.lvalue, ID) or isinstance(node.rvalue, ID)):
@@ -77,25 +83,33 @@ class SemanticVisitor(NodeVisitor):
 
         node.type = BooleanType
 
-    def visit_ID(self, node: ID):
+    def _check_field(self, node: ID):
+        if self.registry is not None:
+            node.field = self.registry.get(node.name)
+            self._assert_semantic(node.field is not None, 7, coord=node.coord, name=node.name)
+
+    def leave_ID(self, node: ID):
+        self._check_field(node)
         node.type = NumberType
 
-    def visit_Constant(self, node: Constant):
+    def leave_Constant(self, node: Constant):
         node.type = self.typemap[node.type]
 
-    def visit_Order(self, node: Order):
-        for expression in node.orderings:
-            self.visit(expression)
+    def enter_Order(self, node: Order):
+        return node.orderings
 
+    def leave_Order(self, node: Order):
+        for expression in node.orderings:
             self._assert_semantic(
                 isinstance(expression, ID),
                 2,
                 expression.coord
             )
 
-    def visit_Filter(self, node: Filter):
-        self.visit(node.expression)
+    def enter_Filter(self, node: Filter):
+        return (node.expression,)
 
+    def leave_Filter(self, node: Filter):
         self._assert_semantic(
             node.expression.type == BooleanType,
             1,
@@ -105,6 +119,10 @@ class SemanticVisitor(NodeVisitor):
     def has_error(self):
         return self._found_error
 
+    def reset(self):
+        """Clear the per-call error state so the instance can be reused."""
+        self._found_error = False
+
 if __name__ == "__main__":
     # create argument parser
     parser = argparse.ArgumentParser()
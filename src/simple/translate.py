@@ -6,15 +6,34 @@ from src.simple.qp_ast import *
 from src.utils.node_visitor import *
 
 
-class TranslationVisitor(NodeVisitor):
+class TranslationVisitor(IterativeNodeVisitor):
+    unary_operator_map = {
+        "not": "NOT",
+        "+": "+",
+        "-": "-"
+    }
+
+    binary_operator_map = {
+        "<": "<",
+        "<=": "<=",
+        ">": ">",
+        ">=": ">=",
+        "=": "=",
+        "!=": "<>",
+        "and": "AND",
+        "or": "OR",
+    }
+
     def __init__(self):
         self.table_name = "Table"
 
-    def visit_Program(self, node: Program):
+    def enter_Program(self, node: Program):
+        return node.steps
+
+    def leave_Program(self, node: Program):
         filter_text = ""
         order_text = ""
         for step in node.steps:
-            self.visit(step)
             if isinstance(step, Filter):
                 filter_text = step.text
             elif isinstance(step, Order):
@@ -22,57 +41,45 @@ class TranslationVisitor(NodeVisitor):
         node.text: str = f"SELECT * FROM {self.table_name} {filter_text} {order_text} ;"
 
 
-    def visit_EmptyStatement(self, node: EmptyStatement):
-        pass
-
-    def visit_UnaryOp(self, node: UnaryOp):
-        self.visit(node.expr)
+    def enter_EmptyStatement(self, node: EmptyStatement):
+        return ()
 
-        operator_map = {
-            "not": "NOT",
-            "+": "+",
-            "-": "-"
-        }
+    def enter_UnaryOp(self, node: UnaryOp):
+        return (node.expr,)
 
-        node.text = f"({operator_map[node.op]} {node.expr.text})"
+    def leave_UnaryOp(self, node: UnaryOp):
+        node.text = f"({self.unary_operator_map[node.op]} {node.expr.text})"
 
 
-    def visit_BinaryOp(self, node: BinaryOp):
-        self.visit(node.lvalue)
-        self.visit(node.rvalue)
+    def enter_BinaryOp(self, node: BinaryOp):
+        return node.lvalue, node.rvalue
 
-        operator_map = {
-            "<": "<",
-            "<=": "<=",
-            ">": ">",
-            ">=": ">=",
-            "=": "=",
-            "!=": "<>",
-            "and": "AND",
-            "or": "OR",
-        }
+    def leave_BinaryOp(self, node: BinaryOp):
+        node.text = f"({node.lvalue.text} {self.binary_operator_map[node.op]} {node.rvalue.text})"
 
-        node.text = f"({node.lvalue.text} {operator_map[node.op]} {node.rvalue.text})"
 
-
-    def visit_ID(self, node: ID):
+    def leave_ID(self, node: ID):
         node.text = node.name
 
-    def visit_Constant(self, node: Constant):
+    def leave_Constant(self, node: Constant):
         node.text = node.value
 
-    def visit_Order(self, node: Order):
+    def enter_Order(self, node: Order):
+        return node.orderings
+
+    def leave_Order(self, node: Order):
         order = ""
         for i, expression in enumerate(node.orderings):
-            self.visit(expression)
             order += f"{expression.text}"
             if i != len(node.orderings) - 1:
                 order += " , "
         node.text = f"ORDER BY {order}"
 
 
-    def visit_Filter(self, node: Filter):
-        self.visit(node.expression)
+    def enter_Filter(self, node: Filter):
+        return (node.expression,)
+
+    def leave_Filter(self, node: Filter):
         node.text = f"WHERE {node.expression.text}"
 
 
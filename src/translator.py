@@ -0,0 +1,238 @@
+import threading
+from typing import Callable, Sequence
+
+from src.cache import TranslationCache, fingerprint
+from src.segy.headers import HeaderRegistry
+from src.utils.diagnostics import Diagnostic, Diagnostics, print_diagnostic
+from src.utils.parameters import PARAMSTYLES, ParameterizedSQL
+
+
+# The grammar stacks are only imported when a pipeline for their version is first built,
+# so a process that only uses one version never builds the other one's lexer and parser.
+def _simple_pipeline(lexer_backend: str, ast_backend: str, paramstyle: str | None, optimize: bool,
+                     value_table_threshold: int | None, sargable: bool, key_columns: tuple[str, ...] | None,
+                     registry: HeaderRegistry | None, diagnostics: Diagnostics):
+    from src.simple.lexer import QPLexer
+    from src.simple.parser import QPParser
+    from src.simple.semantic import SemanticVisitor
+    from src.simple.emitter import ParameterizedSQLEmitter, SQLEmitter
+
+    lexer = QPLexer(diagnostics)
+    if paramstyle is None:
+        emitter = SQLEmitter(key_columns)
+    else:
+        emitter = ParameterizedSQLEmitter(paramstyle, key_columns=key_columns)
+    return lexer, QPParser(lexer), SemanticVisitor(diagnostics, registry), None, emitter
+
+
+def _extended_pipeline(lexer_backend: str, ast_backend: str, paramstyle: str | None, optimize: bool,
+                       value_table_threshold: int | None, sargable: bool, key_columns: tuple[str, ...] | None,
+                       registry: HeaderRegistry | None, diagnostics: Diagnostics):
+    from src.extended.lexer import QPLexerExtended
+    from src.extended.parser import QPParserExtended
+    from src.extended.semantic import SemanticVisitorExtended
+    from src.extended.emitter import (ParameterizedSargableSQLEmitterExtended, ParameterizedSQLEmitterExtended,
+                                      SargableSQLEmitterExtended, SQLEmitterExtended)
+
+    if lexer_backend == "scanner":
+        from src.extended.scanner import QPScannerExtended
+        lexer = QPScannerExtended(diagnostics)
+    else:
+        lexer = QPLexerExtended(diagnostics)
+    if ast_backend == "arena":
+        from src.extended.arena import ArenaBuilder, ArenaParameterizedSQLEmitter, ArenaSemanticVisitor, ArenaSQLEmitter
+        parser = QPParserExtended(lexer, builder=ArenaBuilder())
+        if paramstyle is None:
+            emitter = ArenaSQLEmitter(key_columns=key_columns)
+        else:
+            emitter = ArenaParameterizedSQLEmitter(paramstyle, key_columns=key_columns)
+        return lexer, parser, ArenaSemanticVisitor(diagnostics, registry), None, emitter
+    if paramstyle is None:
+        emitter_class = SargableSQLEmitterExtended if sargable else SQLEmitterExtended
+        emitter = emitter_class(value_table_threshold, key_columns)
+    else:
+        emitter_class = ParameterizedSargableSQLEmitterExtended if sargable else ParameterizedSQLEmitterExtended
+        emitter = emitter_class(paramstyle, value_table_threshold=value_table_threshold, key_columns=key_columns)
+    optimizer = None
+    if optimize:
+        from src.extended.optimizer import FilterOptimizerExtended
+        optimizer = FilterOptimizerExtended()
+    return lexer, QPParserExtended(lexer), SemanticVisitorExtended(diagnostics, registry), optimizer, emitter
+
+
+# Query Plan version -> factory of (lexer, parser, semantic visitor, optimizer or None, SQL emitter)
+PIPELINES = {
+    1: _simple_pipeline,
+    2: _extended_pipeline,
+}
+
+# Query Plan version -> available lexer implementations, the first one is the default
+LEXER_BACKENDS = {
+    1: ("sly",),
+    2: ("sly", "scanner"),
+}
+
+# Query Plan version -> available AST representations, the first one is the default
+AST_BACKENDS = {
+    1: ("objects",),
+    2: ("objects", "arena"),
+}
+
+# Query Plan version -> AST representations the filter optimizer can rewrite
+OPTIMIZED_AST_BACKENDS = {
+    1: (),
+    2: ("objects",),
+}
+
+# Query Plan version -> AST representations that can be emitted as sargable SQL
+SARGABLE_AST_BACKENDS = {
+    1: (),
+    2: ("objects",),
+}
+
+
+class Translator:
+    """
+    Reusable Query Plan to SQL translator for a single language version.
+
+    The lexer, parser and visitors are built once per thread and only have their
+    error state reset between calls, so a single instance can be shared by many
+    threads and used for many plans.
+
+    When a cache is given, successful translations are stored under the
+    fingerprint of the plan's token stream, so a repeated plan is only tokenized.
+
+    The lexer backend selects between the SLY lexer ("sly") and, for version 2,
+    the hand-written single pass scanner ("scanner"), which yield the same tokens.
+    The AST backend selects between trees of qp_ast nodes ("objects") and, for
+    version 2, the array-backed Arena ("arena"), which yield the same SQL.
+
+    With a paramstyle ("qmark", "numeric" or "format", as in DB-API), constants
+    are replaced by placeholders and translations are `ParameterizedSQL` tuples
+    of the SQL, its parameters and its shape, a key shared by every plan that
+    only differs in its constants.
+
+    With ``optimize=True`` (version 2 objects only), the filter is simplified by
+    `FilterOptimizerExtended` after semantic analysis, and the rewrites that fired
+    in the last call made by the current thread are counted in `rewrites`. A
+    filter the optimizer proves can never select a row sets `empty`, so the
+    caller can skip executing it; such translations are not cached. Equality
+    tests on the same identifier become IN lists, and lists longer than
+    ``value_table_threshold`` are emitted as a subquery on a table of values
+    declared in a WITH clause.
+
+    With ``sargable=True`` (version 2 objects only), the SQL is written so an
+    engine can answer the predicates with an index on the identifier, see
+    `SargableSQLEmitterExtended`.
+
+    With ``key_columns`` (for example the file id and trace index columns), the
+    SELECT lists those columns and the identifiers used by the filter and the
+    order instead of ``*``, so the engine only reads the header fields the plan
+    needs. An empty sequence selects the identifiers alone.
+
+    With a ``registry`` of SEG-Y trace header fields, identifiers that name no
+    field of the registry are semantic errors, so a misspelled field is reported
+    before the SQL reaches an engine. After analysis each ID node of an
+    "objects" tree carries its `HeaderField` in ``field``.
+
+    Errors of the last call made by the current thread are available as structured
+    `Diagnostic` objects in `diagnostics`; they are also passed to the printer as
+    they are reported, which prints them to stdout by default. Pass ``printer=None``
+    to only collect them.
+    """
+
+    def __init__(self, version: int = 2, cache: TranslationCache = None, lexer_backend: str = "sly",
+                 printer: Callable[[Diagnostic], None] = print_diagnostic, ast_backend: str = "objects",
+                 paramstyle: str = None, optimize: bool = False, value_table_threshold: int = None,
+                 sargable: bool = False, key_columns: Sequence[str] = None, registry: HeaderRegistry = None):
+        if version not in PIPELINES:
+            raise ValueError("Version not supported: %s" % version)
+        if lexer_backend not in LEXER_BACKENDS[version]:
+            raise ValueError("Lexer backend %s not supported by version %s" % (lexer_backend, version))
+        if ast_backend not in AST_BACKENDS[version]:
+            raise ValueError("AST backend %s not supported by version %s" % (ast_backend, version))
+        if paramstyle is not None and paramstyle not in PARAMSTYLES:
+            raise ValueError("Parameter style not supported: %s" % paramstyle)
+        if optimize and ast_backend not in OPTIMIZED_AST_BACKENDS[version]:
+            raise ValueError("Optimizer not supported by version %s with AST backend %s" % (version, ast_backend))
+        if sargable and ast_backend not in SARGABLE_AST_BACKENDS[version]:
+            raise ValueError("Sargable SQL not supported by version %s with AST backend %s" % (version, ast_backend))
+        self.version = version
+        self.lexer_backend = lexer_backend
+        self.ast_backend = ast_backend
+        self.paramstyle = paramstyle
+        self.optimize = optimize
+        self.value_table_threshold = value_table_threshold
+        self.sargable = sargable
+        self.key_columns = None if key_columns is None else tuple(key_columns)
+        self.registry = registry
+        self._factory = PIPELINES[version]
+        self.cache = cache
+        self.printer = printer
+        self._local = threading.local()
+
+    def _pipeline(self):
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None:
+            self._local.diagnostics = Diagnostics(self.printer)
+            pipeline = self._local.pipeline = self._factory(self.lexer_backend, self.ast_backend, self.paramstyle,
+                                                                 self.optimize, self.value_table_threshold,
+                                                                 self.sargable, self.key_columns, self.registry,
+                                                                 self._local.diagnostics)
+        return pipeline
+
+    @property
+    def diagnostics(self) -> list[Diagnostic]:
+        """Errors reported by the last translation made by the current thread."""
+        diagnostics = getattr(self._local, "diagnostics", None)
+        return [] if diagnostics is None else list(diagnostics)
+
+    @property
+    def rewrites(self) -> dict[str, int]:
+        """Optimizer rewrites that fired in the last translation made by the current thread, by name."""
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None or pipeline[3] is None:
+            return {}
+        return dict(pipeline[3].rewrites)
+
+    @property
+    def empty(self) -> bool:
+        """Whether the optimizer proved that the last translation made by the current thread selects no row."""
+        pipeline = getattr(self._local, "pipeline", None)
+        return pipeline is not None and pipeline[3] is not None and pipeline[3].empty
+
+    def translate(self, query_plan: str) -> str | ParameterizedSQL | None:
+        lexer, parser, semantic_visitor, optimizer, emitter = self._pipeline()
+        self._local.diagnostics.clear()
+        lexer.reset()
+        parser.reset()
+        semantic_visitor.reset()
+        if optimizer is not None:
+            optimizer.reset()
+
+        tokens = list(lexer.tokenize(query_plan))
+        if lexer.has_error():
+            return
+
+        key = None
+        if self.cache is not None:
+            registry = None if self.registry is None else self.registry.signature
+            salt = "%s:%s:%s:%s:%s:%s:%s" % (self.version, self.paramstyle, self.optimize, self.value_table_threshold,
+                                             self.sargable, self.key_columns, registry)
+            key = fingerprint(tokens, lexer.keywords, salt=salt)
+            translation = self.cache.get(key)
+            if translation is not None:
+                return translation
+
+        ast = parser.parse(iter(tokens))
+        if parser.has_error():
+            return
+        semantic_visitor.visit(ast)
+        if semantic_visitor.has_error():
+            return
+        if optimizer is not None:
+            optimizer.optimize(ast)
+        translation = emitter.emit(ast)
+        if key is not None and not (optimizer is not None and optimizer.empty):
+            self.cache.put(key, translation)
+        return translation
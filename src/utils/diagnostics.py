@@ -0,0 +1,89 @@
+import sys
+from typing import Callable
+
+from src.utils.coord import Coord
+
+
+class Diagnostic:
+    """An error reported by one of the translation stages. Consists of:
+    - Stage that reported it: "lexer", "parser" or "semantic"
+    - Numeric code, unique within the stage
+    - Human readable message
+    - (optional) coordinates of the offending element
+    """
+
+    __slots__ = ("stage", "code", "message", "coord")
+
+    labels = {
+        "lexer": "Lexical",
+        "parser": "Parser",
+        "semantic": "Semantic",
+    }
+
+    def __init__(self, stage: str, code: int, message: str, coord: Coord = None):
+        self.stage = stage
+        self.code = code
+        self.message = message
+        self.coord = coord
+
+    @property
+    def line(self):
+        return self.coord.line if self.coord is not None else None
+
+    @property
+    def column(self):
+        return self.coord.column if self.coord is not None else None
+
+    def to_dict(self) -> dict:
+        return {"stage": self.stage, "code": self.code, "message": self.message, "line": self.line,
+                "column": self.column}
+
+    def __eq__(self, other):
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+        return (self.stage, self.code, self.message, self.line, self.column) == \
+            (other.stage, other.code, other.message, other.line, other.column)
+
+    def __repr__(self):
+        return "Diagnostic(%r, %r, %r, line=%r, column=%r)" % (self.stage, self.code, self.message, self.line,
+                                                               self.column)
+
+    def __str__(self):
+        label = self.labels.get(self.stage, self.stage.capitalize())
+        if self.coord is None:
+            return "%s error: %s" % (label, self.message)
+        return "%s error: %s %s" % (label, self.message, self.coord)
+
+
+def print_diagnostic(diagnostic: Diagnostic):
+    """Printer adapter that writes each diagnostic to stdout as soon as it is reported."""
+    print(diagnostic, file=sys.stdout)
+
+
+class Diagnostics:
+    """
+    Sink the lexer, parser and semantic visitors append their errors to.
+
+    Diagnostics are collected in order; an optional printer is called with each
+    one as it is reported, which is how the stages print their errors by default.
+    """
+
+    def __init__(self, printer: Callable[[Diagnostic], None] = None):
+        self.items: list[Diagnostic] = []
+        self.printer = printer
+
+    def report(self, stage: str, code: int, message: str, coord: Coord = None) -> Diagnostic:
+        diagnostic = Diagnostic(stage, code, message, coord)
+        self.items.append(diagnostic)
+        if self.printer is not None:
+            self.printer(diagnostic)
+        return diagnostic
+
+    def clear(self):
+        self.items = []
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
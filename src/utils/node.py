@@ -2,6 +2,23 @@ import sys
 from abc import ABC, abstractmethod
 
 
+# Node class -> its slots, from the base class down, in declaration order
+_fields_cache = {}
+
+
+def node_fields(obj):
+    """Return the (name, value) pairs of the slots set on a node, in declaration order."""
+    fields = _fields_cache.get(obj.__class__)
+    if fields is None:
+        fields = []
+        for cls in reversed(obj.__class__.__mro__):
+            for name in cls.__dict__.get("__slots__", ()):
+                if name not in fields:
+                    fields.append(name)
+        fields = _fields_cache[obj.__class__] = tuple(fields)
+    return [(name, getattr(obj, name)) for name in fields if hasattr(obj, name)]
+
+
 def represent_node(obj, indent):
     def _repr(obj, indent, printed_set):
         """
@@ -27,7 +44,7 @@ def represent_node(obj, indent):
             attrs = []
 
             # convert each node attribute to string
-            for name, value in vars(obj).items():
+            for name, value in node_fields(obj):
 
                 # is an irrelevant attribute: skip it.
                 if name in ('bind', 'coord'):
@@ -57,8 +74,14 @@ def represent_node(obj, indent):
 
 
 class Node(ABC):
-    """Abstract base class for AST nodes."""
+    """
+    Abstract base class for AST nodes.
+
+    Nodes declare their fields, including the ones filled in by the analysis
+    passes (such as ``type``), in ``__slots__``, so they carry no ``__dict__``.
+    """
 
+    __slots__ = ()
     attr_names = ()
 
     @abstractmethod
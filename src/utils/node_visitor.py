@@ -21,3 +21,53 @@ class NodeVisitor:
         """
         for _, child in node.children():
             self.visit(child)
+
+
+class IterativeNodeVisitor:
+    """
+    Node visitor that walks the tree with an explicit stack instead of recursing
+    once per level, so the depth of the tree is only limited by memory.
+
+    For each node, the pre-order hook ``enter_<ClassName>`` is called first and
+    returns the children to walk, in order; once all of them have been walked, the
+    post-order hook ``leave_<ClassName>`` is called. Without an enter hook the Node
+    children of the node are walked, and a missing leave hook is simply skipped.
+    """
+
+    _hook_cache = None
+
+    def _hooks(self, cls):
+        if self._hook_cache is None:
+            self._hook_cache = {}
+
+        hooks = self._hook_cache.get(cls)
+        if hooks is None:
+            enter = getattr(self, "enter_" + cls.__name__, self.generic_enter)
+            leave = getattr(self, "leave_" + cls.__name__, None)
+            hooks = self._hook_cache[cls] = (enter, leave)
+        return hooks
+
+    def generic_enter(self, node: Node):
+        """Called if no explicit enter hook exists for a node, returns its Node children."""
+        return [child for _, child in node.children() if isinstance(child, Node)]
+
+    def visit(self, node: Node):
+        hooks = self._hooks
+        # entries are (node, None) before the node is entered and (node, leave hook) once its children are pushed
+        stack = [(node, None)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, leave = pop()
+            if leave is not None:
+                leave(node)
+                continue
+            enter, leave = hooks(node.__class__)
+            children = enter(node)
+            if not children:
+                if leave is not None:
+                    leave(node)
+                continue
+            if leave is not None:
+                push((node, leave))
+            for child in reversed(children):
+                push((child, None))
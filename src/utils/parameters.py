@@ -0,0 +1,54 @@
+import hashlib
+from collections import namedtuple
+
+ParameterizedSQL = namedtuple("ParameterizedSQL", ["sql", "parameters", "shape"])
+ParameterizedSQL.__doc__ = """SQL with placeholders, the values bound to them in order and a stable key of the SQL."""
+
+# DB-API paramstyle -> placeholder for the n-th parameter, counting from 1
+PARAMSTYLES = {
+    "qmark": lambda n: "?",
+    "numeric": lambda n: ":%d" % n,
+    "format": lambda n: "%s",
+}
+
+
+def bind_value(typename: str, value):
+    """Python value bound to the placeholder of a constant of the given Query Plan type."""
+    if typename == "char":
+        return value[1:-1]
+    if typename == "bool":
+        return value.lower() == "true"
+    return value
+
+
+def shape(sql: str) -> str:
+    """Stable key of a parameterized SQL statement, equal for plans that only differ in constants."""
+    return hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+
+
+class ParameterizedEmitter:
+    """
+    Mixin for the SQL emitters that replaces every constant with a placeholder.
+
+    ``emit`` returns a ParameterizedSQL, with the constants in the order their
+    placeholders appear in the SQL.
+    """
+
+    def __init__(self, paramstyle: str = "qmark", **kwargs):
+        super().__init__(**kwargs)
+        if paramstyle not in PARAMSTYLES:
+            raise ValueError("Parameter style not supported: %s" % paramstyle)
+        self.paramstyle = paramstyle
+        self._placeholder = PARAMSTYLES[paramstyle]
+        self._parameters = []
+
+    def constant_sql(self, typename: str, value) -> str:
+        self._parameters.append(bind_value(typename, value))
+        return self._placeholder(len(self._parameters))
+
+    def emit(self, node, buf=None) -> ParameterizedSQL:
+        self._parameters = []
+        sql = super().emit(node)
+        if buf is not None:
+            buf.write(sql)
+        return ParameterizedSQL(sql, tuple(self._parameters), shape(sql))
@@ -0,0 +1,29 @@
+from typing import Iterable, Sequence
+
+
+def select_list(identifiers: Iterable[str], key_columns: Sequence[str]) -> str:
+    """
+    Column list of a projection: the key columns, then every identifier in order of first use.
+
+    Falls back to "*" when there is nothing to select, as a SELECT needs at least one column.
+    """
+    columns = dict.fromkeys(key_columns)
+    columns.update(dict.fromkeys(identifiers))
+    return ", ".join(columns) if columns else "*"
+
+
+def node_identifiers(program) -> Iterable[str]:
+    """Names of the identifiers of a Program of either Query Plan version, in source order."""
+    stack = list(reversed(program.steps))
+    while stack:
+        node = stack.pop()
+        cls_name = node.__class__.__name__
+        if cls_name == "ID":
+            yield node.name
+        elif cls_name == "Order":
+            # the extended Order also lists its descending flags as children
+            stack.extend(reversed(node.orderings))
+        elif cls_name == "Range":
+            stack.extend((node.upper, node.lower, node.data))
+        else:
+            stack.extend(reversed([child for _, child in node.children()]))
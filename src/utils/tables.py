@@ -0,0 +1,153 @@
+import argparse
+import hashlib
+import importlib
+import pprint
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import sly
+from sly import Lexer, Parser
+from sly.yacc import YaccError
+
+# Grammar stacks whose tables are shipped with the project
+PACKAGES = ("src.simple", "src.extended")
+
+HEADER = "# Generated by src.utils.tables from the grammar in this package, do not edit.\n"
+
+
+def _signature(*parts) -> str:
+    """Checksum of everything the generated tables depend on, including the SLY version."""
+    digest = hashlib.sha256(sly.__version__.encode())
+    for part in parts:
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+def _load_tables(module_name: str, signature: str):
+    """Return the tables module if it exists and was generated from the same grammar, otherwise None."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if getattr(module, "signature", None) != signature:
+        return None
+    return module
+
+
+def _write_tables(module_name: str, tables: dict):
+    """Write the tables as a Python module next to the grammar; read-only installs just keep building them."""
+    package, _, name = module_name.rpartition(".")
+    path = Path(sys.modules[package].__path__[0]) / (name + ".py")
+    text = HEADER + "".join("\n%s = %s\n" % (key, pprint.pformat(value, width=120)) for key, value in tables.items())
+    try:
+        path.write_text(text)
+    except OSError:
+        return
+    sys.modules.pop(module_name, None)
+    importlib.invalidate_caches()
+
+
+class PrecomputedTablesLexer(Lexer):
+    """
+    SLY lexer that loads its master regular expression from a generated module.
+
+    Subclasses set ``_tables_module`` to the module name. When the checksum stored
+    there matches the token rules, the per-rule validation done by SLY is skipped;
+    otherwise the lexer is built as usual and the module is regenerated.
+    """
+
+    tokens = set()
+    _tables_module = None
+
+    @classmethod
+    def _build(cls):
+        if cls._tables_module is None:
+            return Lexer._build.__func__(cls)
+
+        cls._token_names = cls._token_names | set(cls.tokens)
+        cls._ignored_tokens = set(cls._ignored_tokens)
+        cls._token_funcs = dict(cls._token_funcs)
+        cls._remapping = dict(cls._remapping)
+        for (key, val), newtok in cls._remap.items():
+            cls._remapping.setdefault(key, {})[val] = newtok
+        cls._collect_rules()
+
+        parts = []
+        for tokname, value in cls._rules:
+            if tokname.startswith('ignore_'):
+                tokname = tokname[7:]
+                cls._ignored_tokens.add(tokname)
+            if callable(value):
+                cls._token_funcs[tokname] = value
+                value = value.pattern
+            parts.append(f'(?P<{tokname}>{value})')
+        signature = _signature(parts, cls.reflags, cls.ignore, sorted(cls.literals), sorted(cls._remapping.items()))
+
+        tables = _load_tables(cls._tables_module, signature)
+        if tables is None:
+            Lexer._build.__func__(cls)
+            _write_tables(cls._tables_module, {"signature": signature, "master_re": cls._master_re.pattern})
+        else:
+            cls._master_re = cls.regex_module.compile(tables.master_re, cls.reflags)
+
+
+class PrecomputedTablesParser(Parser):
+    """
+    SLY parser that loads its LALR tables from a generated module.
+
+    Subclasses set ``_tables_module`` to the module name. The grammar is still
+    collected and validated, but the LALR construction is skipped when the
+    checksum of the productions matches the one stored with the tables;
+    otherwise the tables are built as usual and the module is regenerated.
+    """
+
+    _tables_module = None
+
+    @classmethod
+    def _build(cls, definitions):
+        if '_build' in vars(cls):
+            return
+        if cls._tables_module is None:
+            return Parser._build.__func__(cls, definitions)
+
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise YaccError('Invalid parser specification')
+        cls._Parser__build_grammar(rules)
+        signature = _signature([str(p) for p in cls._grammar.Productions], sorted(cls.tokens))
+
+        tables = _load_tables(cls._tables_module, signature)
+        if tables is None:
+            if not cls._Parser__build_lrtables():
+                raise YaccError('Can\'t build parsing tables')
+            _write_tables(cls._tables_module, {
+                "signature": signature,
+                "lr_action": cls._lrtable.lr_action,
+                "lr_goto": cls._lrtable.lr_goto,
+                "defaulted_states": cls._lrtable.defaulted_states,
+            })
+        else:
+            cls._lrtable = SimpleNamespace(
+                lr_action=tables.lr_action,
+                lr_goto=tables.lr_goto,
+                defaulted_states=tables.defaulted_states,
+            )
+
+
+def generate_tables(packages=PACKAGES):
+    """Regenerate the lexer and parser tables of the given grammar packages from scratch."""
+    for package in packages:
+        importlib.import_module(package)
+        for name in ("lextab", "parsetab"):
+            path = Path(sys.modules[package].__path__[0]) / (name + ".py")
+            path.unlink(missing_ok=True)
+        importlib.invalidate_caches()
+        importlib.import_module(package + ".parser")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate the precomputed lexer and parser tables")
+    parser.add_argument("packages", nargs="*", default=PACKAGES, help="Grammar packages to regenerate")
+    args = parser.parse_args()
+    generate_tables(args.packages)
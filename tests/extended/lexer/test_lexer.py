@@ -16,7 +16,11 @@ from tests.utils import resolve_test_files
         "t07",
         "t08",
         "t09",
-        "t10"
+        "t10",
+        "t11",
+        "t12",
+        "t13",
+        "t14",
     ],
 )
 def test_lexer(test_name, capfd):
@@ -28,3 +32,11 @@ def test_lexer(test_name, capfd):
         captured = capfd.readouterr()
         expect = f_ex.read()
     assert captured.out == expect
+
+
+def test_token_columns():
+    m = QPLexerExtended()
+    for text in ("filter:\n  a = 10 and\n\nb < 2;", "order: a,\n b desc;", "filter: " + " or ".join(["a = 1"] * 50) + ";"):
+        for token in m.tokenize(text):
+            last_cr = max(text.rfind('\n', 0, token.index), 0)
+            assert m.find_tok_column(token) == token.index - last_cr
@@ -0,0 +1,55 @@
+import random
+from pathlib import Path
+import pytest
+from src.extended.lexer import QPLexerExtended
+from src.extended.scanner import QPScannerExtended
+from src.query_plan_to_sql import QueryPlanToSQL
+from tests.utils import resolve_test_files
+
+
+def scan(lexer, text, capfd):
+    tokens = [repr(token) for token in lexer.tokenize(text)]
+    return tokens, capfd.readouterr().out, lexer.index, lexer.has_error()
+
+
+@pytest.mark.parametrize(
+    "test_name",
+    [
+        "t01",
+        "t02",
+        "t03",
+        "t04",
+        "t05",
+        "t06",
+        "t07",
+        "t08",
+        "t09",
+        "t10",
+        "t11",
+        "t12",
+        "t13",
+        "t14",
+    ],
+)
+def test_scanner_matches_lexer(test_name, capfd):
+    input_path, _ = resolve_test_files(test_name, Path(__file__).parent.absolute())
+
+    with open(input_path) as f_in:
+        text = f_in.read()
+    assert scan(QPScannerExtended(), text, capfd) == scan(QPLexerExtended(), text, capfd)
+
+
+def test_scanner_matches_lexer_on_random_input(capfd):
+    fragments = ['/-', '-/', '-', '/', '//', '"', '\\', 'a', 'Z', ' ', '\t', '\n', '1', '23', '.', '4.5', '(', ')',
+                 "'", 'x_1', '!', '!=', '<', '<=', '>', '>=', '=', '+', ',', ':', ';', '@', '\r', 'and', 'Desc', '_']
+    rng = random.Random(7)
+    for _ in range(2000):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 15)))
+        assert scan(QPScannerExtended(), text, capfd) == scan(QPLexerExtended(), text, capfd), repr(text)
+
+
+def test_translate_with_scanner():
+    plan = "filter: (elev in range(10 incl, 100) and coord_x = 107.5) or coord_z != -11;\norder: a desc, b;"
+    assert QueryPlanToSQL(lexer_backend="scanner").translate(plan) == QueryPlanToSQL().translate(plan)
+    with pytest.raises(ValueError):
+        QueryPlanToSQL(lexer_backend="scanner").translate(plan, version=1)
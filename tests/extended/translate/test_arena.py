@@ -0,0 +1,70 @@
+import random
+from pathlib import Path
+import pytest
+from src.extended.arena import Arena, ArenaBuilder, ArenaSemanticVisitor, ArenaSQLEmitter
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+from tests.extended.translate.test_emitter import EXTENDED_INPUTS, random_expression
+
+INVALID_PLANS = [
+    "filter: \"a\" = 1 and not 'c';",
+    "filter: b in range(+1, \"x\") or -a;",
+    "filter: 1 + 2; order: a;",
+    "filter: a > ;",
+    "order: a, b desc; filter: x = 'y' or 2;",
+]
+
+
+def parse_both(text):
+    object_diagnostics, arena_diagnostics = Diagnostics(), Diagnostics()
+    ast = QPParserExtended(diagnostics=object_diagnostics).parse_text(text)
+    arena = QPParserExtended(diagnostics=arena_diagnostics, builder=ArenaBuilder()).parse_text(text)
+    return ast, object_diagnostics, arena, arena_diagnostics
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_arena_translation_matches_objects(input_path):
+    text = input_path.read_text()
+    expected = Translator(printer=None).translate(text)
+    assert Translator(printer=None, ast_backend="arena").translate(text) == expected
+
+
+def test_arena_matches_objects_random():
+    rng = random.Random(5)
+    for _ in range(200):
+        text = "filter: %s; order: a desc, b;" % random_expression(rng, 6)
+        ast, _, arena, _ = parse_both(text)
+        assert repr(arena.to_node()) == repr(ast)
+        assert ArenaSQLEmitter().emit(arena) == Translator(printer=None).translate(text)
+
+
+@pytest.mark.parametrize("text", INVALID_PLANS)
+def test_arena_reports_same_diagnostics(text):
+    ast, object_diagnostics, arena, arena_diagnostics = parse_both(text)
+    if ast is not None and not object_diagnostics.items:
+        SemanticVisitorExtended(object_diagnostics).visit(ast)
+        ArenaSemanticVisitor(arena_diagnostics).visit(arena)
+    assert object_diagnostics.items
+    assert list(arena_diagnostics) == list(object_diagnostics)
+
+
+def test_arena_children_come_before_parents():
+    arena = QPParserExtended(builder=ArenaBuilder()).parse_text("filter: not (a < 1 or b in range(1, 2)); order: c;")
+    assert isinstance(arena, Arena)
+    assert arena.root == len(arena) - 1
+    for i in range(len(arena)):
+        assert arena.left[i] < i and arena.right[i] < i
+    assert arena.nbytes() <= len(arena) * 32
+
+
+def test_arena_translator_reuse_after_error():
+    translator = Translator(printer=None, ast_backend="arena")
+    assert translator.translate("filter: a = 1 and ;") is None
+    assert translator.translate("filter: a = 1;") == "SELECT * FROM table1 WHERE (a = 1)  ;"
+
+
+def test_arena_not_supported_by_version_1():
+    with pytest.raises(ValueError):
+        Translator(1, ast_backend="arena")
@@ -0,0 +1,72 @@
+import io
+import random
+from pathlib import Path
+import pytest
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.translate import TranslationVisitorExtended
+from src.simple.emitter import SQLEmitter
+from src.simple.parser import QPParser
+from src.simple.semantic import SemanticVisitor
+from src.simple.translate import TranslationVisitor
+from src.utils.diagnostics import Diagnostics
+
+EXTENDED_INPUTS = sorted((Path(__file__).parent / "in").glob("t*.txt"))
+SIMPLE_INPUTS = sorted((Path(__file__).parent.parent.parent / "simple" / "semantic" / "in").glob("t*.txt"))
+
+
+def random_expression(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(["a > 1", "b = 2.5", "c != -3", "d <= e", "f in range(1 incl, 10)", "g in range(-1, 2 incl)"])
+    if rng.random() < 0.2:
+        return "not (%s)" % random_expression(rng, depth - 1)
+    op = rng.choice(["and", "or"])
+    return "(%s) %s (%s)" % (random_expression(rng, depth - 1), op, random_expression(rng, depth - 1))
+
+
+def emit_both(text, parser, semantic_visitor, translation_visitor, emitter):
+    ast = parser.parse_text(text)
+    semantic_visitor.visit(ast)
+    translation_visitor.visit(ast)
+    return ast.text, emitter.emit(ast)
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_emitter_matches_translation_visitor(input_path):
+    diagnostics = Diagnostics()
+    parser = QPParserExtended(diagnostics=diagnostics)
+    expected, emitted = emit_both(input_path.read_text(), parser, SemanticVisitorExtended(diagnostics),
+                                  TranslationVisitorExtended(), SQLEmitterExtended())
+    assert emitted == expected
+
+
+@pytest.mark.parametrize("input_path", SIMPLE_INPUTS, ids=lambda p: p.stem)
+def test_simple_emitter_matches_translation_visitor(input_path):
+    diagnostics = Diagnostics()
+    parser = QPParser(diagnostics=diagnostics)
+    ast = parser.parse_text(input_path.read_text())
+    if ast is None or diagnostics.items:
+        pytest.skip("input does not parse")
+    SemanticVisitor(diagnostics).visit(ast)
+    TranslationVisitor().visit(ast)
+    assert SQLEmitter().emit(ast) == ast.text
+
+
+def test_emitter_matches_translation_visitor_random():
+    rng = random.Random(12)
+    diagnostics = Diagnostics()
+    parser = QPParserExtended(diagnostics=diagnostics)
+    for _ in range(200):
+        text = "filter: %s; order: a desc, b, c desc;" % random_expression(rng, 6)
+        expected, emitted = emit_both(text, parser, SemanticVisitorExtended(diagnostics),
+                                      TranslationVisitorExtended(), SQLEmitterExtended())
+        assert emitted == expected
+
+
+def test_emitter_writes_to_buffer():
+    ast = QPParserExtended().parse_text("order: a; filter: b in range(1, 2 incl);")
+    buf = io.StringIO()
+    assert SQLEmitterExtended().emit(ast, buf) is None
+    assert buf.getvalue() == "SELECT * FROM table1 WHERE (1 < b AND b <= 2) ORDER BY a ;"
+    assert not hasattr(ast, "text")
@@ -0,0 +1,236 @@
+import random
+import sqlite3
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.extended.evaluator import (CompiledOrder, MaskCompilerExtended, OrderCompilerExtended, descending_key,
+                                   pack_sort_keys)
+from src.extended.optimizer import FilterOptimizerExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.segy.headers import HeaderRegistry
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+from tests.extended.translate.test_emitter import random_expression
+
+COLUMNS = ("a", "b", "c", "d", "e", "f", "g")
+
+
+def analyse(text, registry=None):
+    diagnostics = Diagnostics()
+    ast = QPParserExtended(diagnostics=diagnostics).parse_text(text)
+    SemanticVisitorExtended(diagnostics, registry).visit(ast)
+    assert not diagnostics.items
+    return ast
+
+
+def header_columns(rng: np.random.Generator, size: int) -> dict:
+    values = np.array([-3, -2, -1, 0, 1, 2, 3, 5, 9, 10, 11])
+    return {name: rng.choice(values, size).astype(np.int32) for name in COLUMNS}
+
+
+def sql_selection(columns: dict, plans: list[str], translator: Translator) -> list[list[int]]:
+    """Traces selected by each plan when its SQL translation runs on sqlite."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (trace INTEGER, %s)" % ", ".join("%s INTEGER" % name for name in columns))
+    rows = zip(range(len(columns["a"])), *(column.tolist() for column in columns.values()))
+    connection.executemany("INSERT INTO table1 VALUES (%s)" % ", ".join("?" * (len(columns) + 1)), rows)
+    return [sorted(row[0] for row in connection.execute(translator.translate(plan))) for plan in plans]
+
+
+def test_masks_match_sql_path():
+    rng = random.Random(23)
+    columns = header_columns(np.random.default_rng(23), 500)
+    plans = ["filter: %s;" % random_expression(rng, 5) for _ in range(200)]
+    plans += [
+        "filter: - a < -1 and not (b != 2);",
+        "filter: + c >= - - 2 or not (d in range(-2 incl, 3 incl));",
+        "filter: (a > 1) = (b > 1) and (c < 0) != true;",
+        "filter: a = 1 or a = 3 or a = 10 or b in range(0, 5);",
+        "filter: true; order: a desc;",
+        "filter: not false and - - e = 10;",
+        "order: b;",
+    ]
+    expected = sql_selection(columns, plans, Translator(printer=None, key_columns=("trace",)))
+    compiler = MaskCompilerExtended()
+    for plan, selected in zip(plans, expected):
+        mask = compiler.compile(analyse(plan))(columns)
+        assert mask.dtype == bool and mask.shape == (500,)
+        assert np.flatnonzero(mask).tolist() == selected, plan
+
+
+def test_optimized_masks_match():
+    rng = random.Random(5)
+    columns = header_columns(np.random.default_rng(5), 300)
+    compiler, optimizer = MaskCompilerExtended(), FilterOptimizerExtended()
+    for _ in range(200):
+        text = "filter: %s;" % random_expression(rng, 5).replace("d <= e", "d = %d" % rng.randint(-3, 3))
+        plain = compiler.compile(analyse(text))(columns)
+        optimizer.reset()
+        optimized = compiler.compile(optimizer.optimize(analyse(text)))(columns)
+        assert np.array_equal(plain, optimized), text
+
+
+def test_narrow_and_unsigned_columns_are_not_wrapped():
+    columns = {"a": np.array([-32768, 0, 32767], dtype=np.int16), "b": np.array([0, 1, 65535], dtype=np.uint16)}
+    compiler = MaskCompilerExtended()
+    assert compiler.compile(analyse("filter: - a > 32767;"))(columns).tolist() == [True, False, False]
+    assert compiler.compile(analyse("filter: - b < 0;"))(columns).tolist() == [False, True, True]
+    assert compiler.compile(analyse("filter: b in range(-1, 70000);"))(columns).tolist() == [True, True, True]
+
+
+def test_columns_are_found_by_field_and_case():
+    compiled = MaskCompilerExtended().compile(analyse("filter: coord_x > 1 and ELEV < 5;", HeaderRegistry()))
+    assert compiled.identifiers == ["coord_x", "ELEV"]
+    columns = {"cdp_x": np.array([1, 2, 3]), "elev": np.array([9, 4, 4])}
+    assert compiled(columns).tolist() == [False, True, True]
+    with pytest.raises(KeyError):
+        compiled({"cdp_x": columns["cdp_x"]})
+
+
+def test_constant_and_missing_filters():
+    compiler = MaskCompilerExtended()
+    assert compiler.compile(analyse("filter: not true;"))({}, 3).tolist() == [False] * 3
+    assert compiler.compile(analyse("order: a;"))({}, 2).tolist() == [True] * 2
+    with pytest.raises(ValueError):
+        compiler.compile(analyse("order: a;"))({})
+
+
+def test_columns_are_not_modified():
+    columns = {"a": np.array([0, 1, 2])}
+    mask = MaskCompilerExtended().compile(analyse("filter: a = 1 or not (a > 0) and a < 5;"))(columns)
+    assert mask.tolist() == [True, True, False] and columns["a"].tolist() == [0, 1, 2]
+
+
+def test_char_constants_are_rejected():
+    with pytest.raises(ValueError):
+        MaskCompilerExtended().compile(analyse("filter: a = 'c';"))
+
+
+def test_deep_chain_is_not_limited_by_recursion():
+    text = "filter: %s;" % " or ".join("a = %d" % i for i in range(5000))
+    mask = MaskCompilerExtended().compile(analyse(text))({"a": np.array([-1, 0, 4999, 5000])})
+    assert mask.tolist() == [False, True, True, False]
+
+
+def random_order(rng: random.Random) -> str:
+    names = rng.sample(COLUMNS, rng.randint(1, 4))
+    return ", ".join(name + rng.choice(["", " desc"]) for name in names)
+
+
+def test_orders_match_sql_path():
+    rng = random.Random(31)
+    columns = header_columns(np.random.default_rng(31), 400)
+    plans = ["filter: %s; order: %s;" % (random_expression(rng, 3), random_order(rng)) for _ in range(100)]
+    plans += ["order: %s;" % random_order(rng) for _ in range(50)]
+    # ORDER BY is not stable, the trace index makes the SQL order total
+    translator = Translator(printer=None, key_columns=("trace",))
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (trace INTEGER, %s)" % ", ".join(columns))
+    rows = zip(range(400), *(column.tolist() for column in columns.values()))
+    connection.executemany("INSERT INTO table1 VALUES (%s)" % ", ".join("?" * (len(columns) + 1)), rows)
+    masks, orders = MaskCompilerExtended(), OrderCompilerExtended()
+    for plan in plans:
+        expected = [row[0] for row in connection.execute(translator.translate(plan[:-1] + ", trace;"))]
+        ast = analyse(plan)
+        traces = orders.compile(ast)(columns, masks.compile(ast)(columns))
+        assert traces.tolist() == expected, plan
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.uint16, np.int32, np.uint32, np.int64, np.uint64,
+                                   np.float32, np.float64])
+def test_descending_keys_reverse_the_order(dtype):
+    info = np.finfo(dtype) if np.dtype(dtype).kind == "f" else np.iinfo(dtype)
+    values = np.unique(np.array([info.min, info.min + 1, 0, 1, 2, info.max - 1, info.max], dtype=dtype))
+    key = descending_key(values)
+    assert key.dtype == values.dtype
+    assert all(key[i] > key[i + 1] for i in range(len(values) - 1))
+    assert descending_key(np.array([-0.0, 0.0]))[0] == 0
+
+
+def test_mixed_keys_are_sorted_stably():
+    rng = np.random.default_rng(3)
+    columns = {"iline": rng.integers(0, 4, 300).astype(np.int16), "offset": rng.integers(-3, 3, 300),
+               "elev": rng.choice([-1.5, 0.0, 2.25], 300)}
+    traces = OrderCompilerExtended().compile(analyse("order: iline, offset desc, elev desc;"))(columns)
+    expected = sorted(range(300), key=lambda i: (columns["iline"][i], -columns["offset"][i], -columns["elev"][i]))
+    assert traces.tolist() == expected
+
+
+def test_rows_and_positions():
+    columns = {"a": np.array([2, 1, 2, 1, 2])}
+    compiled = OrderCompilerExtended().compile(analyse("order: a desc;"))
+    assert compiled(columns).tolist() == [0, 2, 4, 1, 3]
+    assert compiled(columns, np.array([True, True, False, True, True])).tolist() == [0, 4, 1, 3]
+    assert compiled(columns, [4, 3, 0]).tolist() == [4, 0, 3]
+    positions = (np.array([1, 0, 1, 0, 0]), np.array([9, 9, 5, 1, 7]))
+    assert compiled(columns, positions=positions).tolist() == [4, 2, 0, 3, 1]
+    assert compiled(columns, [0, 2, 4], positions=positions).tolist() == [4, 2, 0]
+
+
+def test_order_keys_are_found_by_field():
+    compiled = OrderCompilerExtended().compile(analyse("order: ILINE desc, coord_x;", HeaderRegistry()))
+    assert compiled.keys == [("ILINE", "inline", True), ("coord_x", "cdp_x", False)]
+    columns = {"inline": np.array([1, 2, 2]), "cdp_x": np.array([0, 5, 4])}
+    assert compiled(columns).tolist() == [2, 1, 0]
+
+
+def test_missing_order_keeps_the_rows():
+    compiled = OrderCompilerExtended().compile(analyse("filter: a > 1;"))
+    assert compiled.keys == []
+    assert compiled({}, size=3).tolist() == [0, 1, 2]
+    assert compiled({"a": np.array([5, 0, 7])}, [2, 0]).tolist() == [2, 0]
+
+
+def lexicographic(keys) -> list[int]:
+    return np.lexsort([descending_key(column) if descending else column for column, descending, _ in keys[::-1]]).tolist()
+
+
+@pytest.mark.parametrize("dtypes", [
+    (np.int16, np.int32, np.uint16),
+    (np.int8, np.bool_, np.int64),
+    (np.uint64, np.int32),
+    (np.int8, np.int32, np.uint64),
+])
+def test_packed_keys_sort_like_the_keys(dtypes):
+    rng = np.random.default_rng(len(dtypes))
+    for _ in range(20):
+        keys = []
+        for dtype in dtypes:
+            info = np.iinfo(dtype) if dtype is not np.bool_ else np.iinfo(np.uint8)
+            # few distinct values, some of them the extremes of the type, so there are ties
+            values = np.unique(np.array([info.min, info.min + 1, 0, 1, info.max - 1, info.max], dtype=dtype))
+            values = rng.choice(values, min(3, len(values)), replace=False)
+            keys.append((rng.choice(values, 200), bool(rng.integers(2)), None))
+        words = pack_sort_keys(keys)
+        assert words is not None and len(words) <= 2
+        assert np.lexsort(words[::-1]).tolist() == lexicographic(keys)
+
+
+def test_packed_key_widths():
+    column = np.arange(10, dtype=np.int32)
+    assert len(pack_sort_keys([(column, False, (0, 9))] * 3)) == 1
+    # 3 x 32 bits from the field widths need two words, keys are not split across them
+    limits = HeaderRegistry()["iline"].limits
+    assert len(pack_sort_keys([(column, False, limits), (column, True, limits), (column, False, limits)])) == 2
+    assert pack_sort_keys([(column, False, (0, 2 ** 40))] * 3) is None
+    assert pack_sort_keys([(column, False, (-2 ** 63, 2 ** 63))]) is None
+    assert pack_sort_keys([(column.astype(np.float64), False, None)]) is None
+
+
+def test_packed_order_matches_lexicographic_order():
+    rng = np.random.default_rng(9)
+    registry = HeaderRegistry()
+    columns = {"iline": rng.integers(100, 110, 1000, dtype=np.int32),
+               "xline": rng.integers(-5, 5, 1000).astype(np.int16),
+               "offset": rng.integers(0, 3000, 1000, dtype=np.int32),
+               "elev": rng.choice([-1.5, 0.0, 2.25], 1000)}
+    positions = (rng.integers(0, 3, 1000), np.arange(1000)[::-1])
+    mask = rng.integers(2, size=1000).astype(bool)
+    limits = {name: registry[name].limits for name in ("iline", "xline", "offset")}
+    for order in ("iline, xline, offset desc", "offset desc, iline desc", "xline, elev desc, iline"):
+        keys = OrderCompilerExtended().compile(analyse("order: %s;" % order)).keys
+        expected = CompiledOrder(keys, packed=False)(columns, mask, positions)
+        for key_limits in (None, limits):
+            assert CompiledOrder(keys)(columns, mask, positions, limits=key_limits).tolist() == expected.tolist()
@@ -0,0 +1,78 @@
+import random
+import sqlite3
+import pytest
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.optimizer import FilterOptimizerExtended
+from src.extended.parser import QPParserExtended
+from src.extended.qp_ast import InList
+from src.extended.semantic import SemanticVisitorExtended
+from src.extended.translate import TranslationVisitorExtended
+from src.translator import Translator
+
+
+def optimized_ast(text):
+    ast = QPParserExtended().parse_text(text)
+    SemanticVisitorExtended().visit(ast)
+    return FilterOptimizerExtended().optimize(ast)
+
+
+@pytest.mark.parametrize("text, where", [
+    ("filter: ffid = 101 or ffid = 102 or ffid = 103;", "(ffid IN (101, 102, 103))"),
+    ("filter: 3 = x or x = 1 or x = 2 or x = 1;", "(x IN (1, 2, 3))"),
+    ("filter: x = 1 or y = 2 or x = 3 or y = 5;", "((x IN (1, 3)) OR (y IN (2, 5)))"),
+    ("filter: (x = 1 or x = 2 or x in range(5, 10)) and y = 1;",
+     "(((x IN (1, 2)) OR (5 < x AND x < 10)) AND (y = 1))"),
+    ("filter: x > 1 and (x = 1 or x = 2 or x = 3);", "(x IN (2, 3))"),
+    ("filter: x = 1 or x = 'c';", "((x = 1) OR (x = 'c'))"),
+])
+def test_equalities_become_in_lists(text, where):
+    assert Translator(printer=None, optimize=True).translate(text) == "SELECT * FROM table1 WHERE %s  ;" % where
+
+
+def test_translation_visitor_matches_emitter():
+    ast = optimized_ast("filter: (x = 1 or x = 2.5 or x = -3) and y != 0;")
+    assert isinstance(ast.steps[0].expression.lvalue, InList)
+    TranslationVisitorExtended().visit(ast)
+    assert ast.text == SQLEmitterExtended().emit(ast)
+
+
+def test_large_lists_use_a_value_table():
+    ast = optimized_ast("filter: (x = 1 or x = 2 or x = 3) and (y = 4 or y = 5) and z = 'c';")
+    assert SQLEmitterExtended(value_table_threshold=2).emit(ast) == (
+        "WITH in_values_1 (value) AS (VALUES (1), (2), (3)) "
+        "SELECT * FROM table1 WHERE (((x IN (SELECT value FROM in_values_1)) AND (y IN (4, 5))) AND (z = 'c'))  ;")
+    translator = Translator(printer=None, optimize=True, paramstyle="qmark", value_table_threshold=1)
+    result = translator.translate("filter: (x = 1 or x = 2) and (y = 4 or y = 5) and z = 'c';")
+    assert result.sql == (
+        "WITH in_values_1 (value) AS (VALUES (?), (?)), in_values_2 (value) AS (VALUES (?), (?)) "
+        "SELECT * FROM table1 WHERE (((x IN (SELECT value FROM in_values_1)) AND "
+        "(y IN (SELECT value FROM in_values_2))) AND (z = ?))  ;")
+    assert result.parameters == (1, 2, 4, 5, "c")
+
+
+def test_in_lists_select_the_same_rows():
+    rng = random.Random(18)
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (x, y)")
+    connection.executemany("INSERT INTO table1 VALUES (?, ?)",
+                           [(x, y) for x in [None, *range(-5, 25)] for y in (None, 0, 1, 2)])
+    plain = Translator(printer=None)
+    optimized = Translator(printer=None, optimize=True)
+    tables = Translator(printer=None, optimize=True, paramstyle="qmark", value_table_threshold=3)
+    for _ in range(200):
+        terms = ["%s = %d" % (rng.choice("xy"), rng.randrange(-3, 22)) for _ in range(rng.randint(1, 12))]
+        terms += ["x in range(%d, %d incl)" % (rng.randrange(0, 10), rng.randrange(5, 20))] * rng.randint(0, 1)
+        rng.shuffle(terms)
+        text = "filter: (%s) and y != 2;" % " or ".join(terms)
+        expected = connection.execute(plain.translate(text)).fetchall()
+        assert connection.execute(optimized.translate(text)).fetchall() == expected, text
+        result = tables.translate(text)
+        assert connection.execute(result.sql, result.parameters).fetchall() == expected, text
+
+
+def test_thousands_of_equalities():
+    text = "filter: %s;" % " or ".join("ffid = %d" % i for i in range(5000, 0, -1))
+    translator = Translator(printer=None, optimize=True)
+    assert translator.translate(text) == "SELECT * FROM table1 WHERE (ffid IN (%s))  ;" % ", ".join(
+        str(i) for i in range(1, 5001))
+    assert translator.rewrites == {"in_list": 1}
@@ -0,0 +1,158 @@
+import random
+import sqlite3
+import pytest
+from src.extended.emitter import SQLEmitterExtended
+from src.extended.optimizer import FilterOptimizerExtended
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.cache import TranslationCache
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+from tests.extended.translate.test_emitter import EXTENDED_INPUTS, random_expression
+
+
+def optimize(text):
+    diagnostics = Diagnostics()
+    ast = QPParserExtended(diagnostics=diagnostics).parse_text(text)
+    SemanticVisitorExtended(diagnostics).visit(ast)
+    assert not diagnostics.items
+    optimizer = FilterOptimizerExtended()
+    return SQLEmitterExtended().emit(optimizer.optimize(ast)), dict(optimizer.rewrites)
+
+
+@pytest.mark.parametrize("text, where, rewrites", [
+    ("filter: not not (x > 1) and true;", "(x > 1)", {"double_negation": 1, "short_circuit": 1}),
+    ("filter: not (a > 1 and b < 2);", "((a <= 1) OR (b >= 2))", {"de_morgan": 1, "push_not": 2}),
+    ("filter: not (a in range(1, 5 incl));", "((a <= 1) OR (a > 5))", {"push_not": 1}),
+    ("filter: a = - 5 or - - 2 < b;", "((a = -5) OR (2 < b))", {"fold_constant": 3}),
+    ("filter: a > 1 and (b < 2 and c = 3);", "(((a > 1) AND (b < 2)) AND (c = 3))", {"flatten": 1}),
+    ("filter: a > 1 and b < 2 and a > 1;", "((a > 1) AND (b < 2))", {"duplicate": 1}),
+    ("filter: (a > 1 or true) and b = 2;", "(b = 2)", {"short_circuit": 2}),
+    ("filter: a > 1 and false;", "false", {"short_circuit": 1}),
+    ("filter: not true or a = 1;", "(a = 1)", {"fold_constant": 1, "short_circuit": 1}),
+    ("filter: a > 1 or b < 2;", "((a > 1) OR (b < 2))", {}),
+])
+def test_rewrites(text, where, rewrites):
+    assert optimize(text) == ("SELECT * FROM table1 WHERE %s  ;" % where, rewrites)
+
+
+@pytest.mark.parametrize("text, where, rewrites", [
+    ("filter: x in range(1, 5) or x in range(5 incl, 10) or x in range(20, 30);",
+     "((1 < x AND x < 10) OR (20 < x AND x < 30))", {"merge_ranges": 1}),
+    ("filter: x in range(1, 5) or x in range(5, 10);", "((1 < x AND x < 5) OR (5 < x AND x < 10))", {}),
+    ("filter: x > 3 and x < 10 and y = 2 and x >= 5;", "((5 <= x AND x < 10) AND (y = 2))", {"merge_ranges": 1}),
+    ("filter: 5 > x and x > 2;", "(2 < x AND x < 5)", {"merge_ranges": 1}),
+    ("filter: x = 3 or x = 4 or x in range(3, 4);", "(3 <= x AND x <= 4)", {"merge_ranges": 1}),
+    ("filter: x > 3 and (x < 1 or x > 8);", "(x > 8)", {"merge_ranges": 1}),
+    ("filter: (x > 3 and x < 1) or y = 2;", "(y = 2)", {"contradiction": 1}),
+    ("filter: x < 1 or x >= 1;", "((x < 1) OR (x >= 1))", {}),
+    ("filter: x != 3 and x != 4;", "((x <> 3) AND (x <> 4))", {}),
+])
+def test_range_rewrites(text, where, rewrites):
+    assert optimize(text) == ("SELECT * FROM table1 WHERE %s  ;" % where, rewrites)
+
+
+@pytest.mark.parametrize("text", [
+    "filter: x > 3 and x < 1;",
+    "filter: x in range(5, 1);",
+    "filter: x in range(2, 2 incl);",
+    "filter: (x > 1 or y > 1) and x in range(1 incl, 3) and not (x < 4);",
+])
+def test_contradictions_are_empty(text):
+    translator = Translator(printer=None, optimize=True)
+    assert translator.translate(text) == "SELECT * FROM table1 WHERE false  ;"
+    assert translator.empty
+    translator.translate("filter: x in range(2 incl, 2 incl);")
+    assert not translator.empty
+
+
+def test_empty_translations_are_not_cached():
+    cache = TranslationCache(16)
+    translator = Translator(printer=None, cache=cache, optimize=True)
+    for _ in range(2):
+        translator.translate("filter: x > 3 and x < 1;")
+        assert translator.empty
+    assert len(cache) == 0
+
+
+def range_expression(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.3:
+        bound = lambda: rng.choice(["-2", "0", "1", "1.5", "3"]) + rng.choice(["", " incl"])
+        return rng.choice([
+            "x %s %s" % (rng.choice(["<", "<=", ">", ">=", "=", "!="]), rng.choice(["-2", "0", "1", "1.5", "3"])),
+            "x in range(%s, %s)" % (bound(), bound()),
+            "y = 1",
+        ])
+    if rng.random() < 0.15:
+        return "not (%s)" % range_expression(rng, depth - 1)
+    op = rng.choice(["and", "or"])
+    return "(%s) %s (%s)" % (range_expression(rng, depth - 1), op, range_expression(rng, depth - 1))
+
+
+def test_folded_ranges_select_the_same_rows():
+    rng = random.Random(17)
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (x, y)")
+    xs = [None, -3, -2, -1, 0, 0.5, 1, 1.25, 1.5, 2, 3, 4]
+    connection.executemany("INSERT INTO table1 VALUES (?, ?)", [(x, y) for x in xs for y in (None, 0, 1)])
+    plain, optimized = Translator(printer=None), Translator(printer=None, optimize=True)
+    for _ in range(300):
+        text = "filter: %s;" % range_expression(rng, 4)
+        expected = connection.execute(plain.translate(text)).fetchall()
+        assert connection.execute(optimized.translate(text)).fetchall() == expected, text
+        assert not optimized.empty or not expected, text
+
+
+def test_order_is_kept():
+    sql, _ = optimize("order: b desc, a; filter: not (a != 1);")
+    assert sql == "SELECT * FROM table1 WHERE (a = 1) ORDER BY b DESC , a ;"
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_optimized_fixtures_translate(input_path):
+    text = input_path.read_text()
+    plain = Translator(printer=None).translate(text)
+    optimized = Translator(printer=None, optimize=True).translate(text)
+    assert (plain is None) == (optimized is None)
+
+
+def test_optimized_filters_select_the_same_rows():
+    rng = random.Random(16)
+    columns = "abcdefg"
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (%s)" % ", ".join(columns))
+    values = [None, -3, -1, 0, 1, 2, 2.5, 10]
+    rows = [tuple(rng.choice(values) for _ in columns) for _ in range(300)]
+    connection.executemany("INSERT INTO table1 VALUES (%s)" % ", ".join("?" * len(columns)), rows)
+    plain, optimized = Translator(printer=None), Translator(printer=None, optimize=True)
+    for _ in range(200):
+        expression = random_expression(rng, 5)
+        if rng.random() < 0.5:
+            expression = "not not (%s) and %s" % (expression, rng.choice(["true", "not false", "(%s)" % expression]))
+        text = "filter: %s;" % expression
+        expected = connection.execute(plain.translate(text)).fetchall()
+        assert connection.execute(optimized.translate(text)).fetchall() == expected, text
+
+
+def test_deep_chain_is_not_limited_by_recursion():
+    text = "filter: %s;" % " and ".join("not not (a%d > %d)" % (i, i) for i in range(5000))
+    translator = Translator(printer=None, optimize=True)
+    sql = translator.translate(text)
+    assert sql.count("AND") == 4999
+    assert translator.rewrites == {"double_negation": 5000}
+
+
+def test_translator_rewrites_are_per_call():
+    translator = Translator(printer=None, optimize=True)
+    translator.translate("filter: a > 1 and true;")
+    assert translator.rewrites == {"short_circuit": 1}
+    translator.translate("filter: a > 1;")
+    assert translator.rewrites == {}
+    assert Translator(printer=None).rewrites == {}
+
+
+def test_optimizer_not_supported_by_arena_or_version_1():
+    with pytest.raises(ValueError):
+        Translator(ast_backend="arena", optimize=True)
+    with pytest.raises(ValueError):
+        Translator(1, optimize=True)
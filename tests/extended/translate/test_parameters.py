@@ -0,0 +1,76 @@
+import json
+import pytest
+from src.batch import translate_many, translate_ndjson
+from src.cache import TranslationCache
+from src.translator import Translator
+from src.utils.parameters import ParameterizedSQL
+from tests.extended.translate.test_emitter import EXTENDED_INPUTS
+
+
+def test_constants_become_parameters_in_order():
+    translator = Translator(printer=None, paramstyle="numeric")
+    result = translator.translate("filter: a in range(1, 5 incl) or b = 'x' and not (c = true); order: a;")
+    assert isinstance(result, ParameterizedSQL)
+    assert result.sql == ("SELECT * FROM table1 WHERE ((:1 < a AND a <= :2) OR ((b = :3) AND (NOT (c = :4))))"
+                          " ORDER BY a ;")
+    assert result.parameters == (1, 5, "x", True)
+
+
+def test_plans_differing_in_constants_share_shape():
+    translator = Translator(printer=None)
+    parameterized = Translator(printer=None, paramstyle="qmark")
+    first = parameterized.translate("filter: a > 1 and b != 'x';")
+    second = parameterized.translate("filter: a > 27 and b != 'y';")
+    assert first.sql == second.sql == "SELECT * FROM table1 WHERE ((a > ?) AND (b <> ?))  ;"
+    assert first.shape == second.shape
+    assert first.parameters != second.parameters
+    assert parameterized.translate("filter: a >= 1 and b != 'x';").shape != first.shape
+    assert translator.translate("filter: a > 1 and b != 'x';") == "SELECT * FROM table1 WHERE ((a > 1) AND (b <> 'x'))  ;"
+
+
+@pytest.mark.parametrize("paramstyle, placeholder", [("qmark", "?"), ("numeric", ":1"), ("format", "%s")])
+def test_paramstyles(paramstyle, placeholder):
+    result = Translator(printer=None, paramstyle=paramstyle).translate("filter: a = 3;")
+    assert result.sql == "SELECT * FROM table1 WHERE (a = %s)  ;" % placeholder
+    assert result.parameters == (3,)
+
+
+def test_unknown_paramstyle():
+    with pytest.raises(ValueError):
+        Translator(paramstyle="named")
+    with pytest.raises(ValueError):
+        translate_many(["filter: a = 1;"], workers=1, paramstyle="pyformat")
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_arena_parameters_match_objects(input_path):
+    text = input_path.read_text()
+    expected = Translator(printer=None, paramstyle="numeric").translate(text)
+    assert Translator(printer=None, ast_backend="arena", paramstyle="numeric").translate(text) == expected
+
+
+def test_simple_version_parameters():
+    result = Translator(1, printer=None, paramstyle="qmark").translate("filter: a = 1 and b = 'c';")
+    assert result.sql.count("?") == 2
+    assert result.parameters == (1, "c")
+
+
+def test_shared_cache_keeps_styles_apart():
+    cache = TranslationCache(16)
+    text = "filter: a = 1;"
+    assert Translator(printer=None, cache=cache).translate(text) == "SELECT * FROM table1 WHERE (a = 1)  ;"
+    assert Translator(printer=None, cache=cache, paramstyle="qmark").translate(text).sql == \
+        "SELECT * FROM table1 WHERE (a = ?)  ;"
+
+
+def test_ndjson_writes_parameters_and_shape(tmp_path):
+    source = tmp_path / "plans.ndjson"
+    target = tmp_path / "sql.ndjson"
+    source.write_text(json.dumps({"id": 1, "plan": "filter: a < 2.5;"}) + "\n" +
+                      json.dumps({"id": 2, "plan": "filter: a <;"}) + "\n")
+    with open(source) as src, open(target, "w") as dst:
+        translate_ndjson(src, dst, Translator(printer=None, paramstyle="qmark"))
+    ok, error = [json.loads(line) for line in target.read_text().splitlines()]
+    assert ok["sql"] == "SELECT * FROM table1 WHERE (a < ?)  ;"
+    assert ok["parameters"] == [2.5] and ok["shape"]
+    assert error["sql"] is None and error["parameters"] is None and error["errors"]
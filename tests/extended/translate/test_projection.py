@@ -0,0 +1,63 @@
+import random
+import sqlite3
+import pytest
+from src.translator import Translator
+from src.utils.projection import select_list
+from tests.extended.translate.test_emitter import EXTENDED_INPUTS, random_expression
+
+KEY_COLUMNS = ("fldr", "tracf")
+
+
+def test_select_list():
+    assert select_list(["a", "b", "a", "fldr"], KEY_COLUMNS) == "fldr, tracf, a, b"
+    assert select_list([], ()) == "*"
+    assert select_list(["b", "a"], ()) == "b, a"
+
+
+@pytest.mark.parametrize("text, columns", [
+    ("filter: a > 1; order: b;", "fldr, tracf, a, b"),
+    ("order: b, z desc; filter: a > 1 and x in range(1, 2) or - c = a;", "fldr, tracf, a, x, c, b, z"),
+    ("order: tracf desc;", "fldr, tracf"),
+    ("", "fldr, tracf"),
+])
+def test_only_referenced_columns_are_selected(text, columns):
+    for ast_backend in ("objects", "arena"):
+        sql = Translator(printer=None, ast_backend=ast_backend, key_columns=KEY_COLUMNS).translate(text)
+        assert sql.startswith("SELECT %s FROM table1 " % columns)
+
+
+def test_simple_version_projection():
+    sql = Translator(1, printer=None, key_columns=["ffid"]).translate("filter: a = 1 and b = 'c'; order: d;")
+    assert sql.startswith("SELECT ffid, a, b, d FROM Table ")
+
+
+def test_no_key_columns_selects_everything():
+    assert Translator(printer=None).translate("filter: a > 1;") == "SELECT * FROM table1 WHERE (a > 1)  ;"
+    assert Translator(printer=None, key_columns=()).translate("filter: a > 1;") == \
+        "SELECT a FROM table1 WHERE (a > 1)  ;"
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_arena_projection_matches_objects(input_path):
+    text = input_path.read_text()
+    expected = Translator(printer=None, key_columns=KEY_COLUMNS).translate(text)
+    assert Translator(printer=None, ast_backend="arena", key_columns=KEY_COLUMNS).translate(text) == expected
+
+
+def test_projection_selects_the_same_rows():
+    rng = random.Random(20)
+    columns = ("fldr", "tracf", *"abcdefg", "unused")
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (%s)" % ", ".join(columns))
+    connection.executemany("INSERT INTO table1 VALUES (%s)" % ", ".join("?" * len(columns)),
+                           [tuple(rng.choice([None, -1, 0, 1, 2.5, 3]) for _ in columns) for _ in range(200)])
+    plain = Translator(printer=None)
+    projected = Translator(printer=None, key_columns=KEY_COLUMNS, optimize=True, sargable=True)
+    for _ in range(100):
+        text = "filter: %s; order: fldr, tracf;" % random_expression(rng, 4)
+        cursor = connection.execute(projected.translate(text))
+        selected = [description[0] for description in cursor.description]
+        assert selected[:2] == list(KEY_COLUMNS) and "unused" not in selected
+        indexes = [columns.index(column) for column in selected]
+        expected = [tuple(row[i] for i in indexes) for row in connection.execute(plain.translate(text))]
+        assert cursor.fetchall() == expected, text
@@ -0,0 +1,49 @@
+import pytest
+from src.cache import TranslationCache
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.segy.headers import HeaderRegistry
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+
+
+def test_fields_are_attached_to_identifiers():
+    registry = HeaderRegistry()
+    ast = QPParserExtended().parse_text("filter: coord_x > 10 and ns in range(1, 2); order: FLDR desc;")
+    visitor = SemanticVisitorExtended(Diagnostics(None), registry)
+    visitor.visit(ast)
+    assert not visitor.has_error()
+    expression = ast.steps[0].expression
+    assert expression.lvalue.lvalue.field is registry["cdp_x"]
+    assert expression.rvalue.data.field.dtype == ">u2"
+    assert ast.steps[1].orderings[0].field.name == "field_record"
+
+
+@pytest.mark.parametrize("version, ast_backend", [(1, "objects"), (2, "objects"), (2, "arena")])
+def test_unknown_identifiers_are_rejected(version, ast_backend):
+    translator = Translator(version, printer=None, ast_backend=ast_backend, registry=HeaderRegistry())
+    assert translator.translate("filter: cdp_x > 10;\norder: iline, xline;") is not None
+    assert translator.translate("filter: cdp_xx > 10;\norder: iline, x;") is None
+    errors = [(e.stage, e.code, e.message, e.line) for e in translator.diagnostics]
+    assert errors == [
+        ("semantic", 7, "Unknown header field cdp_xx", 1),
+        ("semantic", 7, "Unknown header field x", 2),
+    ]
+
+
+def test_without_registry_any_identifier_is_a_number():
+    assert Translator(printer=None).translate("filter: cdp_xx > 10;") == "SELECT * FROM table1 WHERE (cdp_xx > 10)  ;"
+
+
+def test_custom_fields():
+    registry = HeaderRegistry()
+    registry.register("sail_line", 233, 4)
+    assert Translator(printer=None, registry=registry).translate("filter: sail_line = 3;") is not None
+    assert Translator(printer=None, registry=HeaderRegistry()).translate("filter: sail_line = 3;") is None
+
+
+def test_cache_is_keyed_by_registry():
+    cache = TranslationCache()
+    plan = "filter: sail_line = 3;"
+    assert Translator(printer=None, cache=cache).translate(plan) is not None
+    assert Translator(printer=None, cache=cache, registry=HeaderRegistry()).translate(plan) is None
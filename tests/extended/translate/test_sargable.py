@@ -0,0 +1,88 @@
+import random
+import sqlite3
+import pytest
+from src.translator import Translator
+from tests.extended.translate.test_emitter import EXTENDED_INPUTS, random_expression
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE table1 (a, b, c, d, e, f, g, x, y)")
+    for column in "abcdefgxy":
+        connection.execute("CREATE INDEX index_%s ON table1 (%s)" % (column, column))
+    rng = random.Random(19)
+    values = [None, -3, -1, 0, 1, 2, 2.5, 3, 5, 10]
+    connection.executemany("INSERT INTO table1 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           [tuple(rng.choice(values) for _ in range(9)) for _ in range(400)])
+    return connection
+
+
+@pytest.mark.parametrize("text, where", [
+    ("filter: - 5 < x;", "x > -5"),
+    ("filter: x >= - - 3;", "x >= 3"),
+    ("filter: 2 = x;", "x = 2"),
+    ("filter: x in range(1 incl, 5 incl);", "x BETWEEN 1 AND 5"),
+    ("filter: x in range(-1, 2 incl);", "x > -1 AND x <= 2"),
+    ("filter: not (y <= 3);", "y > 3"),
+    ("filter: a > 1 and (b = 1 or c = 2) and d = 3;", "a > 1 AND (b = 1 OR c = 2) AND d = 3"),
+    ("filter: a in range(1, 2) or b = 1 and c = 2;", "a > 1 AND a < 2 OR b = 1 AND c = 2"),
+    ("filter: not (a > 1 and b < 2);", "NOT (a > 1 AND b < 2)"),
+    ("filter: (a > 1) = (b < 2) and - a > - - b;", "(a > 1) = (b < 2) AND -a > -(-b)"),
+])
+def test_sargable_predicates(text, where):
+    assert Translator(printer=None, sargable=True).translate(text) == "SELECT * FROM table1 WHERE %s  ;" % where
+
+
+def test_sargable_parameters_are_signed():
+    result = Translator(printer=None, sargable=True, paramstyle="qmark").translate(
+        "filter: - 5 < x and x in range(-2 incl, 7 incl); order: x desc;")
+    assert result.sql == "SELECT * FROM table1 WHERE x > ? AND x BETWEEN ? AND ? ORDER BY x DESC ;"
+    assert result.parameters == (-5, -2, 7)
+
+
+@pytest.mark.parametrize("text", [
+    "filter: not (x <= 1);",
+    "filter: - 5 > x;",
+    "filter: x in range(1 incl, 3 incl) and y != 0;",
+    "filter: - 1 = x or - 2 = y;",
+])
+def test_sqlite_uses_an_index(connection, text):
+    sql = Translator(printer=None, sargable=True).translate(text)
+    details = " ".join(row[-1] for row in connection.execute("EXPLAIN QUERY PLAN " + sql))
+    assert "USING INDEX" in details, details
+    assert "SCAN" not in details, details
+
+
+def test_negated_comparison_is_no_longer_a_scan(connection):
+    text = "filter: not (x <= 1);"
+    details = [row[-1] for row in connection.execute("EXPLAIN QUERY PLAN " + Translator(printer=None).translate(text))]
+    assert details == ["SCAN table1"]
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_sargable_filters_select_the_same_rows(connection, optimize):
+    rng = random.Random(190)
+    plain = Translator(printer=None)
+    sargable = Translator(printer=None, sargable=True, optimize=optimize)
+    for _ in range(200):
+        expression = random_expression(rng, 5)
+        if rng.random() < 0.3:
+            expression = "not (%s) or - %d < x or x in range(-1 incl, %d incl)" % (
+                expression, rng.randrange(5), rng.randrange(5))
+        text = "filter: %s;" % expression
+        # an index changes the order rows are returned in
+        expected = sorted(map(repr, connection.execute(plain.translate(text))))
+        assert sorted(map(repr, connection.execute(sargable.translate(text)))) == expected, text
+
+
+@pytest.mark.parametrize("input_path", EXTENDED_INPUTS, ids=lambda p: p.stem)
+def test_sargable_fixtures_translate(input_path):
+    text = input_path.read_text()
+    assert (Translator(printer=None).translate(text) is None) == \
+        (Translator(printer=None, sargable=True).translate(text) is None)
+
+
+def test_sargable_not_supported_by_arena():
+    with pytest.raises(ValueError):
+        Translator(ast_backend="arena", sargable=True)
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pytest
+from src.query_plan_to_sql import QueryPlanToSQL
+from src.translator import Translator
+from tests.utils import resolve_test_files
+
+
+@pytest.mark.parametrize(
+    "test_name",
+    [
+        "t01",
+        "t02",
+        "t03",
+        "t04",
+        "t05",
+        "t06",
+        "t07",
+        "t08",
+        "t09",
+        "t10"
+    ],
+)
+def test_translate(test_name, capfd):
+    input_path, expected_path = resolve_test_files(test_name, Path(__file__).parent.absolute())
+
+    qptsql = QueryPlanToSQL()
+    with open(input_path) as f_in, open(expected_path) as f_ex:
+        print(qptsql.translate(f_in.read()))
+        captured = capfd.readouterr()
+        expect = f_ex.read()
+    assert captured.out == expect
+
+
+def test_translator_reuse_after_error(capfd):
+    translator = Translator()
+    assert translator.translate("filter: \"abc\" and 1;") is None
+    assert translator.translate("filter: a = 10;") == "SELECT * FROM table1 WHERE (a = 10)  ;"
+    assert translator.translate("filter: a = ;") is None
+    assert translator.translate("order: a desc;") == "SELECT * FROM table1  ORDER BY a DESC ;"
+
+
+def test_translator_shared_across_threads():
+    translator = Translator()
+    plans = ["filter: a%d > %d;" % (i, i) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(translator.translate, plans))
+    assert results == ["SELECT * FROM table1 WHERE (a%d > %d)  ;" % (i, i) for i in range(200)]
+
+
+def test_translator_unsupported_version():
+    with pytest.raises(ValueError):
+        Translator(3)
@@ -0,0 +1,71 @@
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from src.batch import TranslationResult, translate_many
+from src.query_plan_to_sql import QueryPlanToSQL
+from src.utils.coord import Coord
+from src.utils.diagnostics import Diagnostic
+
+
+PLANS = ["filter: a%d > %d;" % (i, i) for i in range(50)] + ["filter: a > ;", "filter: \"abc\" and 1;"]
+
+
+def test_translate_many_preserves_order_and_reports_errors():
+    results = translate_many(PLANS, workers=3, chunksize=4)
+    assert len(results) == len(PLANS)
+    for i, result in enumerate(results[:50]):
+        assert result == TranslationResult("SELECT * FROM table1 WHERE (a%d > %d)  ;" % (i, i), [])
+    assert results[50].sql is None
+    assert results[50].errors == [Diagnostic("parser", 1, "Before ;", Coord(1, 12))]
+    assert results[51].sql is None
+    assert [(e.stage, e.code) for e in results[51].errors] == [("semantic", 3), ("semantic", 4)]
+
+
+def test_translate_many_matches_sequential_translation():
+    qptsql = QueryPlanToSQL(cache_entries=0)
+    plans = ["filter: a > 1;", "order: b desc;", "filter: a > 1 and b < 2;"]
+    parallel = qptsql.translate_many(plans, version=1, workers=2)
+    sequential = qptsql.translate_many(plans, version=1, workers=1)
+    assert parallel == sequential
+    assert [r.sql for r in parallel] == [qptsql.translate(plan, version=1) for plan in plans]
+
+
+def test_translate_many_does_not_print(capfd):
+    translate_many(["filter: a > ;", "filter: a ! 1;"], workers=1)
+    assert capfd.readouterr().out == ""
+
+
+def test_translate_many_empty():
+    assert translate_many([], workers=4) == []
+
+
+def test_translate_ndjson_stream():
+    records = [
+        '{"id": 1, "plan": "filter: a > 1;"}',
+        '',
+        '{"id": "b", "plan": "filter: a > ;"}',
+        'not json',
+        '{"id": 3}',
+    ]
+    in_file, out_file = io.StringIO("\n".join(records) + "\n"), io.StringIO()
+    assert QueryPlanToSQL().translate_ndjson(in_file, out_file) == 4
+    results = [json.loads(line) for line in out_file.getvalue().splitlines()]
+    assert results[0] == {"id": 1, "sql": "SELECT * FROM table1 WHERE (a > 1)  ;", "errors": []}
+    assert results[1] == {"id": "b", "sql": None, "errors": [
+        {"stage": "parser", "code": 1, "message": "Before ;", "line": 1, "column": 12}
+    ]}
+    assert results[2]["id"] is None and results[2]["errors"][0]["message"].startswith("Invalid record at line 4")
+    assert results[3] == {"id": None, "sql": None, "errors": [
+        {"stage": "input", "code": 1, "message": "Invalid record at line 5: missing key 'plan'", "line": None,
+         "column": None}
+    ]}
+
+
+def test_query_plan_to_sql_cli_ndjson(tmp_path):
+    in_path, out_path = tmp_path / "plans.ndjson", tmp_path / "sql.ndjson"
+    in_path.write_text('{"id": 7, "plan": "order: a desc;"}\n')
+    subprocess.run([sys.executable, "-m", "src.query_plan_to_sql", "--ndjson", "-i", str(in_path), "-o", str(out_path)],
+                   check=True, cwd=Path(__file__).parent.parent)
+    assert json.loads(out_path.read_text()) == {"id": 7, "sql": "SELECT * FROM table1  ORDER BY a DESC ;", "errors": []}
@@ -0,0 +1,56 @@
+from src.cache import TranslationCache
+from src.query_plan_to_sql import QueryPlanToSQL
+
+
+def test_cache_hits_ignore_layout_comments_and_keyword_case():
+    qptsql = QueryPlanToSQL()
+    first = qptsql.translate("filter: a > 10 and b = 1; order: c desc;")
+    second = qptsql.translate("/- resubmitted -/\nFILTER:\n    a > 10 AND b = 1;\nORDER: c DESC; // again")
+    assert first == second
+    info = qptsql.cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_cache_distinguishes_identifiers_constants_and_versions():
+    qptsql = QueryPlanToSQL()
+    plans = ["filter: a > 10;", "filter: A > 10;", "filter: a > 10.0;", "filter: a > 11;"]
+    results = [qptsql.translate(plan) for plan in plans]
+    assert len(set(results)) == len(plans)
+    assert qptsql.translate("filter: a > 10;", version=1) != results[0]
+    assert qptsql.cache.info().hits == 0
+
+
+def test_cache_does_not_store_failures(capfd):
+    qptsql = QueryPlanToSQL()
+    assert qptsql.translate("filter: a > ;") is None
+    assert qptsql.translate("filter: a > ;") is None
+    assert capfd.readouterr().out.count("Parser error") == 2
+    assert len(qptsql.cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TranslationCache(max_entries=2)
+    cache.put(b"a", "1")
+    cache.put(b"b", "2")
+    assert cache.get(b"a") == "1"
+    cache.put(b"c", "3")
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "1" and cache.get(b"c") == "3"
+    assert cache.info().evictions == 1
+
+
+def test_cache_is_bounded_by_size():
+    cache = TranslationCache(max_entries=100, max_size=1000)
+    for i in range(20):
+        cache.put(b"%d" % i, "x" * 200)
+    info = cache.info()
+    assert info.size <= 1000
+    assert info.evictions == 20 - info.entries
+    cache.put(b"huge", "x" * 2000)
+    assert cache.get(b"huge") is None
+
+
+def test_cache_disabled():
+    qptsql = QueryPlanToSQL(cache_entries=0)
+    assert qptsql.cache is None
+    assert qptsql.translate("filter: a > 10;") == "SELECT * FROM table1 WHERE (a > 10)  ;"
@@ -0,0 +1,83 @@
+import pytest
+from src.extended.lexer import QPLexerExtended
+from src.extended.parser import QPParserExtended
+from src.query_plan_to_sql import QueryPlanToSQL
+from src.simple.lexer import QPLexer
+from src.simple.parser import QPParser
+from src.translator import Translator
+from src.utils.coord import Coord
+from src.utils.diagnostics import Diagnostic, Diagnostics
+
+
+@pytest.mark.parametrize("lexer_class", [QPLexer, QPLexerExtended])
+def test_lexer_reports_to_sink(lexer_class, capfd):
+    diagnostics = Diagnostics()
+    lexer = lexer_class(diagnostics)
+    list(lexer.tokenize("filter: a > 1 ?\n\"abc"))
+    assert list(diagnostics) == [
+        Diagnostic("lexer", 1, "Illegal character '?'", Coord(1, 14)),
+        Diagnostic("lexer", 3, "Unterminated string", Coord(2, 1)),
+    ]
+    assert capfd.readouterr().out == ""
+
+
+@pytest.mark.parametrize("lexer_class,parser_class", [(QPLexer, QPParser), (QPLexerExtended, QPParserExtended)])
+def test_parser_shares_lexer_sink(lexer_class, parser_class, capfd):
+    diagnostics = Diagnostics()
+    parser = parser_class(lexer_class(diagnostics))
+    assert parser.diagnostics is diagnostics
+    parser.parse_text("filter: a >")
+    assert list(diagnostics) == [Diagnostic("parser", 2, "At the end of input")]
+    assert capfd.readouterr().out == ""
+
+
+@pytest.mark.parametrize("parser_class", [QPParser, QPParserExtended])
+def test_default_parsers_have_own_sink(parser_class, capfd):
+    first, second = parser_class(), parser_class()
+    assert first.lex is not second.lex
+    assert first.diagnostics is not second.diagnostics
+    first.parse_text("filter: a > ?")
+    assert [d.stage for d in first.diagnostics] == ["lexer", "parser"]
+    assert list(second.diagnostics) == []
+    capfd.readouterr()
+
+
+@pytest.mark.parametrize("parser_class", [QPParser, QPParserExtended])
+def test_default_parser_lexer_uses_given_sink(parser_class, capfd):
+    diagnostics = Diagnostics()
+    parser = parser_class(diagnostics=diagnostics)
+    assert parser.lex.diagnostics is diagnostics
+    parser.parse_text("filter: a > ?")
+    assert [d.stage for d in diagnostics] == ["lexer", "parser"]
+    assert capfd.readouterr().out == ""
+
+
+@pytest.mark.parametrize("version", [1, 2])
+def test_translator_collects_diagnostics_per_call(version, capfd):
+    translator = Translator(version, printer=None)
+    assert translator.translate("filter: \"abc\";") is None
+    assert [(d.stage, d.code, d.line) for d in translator.diagnostics] == [("semantic", 1, 1)]
+    assert translator.translate("filter: a > 1;") is not None
+    assert translator.diagnostics == []
+    assert capfd.readouterr().out == ""
+
+
+def test_default_printer_keeps_console_output(capfd):
+    qptsql = QueryPlanToSQL()
+    assert qptsql.translate("filter: a > ;") is None
+    assert capfd.readouterr().out == "Parser error: Before ; @ 1:12\n"
+    assert [str(d) for d in qptsql.diagnostics()] == ["Parser error: Before ; @ 1:12"]
+
+
+def test_quiet_query_plan_to_sql(capfd):
+    qptsql = QueryPlanToSQL(print_errors=False)
+    assert qptsql.translate("filter: a ! 1;") is None
+    assert capfd.readouterr().out == ""
+    assert [str(d) for d in qptsql.diagnostics()] == ["Lexical error: Illegal character '!' @ 1:10"]
+
+
+def test_diagnostic_to_dict():
+    diagnostic = Diagnostic("semantic", 2, "Order expression must contain identifiers", Coord(3))
+    assert diagnostic.to_dict() == {"stage": "semantic", "code": 2, "message": diagnostic.message, "line": 3,
+                                    "column": None}
+    assert str(diagnostic) == "Semantic error: Order expression must contain identifiers @ 3"
@@ -0,0 +1,97 @@
+import pickle
+import pytest
+from src.segy.headers import EXTENDED_TRACE_HEADER_SIZE, STANDARD_FIELDS, TRACE_HEADER_SIZE, HeaderRegistry
+
+
+def test_standard_fields_do_not_overlap():
+    used = bytearray(EXTENDED_TRACE_HEADER_SIZE)
+    for field in STANDARD_FIELDS:
+        for offset in range(field.offset, field.offset + field.width):
+            assert not used[offset], field.name
+            used[offset] = 1
+    # only the bytes left unassigned by rev1 are free in the trace header
+    assert used.index(0) == 232 and not any(used[232:TRACE_HEADER_SIZE])
+    # and only rev2 fields are stored in the extension
+    assert all(field.revision == 2 for field in STANDARD_FIELDS if field.offset >= TRACE_HEADER_SIZE)
+
+
+@pytest.mark.parametrize("name, offset, dtype", [
+    ("tracl", 0, ">i4"),
+    ("FLDR", 8, ">i4"),
+    ("cdp", 20, ">i4"),
+    ("scalco", 70, ">i2"),
+    ("ns", 114, ">u2"),
+    ("dt", 116, ">u2"),
+    ("coord_x", 180, ">i4"),
+    ("CDP_Y", 184, ">i4"),
+    ("iline", 188, ">i4"),
+    ("xline", 192, ">i4"),
+    ("extended_ffid", 256, ">i8"),
+    ("EXTENDED_CDP", 264, ">i8"),
+    ("extended_ns", 376, ">u4"),
+])
+def test_lookup_by_name_or_alias(name, offset, dtype):
+    field = HeaderRegistry(revision=2)[name]
+    assert field.offset == offset and field.byte == offset + 1
+    assert field.dtype == dtype
+
+
+def test_scalars():
+    registry = HeaderRegistry()
+    assert registry["sx"].scalar == "coordinate_scalar"
+    assert registry["gelev"].scalar == "elevation_scalar"
+    assert registry["sp"].scalar == "shot_point_scalar"
+    assert registry["cdp"].scalar is None
+    assert all(field.scalar is None or field.scalar in registry for field in registry)
+
+
+def test_revision():
+    assert "cdp_x" not in HeaderRegistry(revision=0)
+    assert "cdp_x" in HeaderRegistry(revision=1)
+    assert len(HeaderRegistry(revision=2)) == len(STANDARD_FIELDS)
+    rev1 = {field.name for field in HeaderRegistry(revision=1)}
+    rev2 = {field.name for field in HeaderRegistry(revision=2)}
+    assert rev1 < rev2 and {"extended_trace_sequence_line", "extended_field_record", "extended_cdp"} <= rev2 - rev1
+    assert "extended_cdp" not in HeaderRegistry()
+    assert HeaderRegistry(revision=2).signature != HeaderRegistry(revision=1).signature
+    assert HeaderRegistry(revision=2)["extended_cdp"].limits == (-(1 << 63), (1 << 63) - 1)
+
+
+def test_unknown_field():
+    registry = HeaderRegistry()
+    assert registry.get("cdp_xx") is None
+    assert "cdp_xx" not in registry
+    with pytest.raises(KeyError):
+        registry["cdp_xx"]
+
+
+def test_register_custom_field():
+    registry = HeaderRegistry()
+    signature = registry.signature
+    field = registry.register("sail_line", 233, 4, aliases=("SL",))
+    assert registry["sl"] is field and field.offset == 232 and field.dtype == ">i4" and field.revision is None
+    assert registry.signature != signature
+    assert pickle.loads(pickle.dumps(registry))["sail_line"] == field
+
+
+def test_register_extension_field():
+    registry = HeaderRegistry(revision=2)
+    field = registry.register("sail_line", 417, 8)
+    assert field.offset == 416 and field.dtype == ">i8"
+
+
+@pytest.mark.parametrize("name, byte, width, kwargs", [
+    ("cdp", 233, 4, {}),
+    ("Tracl", 233, 4, {}),
+    ("custom", 233, 3, {}),
+    ("custom", 239, 4, {}),
+    ("custom", 477, 8, {}),
+    ("custom", 481, 2, {}),
+    ("custom", 0, 2, {}),
+    ("2d_line", 233, 4, {}),
+    ("custom", 233, 4, {"aliases": ("sx",)}),
+    ("custom", 233, 4, {"scalar": "missing"}),
+])
+def test_register_invalid_field(name, byte, width, kwargs):
+    with pytest.raises(ValueError):
+        HeaderRegistry().register(name, byte, width, **kwargs)
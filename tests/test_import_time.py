@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Generous upper bound for importing the translator, measured with -X importtime
+IMPORT_BUDGET_US = 200_000
+
+# Modules a version 2 only translation must not pay for
+LAZY_MODULES = ("src.simple", "multiprocessing", "concurrent.futures.process", "numpy")
+
+
+def import_times(code: str) -> dict[str, tuple[int, int]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], check=True, capture_output=True,
+                            text=True, cwd=Path(__file__).parent.parent)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_version_2_does_not_import_other_stacks():
+    times = import_times(
+        "from src.query_plan_to_sql import QueryPlanToSQL\n"
+        "assert QueryPlanToSQL().translate('filter: a > 1;', version=2)"
+    )
+    assert "src.extended.parser" in times
+    for name in times:
+        assert not name.startswith(LAZY_MODULES), name
+
+
+def test_version_1_does_not_import_extended_stack():
+    times = import_times(
+        "from src.query_plan_to_sql import QueryPlanToSQL\n"
+        "assert QueryPlanToSQL().translate('filter: a > 1;', version=1)"
+    )
+    assert "src.simple.parser" in times
+    assert not any(name.startswith("src.extended") for name in times)
+
+
+def test_import_time_budget():
+    times = import_times("import src.query_plan_to_sql")
+    _, cumulative_us = times["src.query_plan_to_sql"]
+    assert cumulative_us < IMPORT_BUDGET_US
+    assert not any(name.startswith(("src.simple", "src.extended")) for name in times)
@@ -0,0 +1,60 @@
+import sys
+from src.extended.qp_ast import ID, BinaryOp, Constant, Filter, Program, UnaryOp
+from src.extended.semantic import SemanticVisitorExtended
+from src.translator import Translator
+from src.utils.diagnostics import Diagnostics
+from src.utils.node_visitor import IterativeNodeVisitor
+from src.utils.qp_types import BooleanType
+
+
+class RecordingVisitor(IterativeNodeVisitor):
+    def __init__(self):
+        self.events = []
+
+    def generic_enter(self, node):
+        self.events.append(("enter", type(node).__name__))
+        return super().generic_enter(node)
+
+    def enter_UnaryOp(self, node):
+        self.events.append(("enter", "UnaryOp"))
+        return ()
+
+    def leave_BinaryOp(self, node):
+        self.events.append(("leave", "BinaryOp"))
+
+    def leave_ID(self, node):
+        self.events.append(("leave", node.name))
+
+
+def test_hooks_order():
+    ast = BinaryOp("and", ID("a"), BinaryOp("or", UnaryOp("not", ID("b")), ID("c")))
+    visitor = RecordingVisitor()
+    visitor.visit(ast)
+    assert visitor.events == [
+        ("enter", "BinaryOp"),
+        ("enter", "ID"), ("leave", "a"),
+        ("enter", "BinaryOp"),
+        ("enter", "UnaryOp"),
+        ("enter", "ID"), ("leave", "c"),
+        ("leave", "BinaryOp"),
+        ("leave", "BinaryOp"),
+    ]
+
+
+def test_semantic_deep_or_chain():
+    expression = BinaryOp("=", ID("shot"), Constant("number", "0"))
+    for i in range(1, 50000):
+        expression = BinaryOp("or", expression, BinaryOp("=", ID("shot"), Constant("number", str(i))))
+    semantic_visitor = SemanticVisitorExtended(Diagnostics())
+    semantic_visitor.visit(Program([Filter(expression)]))
+    assert not semantic_visitor.has_error()
+    assert expression.type == BooleanType
+
+
+def test_translate_chain_deeper_than_recursion_limit():
+    terms = sys.getrecursionlimit() * 2
+    plan = "filter: " + " or ".join("shot = %d" % i for i in range(terms)) + ";"
+    expected = "(shot = 0)"
+    for i in range(1, terms):
+        expected = "(%s OR (shot = %d))" % (expected, i)
+    assert Translator(printer=None).translate(plan) == "SELECT * FROM table1 WHERE %s  ;" % expected
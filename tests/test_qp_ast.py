@@ -0,0 +1,46 @@
+import pytest
+from src.extended import qp_ast as extended_ast
+from src.extended.parser import QPParserExtended
+from src.extended.semantic import SemanticVisitorExtended
+from src.simple import qp_ast as simple_ast
+from src.utils.diagnostics import Diagnostics
+from src.utils.node import Node
+
+
+@pytest.mark.parametrize("module", [simple_ast, extended_ast], ids=["simple", "extended"])
+def test_nodes_have_no_dict(module):
+    node_classes = [cls for cls in vars(module).values() if isinstance(cls, type) and issubclass(cls, Node)]
+    assert node_classes
+    for cls in node_classes:
+        assert "__dict__" not in dir(cls), cls.__name__
+
+
+def test_analysis_fields_are_declared():
+    node = extended_ast.BinaryOp("=", extended_ast.ID("a"), extended_ast.Constant("number", 1))
+    node.type = "bool"
+    node.text = "(a = 1)"
+    with pytest.raises(AttributeError):
+        node.undeclared = True
+
+
+def test_repr_lists_fields_in_declaration_order():
+    ast = QPParserExtended().parse_text("filter: a in range(1, 2 incl) or b != 3;")
+    SemanticVisitorExtended(Diagnostics()).visit(ast)
+    assert repr(ast.steps[0].expression) == (
+        "BinaryOp(op=or,\n"
+        "         lvalue=Range(data=ID(name=a),\n"
+        "                      lower=Constant(type=type(number),\n"
+        "                                     value=1),\n"
+        "                      upper=Constant(type=type(number),\n"
+        "                                     value=2),\n"
+        "                      include_lower=False,\n"
+        "                      include_upper=True,\n"
+        "                      type=type(bool)),\n"
+        "         rvalue=BinaryOp(op=!=,\n"
+        "                         lvalue=ID(name=b,\n"
+        "                                   type=type(number)),\n"
+        "                         rvalue=Constant(type=type(number),\n"
+        "                                         value=3),\n"
+        "                         type=type(bool)),\n"
+        "         type=type(bool))"
+    )
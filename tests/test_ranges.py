@@ -0,0 +1,58 @@
+import random
+import pytest
+from src.extended.ranges import Interval, IntervalSet
+
+
+def contains(intervals: IntervalSet, x) -> bool:
+    for lower, upper, include_lower, include_upper in intervals:
+        above = lower is None or lower < x or (include_lower and lower == x)
+        below = upper is None or x < upper or (include_upper and upper == x)
+        if above and below:
+            return True
+    return False
+
+
+@pytest.mark.parametrize("intervals, expected", [
+    ([(1, 5, False, False), (5, 10, True, False)], [(1, 10, False, False)]),
+    ([(1, 5, False, False), (5, 10, False, False)], [(1, 5, False, False), (5, 10, False, False)]),
+    ([(1, 5, False, True), (5, 10, False, False)], [(1, 10, False, False)]),
+    ([(3, 4, True, True), (1, 10, False, False)], [(1, 10, False, False)]),
+    ([(None, 1, False, False), (0, None, False, False)], [(None, None, False, False)]),
+    ([(5, 1, True, True), (2, 2, True, False)], []),
+    ([(2, 2, True, True)], [(2, 2, True, True)]),
+])
+def test_normalize(intervals, expected):
+    assert list(IntervalSet(intervals)) == [Interval(*interval) for interval in expected]
+
+
+def test_comparisons():
+    assert IntervalSet.comparison("!=", 3).union(IntervalSet.comparison("=", 3)).is_full()
+    assert IntervalSet.comparison(">", 3).intersection(IntervalSet.comparison("<=", 3)).is_empty()
+    assert list(IntervalSet.comparison(">=", 3).intersection(IntervalSet.comparison("<=", 3))) == \
+        [Interval(3, 3, True, True)]
+    assert list(IntervalSet.range(1, 8, False, True).intersection(IntervalSet.comparison("!=", 4))) == \
+        [Interval(1, 4, False, False), Interval(4, 8, False, True)]
+
+
+def test_set_operations_match_membership():
+    rng = random.Random(17)
+    bounds = [None, -2, 0, 0.5, 1, 3]
+    points = [-3, -2, -1, 0, 0.25, 0.5, 0.75, 1, 2, 3, 4]
+
+    def random_set():
+        intervals = []
+        for _ in range(rng.randint(0, 3)):
+            lower, upper = rng.choice(bounds), rng.choice(bounds)
+            intervals.append((lower, upper, lower is not None and rng.random() < 0.5,
+                              upper is not None and rng.random() < 0.5))
+        return IntervalSet(intervals)
+
+    for _ in range(500):
+        first, second = random_set(), random_set()
+        union, intersection = first.union(second), first.intersection(second)
+        for x in points:
+            assert contains(union, x) == (contains(first, x) or contains(second, x))
+            assert contains(intersection, x) == (contains(first, x) and contains(second, x))
+        for previous, interval in zip(union.intervals, union.intervals[1:]):
+            assert previous.upper is not None and interval.lower is not None
+            assert previous.upper < interval.lower or not (previous.include_upper or interval.include_lower)
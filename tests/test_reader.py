@@ -0,0 +1,134 @@
+import struct
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.segy.headers import HeaderRegistry
+from src.segy.reader import SegyReader, read_columns, write_segy
+
+FIELDS = ("fldr", "tracf", "cdp", "offset", "scalco", "ns", "cdp_x", "iline", "xline")
+
+
+def random_columns(trace_count: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    registry = HeaderRegistry()
+    columns = {}
+    for name in FIELDS:
+        info = np.iinfo(registry[name].dtype)
+        columns[name] = rng.integers(info.min, info.max, trace_count, endpoint=True)
+    return columns
+
+
+def reference_columns(path, fields, data_offset, stride) -> dict:
+    """Header values read one trace at a time, as a per-trace loader does."""
+    registry = HeaderRegistry()
+    data = open(path, "rb").read()
+    columns = {name: [] for name in fields}
+    for start in range(data_offset, len(data), stride):
+        for name in fields:
+            field = registry[name]
+            fmt = ">" + {(2, True): "h", (2, False): "H", (4, True): "i"}[(field.width, field.signed)]
+            columns[name].append(struct.unpack_from(fmt, data, start + field.offset)[0])
+    return columns
+
+
+@pytest.mark.parametrize("sample_count, sample_format", [(0, 5), (7, 5), (13, 3), (5, 8)])
+def test_columns_match_per_trace_reads(tmp_path, sample_count, sample_format):
+    path = tmp_path / "file.sgy"
+    columns = random_columns(101)
+    write_segy(path, columns, sample_count, sample_format)
+    with SegyReader(path) as reader:
+        assert len(reader) == 101
+        assert reader.sample_count == sample_count
+        read = reader.columns(FIELDS)
+        expected = reference_columns(path, FIELDS, reader.data_offset, reader.trace_stride)
+    for name in FIELDS:
+        assert read[name].dtype.isnative
+        assert read[name].tolist() == expected[name] == columns[name].tolist()
+    assert read["ns"].dtype == np.uint16 and read["cdp"].dtype == np.int32
+
+
+def test_views_do_not_copy(tmp_path):
+    path = tmp_path / "file.sgy"
+    write_segy(path, random_columns(10), 4)
+    with SegyReader(path) as reader:
+        view = reader.view("cdp")
+        assert view.strides == (240 + 4 * 4,) and not view.flags.owndata and not view.flags.writeable
+        assert view.tolist() == reader.column("cdp").tolist()
+
+
+def test_little_endian_rev2(tmp_path):
+    path = tmp_path / "file.sgy"
+    columns = random_columns(20)
+    write_segy(path, columns, 3, revision=2, byteorder="<")
+    with SegyReader(path) as reader:
+        assert reader.byteorder == "<" and reader.revision == 2
+        assert reader.column("offset").tolist() == columns["offset"].tolist()
+
+
+def test_extended_textual_headers(tmp_path):
+    path = tmp_path / "file.sgy"
+    columns = random_columns(5)
+    write_segy(path, columns, 2)
+    data = bytearray(path.read_bytes())
+    struct.pack_into(">h", data, 3504, 2)
+    data[3600:3600] = b" " * 6400
+    path.write_bytes(bytes(data))
+    assert read_columns(path, ["cdp"])["cdp"].tolist() == columns["cdp"].tolist()
+
+
+def test_custom_field(tmp_path):
+    path = tmp_path / "file.sgy"
+    registry = HeaderRegistry()
+    registry.register("sail_line", 233, 4, signed=False)
+    write_segy(path, {"sail_line": [1, 2, 2 ** 32 - 1]}, registry=registry)
+    assert read_columns(path, ["sail_line"], registry)["sail_line"].tolist() == [1, 2, 2 ** 32 - 1]
+
+
+def test_extension_fields(tmp_path):
+    path = tmp_path / "file.sgy"
+    columns = {"cdp": [1, 2, 3], "extended_cdp": [1, -2 ** 40, 2 ** 63 - 1], "extended_ns": [0, 7, 2 ** 32 - 1]}
+    write_segy(path, columns, 2, revision=2)
+    with SegyReader(path) as reader:
+        assert reader.trace_header_size == 480 and reader.trace_stride == 480 + 2 * 4
+        read = reader.columns(columns)
+    assert {name: values.tolist() for name, values in read.items()} == columns
+    assert read["extended_cdp"].dtype == np.int64 and read["extended_ns"].dtype == np.uint32
+
+
+def test_extension_fields_need_additional_headers(tmp_path):
+    path = tmp_path / "file.sgy"
+    write_segy(path, {"cdp": [1, 2]}, 2, revision=2)
+    with SegyReader(path) as reader:
+        with pytest.raises(ValueError):
+            reader.column("extended_cdp")
+    with pytest.raises(ValueError):
+        write_segy(path, {"extended_cdp": [1, 2]}, revision=1)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "file.sgy"
+    write_segy(path, {"cdp": []}, 10)
+    assert read_columns(path, ["cdp"])["cdp"].tolist() == []
+
+
+@pytest.mark.parametrize("edit", [
+    lambda data: data[:100],
+    lambda data: data + b"\0",
+    lambda data: data[:3224] + struct.pack(">h", 99) + data[3226:],
+    lambda data: data[:3502] + struct.pack(">h", 0) + data[3504:],
+    lambda data: data[:3504] + struct.pack(">h", -1) + data[3506:],
+])
+def test_invalid_files(tmp_path, edit):
+    path = tmp_path / "file.sgy"
+    write_segy(path, random_columns(3), 2)
+    path.write_bytes(edit(path.read_bytes()))
+    with pytest.raises(ValueError):
+        SegyReader(path)
+
+
+def test_unknown_field(tmp_path):
+    path = tmp_path / "file.sgy"
+    write_segy(path, random_columns(3))
+    with pytest.raises(KeyError):
+        read_columns(path, ["cdp_xx"])
@@ -0,0 +1,74 @@
+import sys
+from types import SimpleNamespace
+import pytest
+from src.extended.parser import QPParserExtended
+from src.simple.parser import QPParser
+from src.utils.tables import PrecomputedTablesLexer, PrecomputedTablesParser
+
+
+@pytest.fixture
+def tables_package(tmp_path, monkeypatch):
+    package = tmp_path / "qp_tables_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in list(sys.modules):
+        if name.startswith("qp_tables_pkg"):
+            del sys.modules[name]
+
+
+def make_lexer(number_pattern):
+    class ToyLexer(PrecomputedTablesLexer):
+        _tables_module = "qp_tables_pkg.lextab"
+        tokens = {"NUMBER", "PLUS"}
+        ignore = " "
+        NUMBER = number_pattern
+        PLUS = r'\+'
+
+    return ToyLexer
+
+
+def make_parser(lexer):
+    class ToyParser(PrecomputedTablesParser):
+        _tables_module = "qp_tables_pkg.parsetab"
+        tokens = lexer.tokens
+
+        @_('expr PLUS NUMBER')
+        def expr(self, p):
+            return p.expr + int(p.NUMBER)
+
+        @_('NUMBER')
+        def expr(self, p):
+            return int(p.NUMBER)
+
+    return ToyParser
+
+
+def test_shipped_tables_are_current():
+    for parser in (QPParser, QPParserExtended):
+        assert isinstance(parser._lrtable, SimpleNamespace)
+
+
+def test_tables_are_generated_then_loaded(tables_package):
+    import qp_tables_pkg
+    lexer = make_lexer(r'\d+')
+    parser = make_parser(lexer)
+    assert (tables_package / "lextab.py").exists()
+    assert (tables_package / "parsetab.py").exists()
+    assert not isinstance(parser._lrtable, SimpleNamespace)
+
+    lexer = make_lexer(r'\d+')
+    parser = make_parser(lexer)
+    assert isinstance(parser._lrtable, SimpleNamespace)
+    assert parser().parse(lexer().tokenize("1 + 2 + 39")) == 42
+
+
+def test_stale_tables_are_regenerated(tables_package):
+    import qp_tables_pkg
+    make_lexer(r'\d+')
+    signature = (tables_package / "lextab.py").read_text()
+
+    lexer = make_lexer(r'[0-9]+')
+    assert (tables_package / "lextab.py").read_text() != signature
+    assert [t.value for t in lexer().tokenize("12+3")] == ["12", "+", "3"]